@@ -0,0 +1,57 @@
+"""
+`specify hooks check` without the full CLI.
+
+Agents run ``specify hooks check EVENT`` after every core command, so this
+path must not pay for Typer, rich or the HTTP stack. It only imports the
+extensions module (and through it yaml_io and hook_conditions) and writes
+with print(). The package's main() tries it before loading the CLI module.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def hooks_check(event: str, as_json: bool) -> int:
+    """Print the hooks to run for an event and return the exit code."""
+    from .extensions import HookExecutor
+
+    project_root = Path.cwd()
+    if not (project_root / ".specify").is_dir():
+        print("Error: Not a spec-kit project (no .specify/ directory)", file=sys.stderr)
+        return 1
+
+    hook_executor = HookExecutor(project_root)
+    result = hook_executor.check_hooks_for_event(event)
+    if as_json:
+        print(json.dumps({
+            "event": event,
+            "has_hooks": result["has_hooks"],
+            "hooks": [hook_executor.execute_hook(hook) for hook in result["hooks"]],
+            "message": result["message"],
+        }))
+    elif result["message"]:
+        print(result["message"])
+    return 0
+
+
+def run(args: List[str]) -> Optional[int]:
+    """Run `hooks check EVENT [--json]` directly; None if args need the full CLI."""
+    if args[:2] != ["hooks", "check"]:
+        return None
+    as_json = "--json" in args[2:]
+    events = [arg for arg in args[2:] if arg != "--json"]
+    if len(events) != 1 or events[0].startswith("-"):
+        return None
+    return hooks_check(events[0], as_json)
+
+
+def main():
+    """Console-script entry: answer `hooks check` here, hand anything else to the CLI."""
+    code = run(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+    from .cli import main as cli_main
+
+    cli_main()
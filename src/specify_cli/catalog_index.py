@@ -0,0 +1,216 @@
+"""
+Search index over the extension catalog.
+
+The index maps lower-cased word tokens of each extension's id, name, tags,
+author and description to postings, and keeps exact-match postings for tags
+and authors plus the set of verified extensions, so ``extension search``
+answers from a few dictionary lookups instead of scanning every entry.
+
+Query tokens match index terms they are a prefix of (``jir`` finds ``jira``,
+but ``ira`` does not); an extension must match every query token. Matches are ranked with BM25 over
+field-weighted term frequencies, exact terms scoring above prefix matches.
+
+The index is plain JSON and is stored next to the cached catalog, stamped
+with the catalog file's stat so it is rebuilt only when the catalog changes.
+Each term's postings are kept as one string of "doc tf" integer pairs and
+decoded only when a query touches the term, so loading the index costs
+about as much as parsing its term list.
+"""
+
+import bisect
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-cased alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class CatalogIndex:
+    """Inverted index over catalog extensions with BM25 ranking."""
+
+    FORMAT_VERSION = 1
+    # Term frequency multiplier per field
+    FIELD_WEIGHTS = {"id": 3, "name": 3, "tags": 2, "author": 1, "description": 1}
+    # Score multiplier for query tokens that only match as a prefix
+    PREFIX_WEIGHT = 0.5
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, data: Dict[str, Any]):
+        """Wrap index data as produced by build() or read by load()."""
+        self.data = data
+        self.ids: List[str] = data["ids"]
+        self.terms: Dict[str, str] = data["terms"]
+        self._sorted_terms: Optional[List[str]] = None
+        self._decoded: Dict[str, List[tuple]] = {}
+
+    @classmethod
+    def build(
+        cls, extensions: Dict[str, Dict[str, Any]], source: Optional[list] = None
+    ) -> "CatalogIndex":
+        """Index catalog extensions, keeping their catalog order.
+
+        Args:
+            extensions: The catalog's "extensions" mapping
+            source: Stat stamp of the catalog file, stored for load()
+        """
+        ids = list(extensions)
+        terms: Dict[str, Dict[int, int]] = {}
+        lengths = []
+        tags: Dict[str, List[int]] = {}
+        authors: Dict[str, List[int]] = {}
+        verified = []
+
+        for doc, ext_id in enumerate(ids):
+            ext = extensions[ext_id] or {}
+            ext_tags = [str(t) for t in ext.get("tags") or []]
+            fields = {
+                "id": ext_id,
+                "name": str(ext.get("name") or ""),
+                "tags": " ".join(ext_tags),
+                "author": str(ext.get("author") or ""),
+                "description": str(ext.get("description") or ""),
+            }
+            length = 0
+            for field, text in fields.items():
+                weight = cls.FIELD_WEIGHTS[field]
+                for token in tokenize(text):
+                    postings = terms.setdefault(token, {})
+                    postings[doc] = postings.get(doc, 0) + weight
+                    length += weight
+            lengths.append(length)
+
+            for tag in {t.lower() for t in ext_tags}:
+                tags.setdefault(tag, []).append(doc)
+            if fields["author"]:
+                authors.setdefault(fields["author"].lower(), []).append(doc)
+            if ext.get("verified", False):
+                verified.append(doc)
+
+        return cls({
+            "format": cls.FORMAT_VERSION,
+            "source": source,
+            "ids": ids,
+            "terms": {
+                term: " ".join(f"{doc} {tf}" for doc, tf in postings.items())
+                for term, postings in terms.items()
+            },
+            "lengths": lengths,
+            "avg_length": (sum(lengths) / len(lengths)) if lengths else 0.0,
+            "tags": tags,
+            "authors": authors,
+            "verified": verified,
+        })
+
+    @classmethod
+    def load(cls, path: Path, source: Optional[list]) -> Optional["CatalogIndex"]:
+        """Read a saved index; None if it is missing, unreadable or not built from source."""
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != cls.FORMAT_VERSION
+            or source is None
+            or data.get("source") != source
+        ):
+            return None
+        return cls(data)
+
+    def to_json(self) -> str:
+        """Serialize the index for saving next to the catalog."""
+        return json.dumps(self.data, separators=(",", ":"))
+
+    def _expand(self, token: str) -> List[str]:
+        """Return the index terms starting with token."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.terms)
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, token)
+        end = start
+        while end < len(terms) and terms[end].startswith(token):
+            end += 1
+        return terms[start:end]
+
+    def _postings(self, term: str) -> List[tuple]:
+        """Return (doc, tf) pairs of a term."""
+        postings = self._decoded.get(term)
+        if postings is None:
+            numbers = [int(n) for n in self.terms[term].split()]
+            postings = self._decoded[term] = list(zip(numbers[::2], numbers[1::2]))
+        return postings
+
+    def _scores(self, tokens: List[str]) -> Dict[int, float]:
+        """BM25 scores of the documents matching every token."""
+        n_docs = len(self.ids)
+        lengths = self.data["lengths"]
+        avg_length = self.data["avg_length"] or 1.0
+        scores: Optional[Dict[int, float]] = None
+
+        for token in tokens:
+            best: Dict[int, float] = {}
+            for term in self._expand(token):
+                postings = self._postings(term)
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                weight = 1.0 if term == token else self.PREFIX_WEIGHT
+                for doc, tf in postings:
+                    norm = self.K1 * (1 - self.B + self.B * lengths[doc] / avg_length)
+                    score = weight * idf * tf * (self.K1 + 1) / (tf + norm)
+                    if score > best.get(doc, 0.0):
+                        best[doc] = score
+            if scores is None:
+                scores = best
+            else:
+                scores = {doc: s + best[doc] for doc, s in scores.items() if doc in best}
+            if not scores:
+                return {}
+        # A query without any word characters matches nothing here;
+        # ExtensionCatalog.search falls back to a substring scan for it
+        return scores or {}
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        author: Optional[str] = None,
+        verified_only: bool = False,
+    ) -> List[str]:
+        """Return matching extension IDs, best match first.
+
+        Without a query, matches are returned in catalog order.
+
+        Args:
+            query: Free text matched against id, name, tags, author and description
+            tag: Exact tag filter (case-insensitive)
+            author: Exact author filter (case-insensitive)
+            verified_only: Only verified extensions
+        """
+        allowed: Optional[set] = None
+        if tag:
+            allowed = set(self.data["tags"].get(tag.lower(), ()))
+        if author:
+            docs = set(self.data["authors"].get(author.lower(), ()))
+            allowed = docs if allowed is None else allowed & docs
+        if verified_only:
+            docs = set(self.data["verified"])
+            allowed = docs if allowed is None else allowed & docs
+
+        if not query:
+            docs = range(len(self.ids)) if allowed is None else sorted(allowed)
+            return [self.ids[doc] for doc in docs]
+
+        scores = self._scores(tokenize(query))
+        ranked = sorted(
+            (doc for doc in scores if allowed is None or doc in allowed),
+            key=lambda doc: (-scores[doc], doc),
+        )
+        return [self.ids[doc] for doc in ranked]
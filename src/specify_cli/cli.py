@@ -0,0 +1,4454 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "typer",
+#     "rich",
+#     "platformdirs",
+#     "readchar",
+#     "httpx",
+# ]
+# ///
+"""
+Specify CLI - Setup tool for Specify projects
+
+Usage:
+    uvx specify-cli.py init <project-name>
+    uvx specify-cli.py init .
+    uvx specify-cli.py init --here
+
+Or install globally:
+    uv tool install --from specify-cli.py specify-cli
+    specify init <project-name>
+    specify init .
+    specify init --here
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import zipfile
+import tempfile
+import shutil
+import shlex
+import json
+import hashlib
+import io
+import queue
+import struct
+import threading
+import time
+import zlib
+from contextlib import ExitStack
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.text import Text
+from rich.align import Align
+from typer.core import TyperGroup
+from platformdirs import user_cache_dir, user_data_dir
+from datetime import datetime, timezone
+
+from . import _hooks_fast, network
+
+# The HTTP stack (httpx, truststore), readchar and the heavier rich renderables
+# are imported where they are used, so offline commands and --help never load
+# them or build an SSL context.
+if TYPE_CHECKING:
+    import httpx
+
+
+def __getattr__(name: str):
+    # Module-level ssl_context/client kept for callers that import them
+    if name == "ssl_context":
+        return network.ssl_context()
+    if name == "client":
+        return network.get_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _github_api_url() -> str:
+    """Return the GitHub API base URL; SPECIFY_GITHUB_API_URL overrides it (mirrors, GHES, tests)."""
+    return (
+        os.getenv("SPECIFY_GITHUB_API_URL", "").strip() or "https://api.github.com"
+    ).rstrip("/")
+
+
+def _github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return (
+        (cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()
+    ) or None
+
+
+def _github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = _github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def _parse_rate_limit_headers(headers: httpx.Headers) -> dict:
+    """Extract and parse GitHub rate-limit headers."""
+    info = {}
+
+    # Standard GitHub rate-limit headers
+    if "X-RateLimit-Limit" in headers:
+        info["limit"] = headers.get("X-RateLimit-Limit")
+    if "X-RateLimit-Remaining" in headers:
+        info["remaining"] = headers.get("X-RateLimit-Remaining")
+    if "X-RateLimit-Reset" in headers:
+        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
+        if reset_epoch:
+            reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
+            info["reset_epoch"] = reset_epoch
+            info["reset_time"] = reset_time
+            info["reset_local"] = reset_time.astimezone()
+
+    # Retry-After header (seconds or HTTP-date)
+    if "Retry-After" in headers:
+        retry_after = headers.get("Retry-After")
+        try:
+            info["retry_after_seconds"] = int(retry_after)
+        except ValueError:
+            # HTTP-date format - not implemented, just store as string
+            info["retry_after"] = retry_after
+
+    return info
+
+
+def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str) -> str:
+    """Format a user-friendly error message with rate-limit information."""
+    rate_info = _parse_rate_limit_headers(headers)
+
+    lines = [f"GitHub API returned status {status_code} for {url}"]
+    lines.append("")
+
+    if rate_info:
+        lines.append("[bold]Rate Limit Information:[/bold]")
+        if "limit" in rate_info:
+            lines.append(f"  • Rate Limit: {rate_info['limit']} requests/hour")
+        if "remaining" in rate_info:
+            lines.append(f"  • Remaining: {rate_info['remaining']}")
+        if "reset_local" in rate_info:
+            reset_str = rate_info["reset_local"].strftime("%Y-%m-%d %H:%M:%S %Z")
+            lines.append(f"  • Resets at: {reset_str}")
+        if "retry_after_seconds" in rate_info:
+            lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
+        lines.append("")
+
+    # Add troubleshooting guidance
+    lines.append("[bold]Troubleshooting Tips:[/bold]")
+    lines.append(
+        "  • If you're on a shared CI or corporate environment, you may be rate-limited."
+    )
+    lines.append(
+        "  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN"
+    )
+    lines.append("    environment variable to increase rate limits.")
+    lines.append(
+        "  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated."
+    )
+
+    return "\n".join(lines)
+
+
+# Agent configuration with name, folder, install URL, and CLI tool requirement
+AGENT_CONFIG = {
+    "copilot": {
+        "name": "GitHub Copilot",
+        "folder": ".github/",
+        "install_url": None,  # IDE-based, no CLI check needed
+        "requires_cli": False,
+    },
+    "claude": {
+        "name": "Claude Code",
+        "folder": ".claude/",
+        "install_url": "https://docs.anthropic.com/en/docs/claude-code/setup",
+        "requires_cli": True,
+    },
+    "gemini": {
+        "name": "Gemini CLI",
+        "folder": ".gemini/",
+        "install_url": "https://github.com/google-gemini/gemini-cli",
+        "requires_cli": True,
+    },
+    "cursor-agent": {
+        "name": "Cursor",
+        "folder": ".cursor/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "qwen": {
+        "name": "Qwen Code",
+        "folder": ".qwen/",
+        "install_url": "https://github.com/QwenLM/qwen-code",
+        "requires_cli": True,
+    },
+    "opencode": {
+        "name": "opencode",
+        "folder": ".opencode/",
+        "install_url": "https://opencode.ai",
+        "requires_cli": True,
+    },
+    "codex": {
+        "name": "Codex CLI",
+        "folder": ".codex/",
+        "install_url": "https://github.com/openai/codex",
+        "requires_cli": True,
+    },
+    "windsurf": {
+        "name": "Windsurf",
+        "folder": ".windsurf/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "kilocode": {
+        "name": "Kilo Code",
+        "folder": ".kilocode/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "auggie": {
+        "name": "Auggie CLI",
+        "folder": ".augment/",
+        "install_url": "https://docs.augmentcode.com/cli/setup-auggie/install-auggie-cli",
+        "requires_cli": True,
+    },
+    "codebuddy": {
+        "name": "CodeBuddy",
+        "folder": ".codebuddy/",
+        "install_url": "https://www.codebuddy.ai/cli",
+        "requires_cli": True,
+    },
+    "qoder": {
+        "name": "Qoder CLI",
+        "folder": ".qoder/",
+        "install_url": "https://qoder.com/cli",
+        "requires_cli": True,
+    },
+    "roo": {
+        "name": "Roo Code",
+        "folder": ".roo/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "q": {
+        "name": "Amazon Q Developer CLI",
+        "folder": ".amazonq/",
+        "install_url": "https://aws.amazon.com/developer/learning/q-developer-cli/",
+        "requires_cli": True,
+    },
+    "amp": {
+        "name": "Amp",
+        "folder": ".agents/",
+        "install_url": "https://ampcode.com/manual#install",
+        "requires_cli": True,
+    },
+    "shai": {
+        "name": "SHAI",
+        "folder": ".shai/",
+        "install_url": "https://github.com/ovh/shai",
+        "requires_cli": True,
+    },
+    "agy": {
+        "name": "Antigravity",
+        "folder": ".agent/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+    "bob": {
+        "name": "IBM Bob",
+        "folder": ".bob/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+    },
+}
+
+SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
+
+CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
+
+BANNER = """
+███████╗██████╗ ███████╗ ██████╗██╗███████╗██╗   ██╗
+██╔════╝██╔══██╗██╔════╝██╔════╝██║██╔════╝╚██╗ ██╔╝
+███████╗██████╔╝█████╗  ██║     ██║█████╗   ╚████╔╝ 
+╚════██║██╔═══╝ ██╔══╝  ██║     ██║██╔══╝    ╚██╔╝  
+███████║██║     ███████╗╚██████╗██║██║        ██║   
+╚══════╝╚═╝     ╚══════╝ ╚═════╝╚═╝╚═╝        ╚═╝   
+"""
+
+TAGLINE = "GitHub Spec Kit - Spec-Driven Development Toolkit"
+
+
+class StepTracker:
+    """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
+    Supports live auto-refresh via an attached refresh callback.
+    """
+
+    def __init__(self, title: str):
+        self.title = title
+        self.steps = []  # list of dicts: {key, label, status, detail}
+        self.status_order = {
+            "pending": 0,
+            "running": 1,
+            "done": 2,
+            "error": 3,
+            "skipped": 4,
+        }
+        self._refresh_cb = None  # callable to trigger UI refresh
+
+    def attach_refresh(self, cb):
+        self._refresh_cb = cb
+
+    def add(self, key: str, label: str):
+        if key not in [s["key"] for s in self.steps]:
+            self.steps.append(
+                {"key": key, "label": label, "status": "pending", "detail": ""}
+            )
+            self._maybe_refresh()
+
+    def start(self, key: str, detail: str = ""):
+        self._update(key, status="running", detail=detail)
+
+    def complete(self, key: str, detail: str = ""):
+        self._update(key, status="done", detail=detail)
+
+    def error(self, key: str, detail: str = ""):
+        self._update(key, status="error", detail=detail)
+
+    def skip(self, key: str, detail: str = ""):
+        self._update(key, status="skipped", detail=detail)
+
+    def _update(self, key: str, status: str, detail: str):
+        for s in self.steps:
+            if s["key"] == key:
+                s["status"] = status
+                if detail:
+                    s["detail"] = detail
+                self._maybe_refresh()
+                return
+
+        self.steps.append(
+            {"key": key, "label": key, "status": status, "detail": detail}
+        )
+        self._maybe_refresh()
+
+    def _maybe_refresh(self):
+        if self._refresh_cb:
+            try:
+                self._refresh_cb()
+            except Exception:
+                pass
+
+    def render(self):
+        from rich.tree import Tree
+
+        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+        for step in self.steps:
+            label = step["label"]
+            detail_text = step["detail"].strip() if step["detail"] else ""
+
+            status = step["status"]
+            if status == "done":
+                symbol = "[green]●[/green]"
+            elif status == "pending":
+                symbol = "[green dim]○[/green dim]"
+            elif status == "running":
+                symbol = "[cyan]○[/cyan]"
+            elif status == "error":
+                symbol = "[red]●[/red]"
+            elif status == "skipped":
+                symbol = "[yellow]○[/yellow]"
+            else:
+                symbol = " "
+
+            if status == "pending":
+                # Entire line light gray (pending)
+                if detail_text:
+                    line = (
+                        f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
+                    )
+                else:
+                    line = f"{symbol} [bright_black]{label}[/bright_black]"
+            else:
+                # Label white, detail (if any) light gray in parentheses
+                if detail_text:
+                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+                else:
+                    line = f"{symbol} [white]{label}[/white]"
+
+            tree.add(line)
+        return tree
+
+
+def get_key():
+    """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
+    key = readchar.readkey()
+
+    if key == readchar.key.UP or key == readchar.key.CTRL_P:
+        return "up"
+    if key == readchar.key.DOWN or key == readchar.key.CTRL_N:
+        return "down"
+
+    if key == readchar.key.ENTER:
+        return "enter"
+
+    if key == readchar.key.ESC:
+        return "escape"
+
+    if key == readchar.key.CTRL_C:
+        raise KeyboardInterrupt
+
+    return key
+
+
+def select_with_arrows(
+    options: dict, prompt_text: str = "Select an option", default_key: str = None
+) -> str:
+    """
+    Interactive selection using arrow keys with Rich Live display.
+
+    Args:
+        options: Dict with keys as option keys and values as descriptions
+        prompt_text: Text to show above the options
+        default_key: Default option key to start with
+
+    Returns:
+        Selected option key
+    """
+    option_keys = list(options.keys())
+    if default_key and default_key in option_keys:
+        selected_index = option_keys.index(default_key)
+    else:
+        selected_index = 0
+
+    selected_key = None
+
+    def create_selection_panel():
+        """Create the selection panel with current selection highlighted."""
+        table = Table.grid(padding=(0, 2))
+        table.add_column(style="cyan", justify="left", width=3)
+        table.add_column(style="white", justify="left")
+
+        for i, key in enumerate(option_keys):
+            if i == selected_index:
+                table.add_row("▶", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
+            else:
+                table.add_row(" ", f"[cyan]{key}[/cyan] [dim]({options[key]})[/dim]")
+
+        table.add_row("", "")
+        table.add_row(
+            "", "[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]"
+        )
+
+        return Panel(
+            table,
+            title=f"[bold]{prompt_text}[/bold]",
+            border_style="cyan",
+            padding=(1, 2),
+        )
+
+    console.print()
+
+    def run_selection_loop():
+        nonlocal selected_key, selected_index
+        from rich.live import Live
+
+        with Live(
+            create_selection_panel(),
+            console=console,
+            transient=True,
+            auto_refresh=False,
+        ) as live:
+            while True:
+                try:
+                    key = get_key()
+                    if key == "up":
+                        selected_index = (selected_index - 1) % len(option_keys)
+                    elif key == "down":
+                        selected_index = (selected_index + 1) % len(option_keys)
+                    elif key == "enter":
+                        selected_key = option_keys[selected_index]
+                        break
+                    elif key == "escape":
+                        console.print("\n[yellow]Selection cancelled[/yellow]")
+                        raise typer.Exit(1)
+
+                    live.update(create_selection_panel(), refresh=True)
+
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Selection cancelled[/yellow]")
+                    raise typer.Exit(1)
+
+    run_selection_loop()
+
+    if selected_key is None:
+        console.print("\n[red]Selection failed.[/red]")
+        raise typer.Exit(1)
+
+    return selected_key
+
+
+console = Console()
+
+
+class BannerGroup(TyperGroup):
+    """Custom group that shows banner before help."""
+
+    def format_help(self, ctx, formatter):
+        # Show banner before help
+        show_banner()
+        super().format_help(ctx, formatter)
+
+
+app = typer.Typer(
+    name="specify",
+    help="Setup tool for Specify spec-driven development projects",
+    add_completion=False,
+    invoke_without_command=True,
+    cls=BannerGroup,
+)
+
+
+def show_banner():
+    """Display the ASCII art banner."""
+    banner_lines = BANNER.strip().split("\n")
+    colors = ["bright_blue", "blue", "cyan", "bright_cyan", "white", "bright_white"]
+
+    styled_banner = Text()
+    for i, line in enumerate(banner_lines):
+        color = colors[i % len(colors)]
+        styled_banner.append(line + "\n", style=color)
+
+    console.print(Align.center(styled_banner))
+    console.print(Align.center(Text(TAGLINE, style="italic bright_yellow")))
+    console.print()
+
+
+@app.callback()
+def callback(ctx: typer.Context):
+    """Show banner when no subcommand is provided."""
+    if (
+        ctx.invoked_subcommand is None
+        and "--help" not in sys.argv
+        and "-h" not in sys.argv
+    ):
+        show_banner()
+        console.print(
+            Align.center("[dim]Run 'specify --help' for usage information[/dim]")
+        )
+        console.print()
+
+
+def run_command(
+    cmd: list[str],
+    check_return: bool = True,
+    capture: bool = False,
+    shell: bool = False,
+) -> Optional[str]:
+    """Run a shell command and optionally capture output."""
+    try:
+        if capture:
+            result = subprocess.run(
+                cmd, check=check_return, capture_output=True, text=True, shell=shell
+            )
+            return result.stdout.strip()
+        else:
+            subprocess.run(cmd, check=check_return, shell=shell)
+            return None
+    except subprocess.CalledProcessError as e:
+        if check_return:
+            console.print(f"[red]Error running command:[/red] {' '.join(cmd)}")
+            console.print(f"[red]Exit code:[/red] {e.returncode}")
+            if hasattr(e, "stderr") and e.stderr:
+                console.print(f"[red]Error output:[/red] {e.stderr}")
+            raise
+        return None
+
+
+def check_tool(tool: str, tracker: StepTracker = None) -> bool:
+    """Check if a tool is installed. Optionally update tracker.
+
+    Args:
+        tool: Name of the tool to check
+        tracker: Optional StepTracker to update with results
+
+    Returns:
+        True if tool is found, False otherwise
+    """
+    # Special handling for Claude CLI after `claude migrate-installer`
+    # See: https://github.com/github/spec-kit/issues/123
+    # The migrate-installer command REMOVES the original executable from PATH
+    # and creates an alias at ~/.claude/local/claude instead
+    # This path should be prioritized over other claude executables in PATH
+    if tool == "claude":
+        if CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
+            if tracker:
+                tracker.complete(tool, "available")
+            return True
+
+    found = shutil.which(tool) is not None
+
+    if tracker:
+        if found:
+            tracker.complete(tool, "available")
+        else:
+            tracker.error(tool, "not found")
+
+    return found
+
+
+def is_git_repo(path: Path = None) -> bool:
+    """Check if the specified path is inside a git repository."""
+    if path is None:
+        path = Path.cwd()
+
+    if not path.is_dir():
+        return False
+
+    try:
+        # Use git command to check if inside a work tree
+        subprocess.run(
+            ["git", "rev-parse", "--is-inside-work-tree"],
+            check=True,
+            capture_output=True,
+            cwd=path,
+        )
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def init_git_repo(
+    project_path: Path, quiet: bool = False
+) -> Tuple[bool, Optional[str]]:
+    """Initialize a git repository in the specified path.
+
+    Args:
+        project_path: Path to initialize git repository in
+        quiet: if True suppress console output (tracker handles status)
+
+    Returns:
+        Tuple of (success: bool, error_message: Optional[str])
+    """
+    try:
+        original_cwd = Path.cwd()
+        os.chdir(project_path)
+        if not quiet:
+            console.print("[cyan]Initializing git repository...[/cyan]")
+        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
+        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Initial commit from Specify template"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        if not quiet:
+            console.print("[green]✓[/green] Git repository initialized")
+        return True, None
+
+    except subprocess.CalledProcessError as e:
+        error_msg = f"Command: {' '.join(e.cmd)}\nExit code: {e.returncode}"
+        if e.stderr:
+            error_msg += f"\nError: {e.stderr.strip()}"
+        elif e.stdout:
+            error_msg += f"\nOutput: {e.stdout.strip()}"
+
+        if not quiet:
+            console.print(f"[red]Error initializing git repository:[/red] {e}")
+        return False, error_msg
+    finally:
+        os.chdir(original_cwd)
+
+
+def handle_vscode_settings(
+    sub_item, dest_file, rel_path, verbose=False, tracker=None
+) -> None:
+    """Handle merging or copying of .vscode/settings.json files."""
+    with open(sub_item, "rb") as f:
+        content = f.read()
+    write_vscode_settings(content, dest_file, rel_path, verbose, tracker)
+
+
+def write_vscode_settings(
+    content: bytes, dest_file, rel_path, verbose=False, tracker=None
+) -> None:
+    """Merge template .vscode/settings.json content into dest_file, or write it if absent."""
+
+    def log(message, color="green"):
+        if verbose and not tracker:
+            console.print(f"[{color}]{message}[/] {rel_path}")
+
+    try:
+        new_settings = json.loads(content.decode("utf-8"))
+
+        if dest_file.exists():
+            merged = merge_json_files(
+                dest_file, new_settings, verbose=verbose and not tracker
+            )
+            with open(dest_file, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=4)
+                f.write("\n")
+            log("Merged:", "green")
+        else:
+            dest_file.write_bytes(content)
+            log("Copied (no existing settings.json):", "blue")
+
+    except Exception as e:
+        log(f"Warning: Could not merge, copying instead: {e}", "yellow")
+        dest_file.write_bytes(content)
+
+
+def merge_json_files(
+    existing_path: Path, new_content: dict, verbose: bool = False
+) -> dict:
+    """Merge new JSON content into existing JSON file.
+
+    Performs a deep merge where:
+    - New keys are added
+    - Existing keys are preserved unless overwritten by new content
+    - Nested dictionaries are merged recursively
+    - Lists and other values are replaced (not merged)
+
+    Args:
+        existing_path: Path to existing JSON file
+        new_content: New JSON content to merge in
+        verbose: Whether to print merge details
+
+    Returns:
+        Merged JSON content as dict
+    """
+    try:
+        with open(existing_path, "r", encoding="utf-8") as f:
+            existing_content = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # If file doesn't exist or is invalid, just use new content
+        return new_content
+
+    def deep_merge(base: dict, update: dict) -> dict:
+        """Recursively merge update dict into base dict."""
+        result = base.copy()
+        for key, value in update.items():
+            if (
+                key in result
+                and isinstance(result[key], dict)
+                and isinstance(value, dict)
+            ):
+                # Recursively merge nested dictionaries
+                result[key] = deep_merge(result[key], value)
+            else:
+                # Add new key or replace existing value
+                result[key] = value
+        return result
+
+    merged = deep_merge(existing_content, new_content)
+
+    if verbose:
+        console.print(f"[cyan]Merged JSON file:[/cyan] {existing_path.name}")
+
+    return merged
+
+
+def _asset_sha256(asset: dict) -> str | None:
+    """Return the SHA-256 hex digest GitHub publishes for a release asset, if any."""
+    digest = (asset.get("digest") or "").strip()
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:") :].lower() or None
+    return None
+
+
+class TemplateCache:
+    """Content-addressed local cache of release template archives.
+
+    Archives are stored once per SHA-256 under ``blobs/`` and looked up by
+    ``<release tag>/<asset name>`` through a small JSON index. Blob mtimes
+    track last use, and the least recently used blobs are evicted once the
+    cache grows past ``max_bytes``.
+
+    The location defaults to the platform user cache directory and can be
+    overridden with SPECIFY_TEMPLATE_CACHE_DIR; the size limit can be set
+    with SPECIFY_TEMPLATE_CACHE_MAX_BYTES.
+    """
+
+    INDEX_FILE = "index.json"
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None):
+        if root is None:
+            override = os.getenv("SPECIFY_TEMPLATE_CACHE_DIR", "").strip()
+            root = (
+                Path(override).expanduser()
+                if override
+                else Path(user_cache_dir("specify-cli")) / "templates"
+            )
+        if max_bytes is None:
+            try:
+                max_bytes = int(os.getenv("SPECIFY_TEMPLATE_CACHE_MAX_BYTES", ""))
+            except ValueError:
+                max_bytes = self.DEFAULT_MAX_BYTES
+        self.root = root
+        self.blobs_dir = root / "blobs"
+        self.partial_dir = root / "partial"
+        self.index_path = root / self.INDEX_FILE
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(release: str, asset_name: str) -> str:
+        return f"{release}/{asset_name}"
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blobs_dir / f"{sha256}.zip"
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=2)
+            os.replace(tmp_name, self.index_path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def lookup(
+        self,
+        release: str,
+        asset_name: str,
+        *,
+        sha256: str | None = None,
+        size: int | None = None,
+    ) -> Path | None:
+        """Return the cached archive for a release asset, or None on a miss.
+
+        When the expected SHA-256 is known it takes precedence over the index,
+        so a re-published asset under the same tag is never served stale.
+        """
+        key = self.key(release, asset_name)
+        index = self._load_index()
+        entry = index.get(key) or {}
+        digest = sha256 or entry.get("sha256")
+        if not digest:
+            return None
+
+        blob = self.blob_path(digest)
+        try:
+            st = blob.stat()
+        except OSError:
+            return None
+        if size is not None and st.st_size != size:
+            return None
+
+        # Touch the blob so eviction sees it as recently used
+        try:
+            os.utime(blob)
+        except OSError:
+            pass
+        if entry.get("sha256") != digest:
+            index[key] = {"sha256": digest, "size": st.st_size}
+            self._save_index(index)
+        return blob
+
+    def store(self, release: str, asset_name: str, archive: Path, sha256: str) -> Path:
+        """Move a freshly downloaded archive into the cache and return its cached path."""
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        blob = self.blob_path(sha256)
+        if blob.exists():
+            archive.unlink(missing_ok=True)
+            os.utime(blob)
+        else:
+            # Stage next to the blob so the final rename is atomic even when
+            # the archive lives on another filesystem
+            tmp_blob = self.blobs_dir / f".{sha256}.{os.getpid()}.tmp"
+            shutil.move(str(archive), str(tmp_blob))
+            os.replace(tmp_blob, blob)
+
+        index = self._load_index()
+        index[self.key(release, asset_name)] = {
+            "sha256": sha256,
+            "size": blob.stat().st_size,
+        }
+        self._save_index(index)
+        self.evict(keep=blob)
+        return blob
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Remove least recently used blobs until the cache fits in max_bytes.
+
+        Returns:
+            Number of blobs removed
+        """
+        try:
+            blobs = [
+                (p, p.stat()) for p in self.blobs_dir.glob("*.zip") if p.is_file()
+            ]
+        except OSError:
+            return 0
+        total = sum(st.st_size for _, st in blobs)
+        if total <= self.max_bytes:
+            return 0
+
+        removed_digests = set()
+        for blob, st in sorted(blobs, key=lambda item: item[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and blob == keep:
+                continue
+            try:
+                blob.unlink()
+            except OSError:
+                continue
+            total -= st.st_size
+            removed_digests.add(blob.stem)
+
+        if removed_digests:
+            index = self._load_index()
+            self._save_index(
+                {
+                    key: entry
+                    for key, entry in index.items()
+                    if entry.get("sha256") not in removed_digests
+                }
+            )
+        return len(removed_digests)
+
+
+class TemplateBundle:
+    """Pre-seeded directory of release template archives for offline init.
+
+    Populated by ``specify templates prefetch``. The directory holds the
+    archives plus a ``manifest.json`` describing the release they belong to,
+    so it can be copied to air-gapped machines and used with ``--offline``.
+
+    The location defaults to the platform user data directory and can be
+    overridden with SPECIFY_TEMPLATE_BUNDLE_DIR or ``--bundle-dir``.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, root: Path | None = None):
+        if root is None:
+            override = os.getenv("SPECIFY_TEMPLATE_BUNDLE_DIR", "").strip()
+            root = (
+                Path(override).expanduser()
+                if override
+                else Path(user_data_dir("specify-cli")) / "bundle"
+            )
+        self.root = root
+        self.manifest_path = root / self.MANIFEST_FILE
+
+    def load_manifest(self) -> dict | None:
+        """Return the bundle manifest, or None if the bundle is missing or unreadable."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("assets"), dict):
+            return None
+        return manifest
+
+    def save_manifest(self, manifest: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def resolve(self, ai_assistant: str, script_type: str) -> Tuple[Path, dict]:
+        """Return the bundled archive and its metadata for an agent/script pair.
+
+        Raises:
+            RuntimeError: If the bundle is missing, lacks the asset, or the
+                archive on disk does not match the manifest's size or sha256
+        """
+        manifest = self.load_manifest()
+        if manifest is None:
+            raise RuntimeError(
+                f"No template bundle found in {self.root}\n"
+                "Run 'specify templates prefetch' while online to create one."
+            )
+
+        assets = [{"name": name, **info} for name, info in manifest["assets"].items()]
+        asset = _find_template_asset(assets, ai_assistant, script_type)
+        if asset is None:
+            raise RuntimeError(
+                f"Template bundle for release {manifest.get('release', '?')} has no asset "
+                f"for {ai_assistant}/{script_type}\n"
+                "Available: " + (", ".join(sorted(manifest["assets"])) or "(none)")
+            )
+
+        zip_path = self.root / asset["name"]
+        try:
+            actual_size = zip_path.stat().st_size
+        except OSError:
+            raise RuntimeError(f"Bundled archive missing: {zip_path}")
+        if asset.get("size") is not None and actual_size != asset["size"]:
+            raise RuntimeError(
+                f"Bundled archive {zip_path.name} is {actual_size:,} bytes, "
+                f"manifest expects {asset['size']:,}"
+            )
+        expected_sha256 = asset.get("sha256")
+        if expected_sha256:
+            hasher = hashlib.sha256()
+            with open(zip_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+            actual_sha256 = hasher.hexdigest()
+            if actual_sha256 != expected_sha256:
+                raise RuntimeError(
+                    f"Bundled archive {zip_path.name} does not match the manifest "
+                    f"(expected sha256 {expected_sha256}, got {actual_sha256})\n"
+                    "Run 'specify templates prefetch' again to refresh the bundle."
+                )
+
+        return zip_path, {
+            "filename": asset["name"],
+            "size": actual_size,
+            "release": manifest.get("release", "unknown"),
+            "asset_url": str(zip_path),
+            "sha256": asset.get("sha256"),
+            # The bundle owns the archive; callers must not delete it
+            "cached": True,
+            "cache_hit": True,
+            "offline": True,
+        }
+
+
+class HttpMetadataCache:
+    """Persistent ETag/Last-Modified cache for small JSON API responses.
+
+    Each URL is stored as its own JSON file holding the validators and the
+    last response body, so repeated calls can be sent as conditional requests
+    and a 304 Not Modified answer served from disk. GitHub does not count 304
+    responses against the API rate limit.
+
+    The location defaults to the platform user cache directory and can be
+    overridden with SPECIFY_HTTP_CACHE_DIR.
+    """
+
+    def __init__(self, root: Path | None = None):
+        if root is None:
+            override = os.getenv("SPECIFY_HTTP_CACHE_DIR", "").strip()
+            root = (
+                Path(override).expanduser()
+                if override
+                else Path(user_cache_dir("specify-cli")) / "http"
+            )
+        self.root = root
+
+    def entry_path(self, url: str) -> Path:
+        return self.root / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> dict | None:
+        """Return the cached entry for url, or None when absent or unreadable."""
+        try:
+            with open(self.entry_path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or "body" not in entry:
+            return None
+        return entry
+
+    def validators(self, entry: dict) -> dict:
+        """Return the conditional request headers for a cached entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url: str, headers: httpx.Headers, body) -> None:
+        """Store a 200 response body with its validators; no-op without validators."""
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".entry-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_name, self.entry_path(url))
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _get_json_revalidated(
+    client: httpx.Client,
+    url: str,
+    *,
+    headers: dict | None = None,
+    timeout: float = 30,
+    cache: HttpMetadataCache | None = None,
+    max_retries: int | None = None,
+) -> Tuple[httpx.Response, object]:
+    """GET a JSON document, revalidating any cached copy with a conditional request.
+
+    The request goes through network.get, so 429/5xx answers and dropped
+    connections are retried like every other request (max_retries overrides
+    network.MAX_RETRIES, e.g. 0 for informational lookups). Returns (response,
+    data). data is the cached body when the server answers 304, the parsed
+    body on 200, and None for any other status.
+
+    Raises:
+        ValueError: If a 200 response body is not valid JSON
+    """
+    request_headers = dict(headers or {})
+    entry = cache.get(url) if cache is not None else None
+    if entry is not None:
+        request_headers.update(cache.validators(entry))
+
+    response = network.get(
+        url,
+        client=client,
+        headers=request_headers,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+    if response.status_code == 304 and entry is not None:
+        return response, entry["body"]
+    if response.status_code != 200:
+        return response, None
+
+    try:
+        data = response.json()
+    except ValueError as je:
+        raise ValueError(f"{je}\nRaw (truncated 400): {response.text[:400]}") from je
+    if cache is not None:
+        cache.put(url, response.headers, data)
+    return response, data
+
+
+def _fetch_latest_release(
+    client: httpx.Client,
+    *,
+    debug: bool = False,
+    github_token: str = None,
+    use_cache: bool = True,
+) -> dict:
+    """Fetch the latest spec-kit release metadata from the GitHub API.
+
+    The response is revalidated against the HttpMetadataCache unless
+    use_cache is False, so an unchanged release costs no rate-limit budget.
+
+    Raises:
+        RuntimeError: With a user-facing message (including rate-limit details)
+            when the request fails or the response is not valid JSON
+    """
+    repo_owner = "github"
+    repo_name = "spec-kit"
+    api_url = f"{_github_api_url()}/repos/{repo_owner}/{repo_name}/releases/latest"
+
+    try:
+        response, data = _get_json_revalidated(
+            client,
+            api_url,
+            headers=_github_auth_headers(github_token),
+            timeout=30,
+            cache=HttpMetadataCache() if use_cache else None,
+        )
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}")
+    if data is None:
+        # Format detailed error message with rate-limit info
+        error_msg = _format_rate_limit_error(response.status_code, response.headers, api_url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
+        raise RuntimeError(error_msg)
+    return data
+
+
+def _find_template_asset(assets: list, ai_assistant: str, script_type: str) -> dict | None:
+    """Return the first template ZIP asset for an agent/script combination."""
+    pattern = f"spec-kit-template-{ai_assistant}-{script_type}"
+    for asset in assets:
+        if pattern in asset["name"] and asset["name"].endswith(".zip"):
+            return asset
+    return None
+
+
+def _download_release_asset(
+    client: httpx.Client,
+    download_url: str,
+    dest_path: Path,
+    *,
+    expected_size: int | None = None,
+    show_progress: bool = False,
+    debug: bool = False,
+    github_token: str = None,
+    on_chunk: Callable[[bytes], None] | None = None,
+    max_retries: int | None = None,
+) -> str:
+    """Download a release asset to dest_path and return its SHA-256 hex digest.
+
+    Bytes are written to a ``.part`` file next to dest_path that is renamed
+    into place once complete. Dropped connections and 429/5xx answers are
+    retried with exponential backoff, honoring Retry-After, and resume from
+    the bytes already on disk with a Range request. A ``.part`` file left by
+    an earlier run is resumed the same way.
+
+    on_chunk, when given, receives every byte of the asset once and in order.
+
+    Raises:
+        RuntimeError: If the server answers with a non-retryable status, the
+            retries are exhausted, or the final size does not match
+            expected_size. The ``.part`` file is kept for a later resume
+            unless its content is known to be wrong.
+    """
+    import httpx
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    if max_retries is None:
+        max_retries = network.MAX_RETRIES
+    part_path = dest_path.with_name(dest_path.name + ".part")
+    hasher = hashlib.sha256()
+    received = 0
+
+    if part_path.exists():
+        if expected_size is not None and part_path.stat().st_size > expected_size:
+            part_path.unlink()
+        else:
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(chunk)
+                    if on_chunk is not None:
+                        on_chunk(chunk)
+                    received += len(chunk)
+
+    with ExitStack() as stack:
+        progress = None
+        task = None
+        attempt = 0
+        while True:
+            headers = _github_auth_headers(github_token)
+            if received:
+                headers["Range"] = f"bytes={received}-"
+            try:
+                with client.stream(
+                    "GET",
+                    download_url,
+                    timeout=60,
+                    follow_redirects=True,
+                    headers=headers,
+                ) as response:
+                    status = response.status_code
+                    if status == 416 and received and received == expected_size:
+                        break
+                    if status in (200, 206):
+                        # Bytes of the body we already have on disk
+                        skip = received
+                        if status == 206:
+                            content_range = response.headers.get("content-range", "")
+                            range_start = content_range.partition(" ")[2].partition("-")[0]
+                            skip = received - int(range_start or 0)
+                            if skip < 0:
+                                raise RuntimeError(
+                                    f"Unexpected Content-Range '{content_range}' for {download_url}"
+                                )
+                        total_size = expected_size or (
+                            int(response.headers.get("content-length", 0)) + received - skip
+                        )
+                        if show_progress and total_size and progress is None:
+                            progress = stack.enter_context(
+                                Progress(
+                                    SpinnerColumn(),
+                                    TextColumn("[progress.description]{task.description}"),
+                                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                                    console=console,
+                                )
+                            )
+                            task = progress.add_task(
+                                "Downloading...", total=total_size, completed=received
+                            )
+                        with open(part_path, "ab") as f:
+                            # Unbuffered, so bytes received before a drop are kept
+                            for chunk in response.iter_bytes():
+                                if skip:
+                                    if len(chunk) <= skip:
+                                        skip -= len(chunk)
+                                        continue
+                                    chunk = chunk[skip:]
+                                    skip = 0
+                                f.write(chunk)
+                                hasher.update(chunk)
+                                if on_chunk is not None:
+                                    on_chunk(chunk)
+                                received += len(chunk)
+                                if progress is not None:
+                                    progress.update(task, completed=received)
+                        if skip:
+                            part_path.unlink(missing_ok=True)
+                            raise RuntimeError(
+                                f"Server returned fewer bytes than already downloaded for {download_url}"
+                            )
+                        break
+
+                    # Handle rate-limiting on download as well
+                    error_msg = _format_rate_limit_error(
+                        status, response.headers, download_url
+                    )
+                    if debug:
+                        response.read()
+                        error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
+                    if status not in network.RETRY_STATUSES or attempt >= max_retries:
+                        raise RuntimeError(error_msg)
+                    delay = network.retry_delay(attempt, response.headers)
+                    if delay is None:
+                        raise RuntimeError(error_msg)
+            except httpx.TransportError as e:
+                if attempt >= max_retries:
+                    raise RuntimeError(
+                        f"Download of {download_url} failed after {attempt + 1} attempts: {e}"
+                    ) from e
+                delay = network.retry_delay(attempt)
+            attempt += 1
+            if debug:
+                console.print(
+                    f"[yellow]Retrying download in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries + 1}, {received:,} bytes kept)[/yellow]"
+                )
+            time.sleep(delay)
+
+    if expected_size is not None and received != expected_size:
+        part_path.unlink(missing_ok=True)
+        raise RuntimeError(
+            f"Downloaded {received:,} bytes from {download_url}, expected {expected_size:,}"
+        )
+    os.replace(part_path, dest_path)
+    return hasher.hexdigest()
+
+
+def _materialize_template_asset(
+    client: httpx.Client,
+    release_tag: str,
+    asset: dict,
+    download_dir: Path,
+    *,
+    cache: TemplateCache | None = None,
+    show_progress: bool = False,
+    debug: bool = False,
+    github_token: str = None,
+    extract_into: Path | None = None,
+    verbose: bool = False,
+    tracker: StepTracker | None = None,
+) -> Tuple[Path, dict]:
+    """Return a local archive for a release asset, downloading it on a cache miss.
+
+    With extract_into set, a downloaded archive is also extracted there while
+    it streams in, when the server supports range requests; the extraction
+    stats are then returned as metadata["extracted"].
+
+    On a cache miss the archive is downloaded into the cache's partial
+    directory, so an interrupted download is resumed by the next run. A lock
+    file next to it keeps concurrent runs sharing the cache from appending to
+    the same ``.part`` file; a run that waited on the lock serves the archive
+    from the cache if the other run stored it.
+
+    Raises:
+        RuntimeError: If the download fails or the checksum does not match;
+            the partial download is removed unless it can be resumed from the cache
+    """
+    download_url = asset["browser_download_url"]
+    filename = asset["name"]
+    file_size = asset["size"]
+    expected_sha256 = _asset_sha256(asset)
+
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": release_tag,
+        "asset_url": download_url,
+        "cached": False,
+        "cache_hit": False,
+    }
+
+    if cache is not None:
+        cached_path = cache.lookup(
+            release_tag, filename, sha256=expected_sha256, size=file_size
+        )
+        if cached_path is not None:
+            metadata.update(cached=True, cache_hit=True, sha256=cached_path.stem)
+            return cached_path, metadata
+
+    from .extensions import _file_lock
+
+    with ExitStack() as stack:
+        if cache is not None:
+            try:
+                cache.partial_dir.mkdir(parents=True, exist_ok=True)
+                # One process at a time may resume, finish or store this asset
+                stack.enter_context(_file_lock(cache.partial_dir / f"{filename}.lock"))
+                download_dir = cache.partial_dir
+            except OSError:
+                pass
+            else:
+                # Another process may have stored it while we waited for the lock
+                cached_path = cache.lookup(
+                    release_tag, filename, sha256=expected_sha256, size=file_size
+                )
+                if cached_path is not None:
+                    metadata.update(cached=True, cache_hit=True, sha256=cached_path.stem)
+                    return cached_path, metadata
+        zip_path = download_dir / filename
+        extractor = None
+        try:
+            if extract_into is not None:
+                extractor = _prepare_streaming_extraction(
+                    client,
+                    download_url,
+                    file_size,
+                    extract_into,
+                    github_token=github_token,
+                    verbose=verbose,
+                    tracker=tracker,
+                )
+            digest = _download_release_asset(
+                client,
+                download_url,
+                zip_path,
+                expected_size=file_size,
+                show_progress=show_progress,
+                debug=debug,
+                github_token=github_token,
+                on_chunk=extractor.feed if extractor is not None else None,
+            )
+            if extractor is not None:
+                metadata["extracted"] = extractor.finish()
+            if expected_sha256 and digest != expected_sha256:
+                raise RuntimeError(
+                    f"Checksum mismatch for {filename}: expected sha256 {expected_sha256}, got {digest}"
+                )
+        except Exception:
+            if extractor is not None:
+                extractor.abort()
+            if zip_path.exists():
+                zip_path.unlink()
+            if download_dir != getattr(cache, "partial_dir", None):
+                zip_path.with_name(filename + ".part").unlink(missing_ok=True)
+            raise
+        metadata["sha256"] = digest
+
+        if cache is not None:
+            try:
+                zip_path = cache.store(release_tag, filename, zip_path, digest)
+                metadata["cached"] = True
+            except OSError:
+                # A read-only or full cache directory must not break init
+                pass
+        return zip_path, metadata
+
+
+def _report_missing_template_asset(assets: list, ai_assistant: str, script_type: str) -> None:
+    pattern = f"spec-kit-template-{ai_assistant}-{script_type}"
+    console.print(
+        f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])"
+    )
+    asset_names = [a.get("name", "?") for a in assets]
+    console.print(
+        Panel(
+            "\n".join(asset_names) or "(no assets)",
+            title="Available Assets",
+            border_style="yellow",
+        )
+    )
+
+
+def download_template_from_github(
+    ai_assistant: str,
+    download_dir: Path,
+    *,
+    script_type: str = "sh",
+    verbose: bool = True,
+    show_progress: bool = True,
+    client: httpx.Client = None,
+    debug: bool = False,
+    github_token: str = None,
+    use_cache: bool = True,
+    extract_into: Path | None = None,
+    tracker: StepTracker | None = None,
+) -> Tuple[Path, dict]:
+    """Resolve the template asset of the latest release and return a local archive.
+
+    Archives are served from the TemplateCache when the same release asset was
+    fetched before. Returns (zip_path, metadata); metadata["cached"] is True
+    when zip_path is owned by the cache and must not be deleted by the caller.
+    With extract_into set, a downloaded archive may be extracted while it
+    streams in; metadata["extracted"] is then present.
+    """
+    if client is None:
+        client = network.get_client()
+
+    if verbose:
+        console.print("[cyan]Fetching latest release information...[/cyan]")
+
+    try:
+        release_data = _fetch_latest_release(
+            client, debug=debug, github_token=github_token, use_cache=use_cache
+        )
+    except Exception as e:
+        console.print(f"[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+
+    assets = release_data.get("assets", [])
+    asset = _find_template_asset(assets, ai_assistant, script_type)
+
+    if asset is None:
+        _report_missing_template_asset(assets, ai_assistant, script_type)
+        raise typer.Exit(1)
+
+    release_tag = release_data["tag_name"]
+    if verbose:
+        console.print(f"[cyan]Found template:[/cyan] {asset['name']}")
+        console.print(f"[cyan]Size:[/cyan] {asset['size']:,} bytes")
+        console.print(f"[cyan]Release:[/cyan] {release_tag}")
+        console.print(f"[cyan]Downloading template...[/cyan]")
+
+    try:
+        zip_path, metadata = _materialize_template_asset(
+            client,
+            release_tag,
+            asset,
+            download_dir,
+            cache=TemplateCache() if use_cache else None,
+            show_progress=show_progress,
+            debug=debug,
+            github_token=github_token,
+            extract_into=extract_into,
+            verbose=verbose,
+            tracker=tracker,
+        )
+    except Exception as e:
+        console.print(f"[red]Error downloading template[/red]")
+        console.print(Panel(str(e), title="Download Error", border_style="red"))
+        raise typer.Exit(1)
+    if verbose:
+        if metadata["cache_hit"]:
+            console.print(f"[cyan]Using cached template:[/cyan] {zip_path}")
+        else:
+            console.print(f"Downloaded: {metadata['filename']}")
+    return zip_path, metadata
+
+
+def download_templates_from_github(
+    ai_assistants: list[str],
+    download_dir: Path,
+    *,
+    script_type: str = "sh",
+    client: httpx.Client = None,
+    debug: bool = False,
+    github_token: str = None,
+    use_cache: bool = True,
+    max_workers: int = 8,
+) -> list[Tuple[Path, dict]]:
+    """Fetch template archives for several agents from a single release lookup.
+
+    The latest release metadata is requested once and the matching assets are
+    downloaded concurrently over the shared client. Results are returned in
+    the order of ai_assistants, each as (zip_path, metadata) like
+    download_template_from_github.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if client is None:
+        client = network.get_client()
+
+    try:
+        release_data = _fetch_latest_release(
+            client, debug=debug, github_token=github_token, use_cache=use_cache
+        )
+    except Exception as e:
+        console.print(f"[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+
+    assets = release_data.get("assets", [])
+    wanted = []
+    for ai_assistant in ai_assistants:
+        asset = _find_template_asset(assets, ai_assistant, script_type)
+        if asset is None:
+            _report_missing_template_asset(assets, ai_assistant, script_type)
+            raise typer.Exit(1)
+        wanted.append(asset)
+
+    release_tag = release_data["tag_name"]
+    cache = TemplateCache() if use_cache else None
+
+    def fetch(asset: dict) -> Tuple[Path, dict]:
+        return _materialize_template_asset(
+            client,
+            release_tag,
+            asset,
+            download_dir,
+            cache=cache,
+            debug=debug,
+            github_token=github_token,
+        )
+
+    results: list = [None] * len(wanted)
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(wanted)))) as pool:
+        futures = {pool.submit(fetch, asset): i for i, asset in enumerate(wanted)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                errors.append(f"{wanted[i]['name']}: {e}")
+
+    if errors:
+        # Don't leave successfully downloaded temporary archives behind
+        for result in results:
+            if result and not result[1]["cached"] and result[0].exists():
+                result[0].unlink()
+        console.print(f"[red]Error downloading templates[/red]")
+        console.print(Panel("\n\n".join(errors), title="Download Error", border_style="red"))
+        raise typer.Exit(1)
+    return results
+
+
+def _template_archive_members(
+    zip_ref: zipfile.ZipFile,
+) -> Tuple[list[Tuple[zipfile.ZipInfo, PurePosixPath]], bool]:
+    """Return (member, project-relative path) pairs for a template archive.
+
+    A single top-level directory wrapping the whole archive is stripped, as
+    release archives nest everything under one folder. The second return
+    value tells whether that happened.
+
+    Raises:
+        RuntimeError: If a member path is absolute or escapes the archive root
+    """
+    members = []
+    for info in zip_ref.infolist():
+        rel = PurePosixPath(info.filename.replace("\\", "/"))
+        if rel.is_absolute() or ".." in rel.parts or ":" in (rel.parts or ("",))[0]:
+            raise RuntimeError(f"Unsafe path in template archive: {info.filename}")
+        if rel.parts:
+            members.append((info, rel))
+
+    top_levels = {rel.parts[0] for _, rel in members}
+    wrapped = len(top_levels) == 1 and not any(
+        len(rel.parts) == 1 and not info.is_dir() for info, rel in members
+    )
+    if wrapped:
+        members = [
+            (info, PurePosixPath(*rel.parts[1:]))
+            for info, rel in members
+            if len(rel.parts) > 1
+        ]
+    return members, wrapped
+
+
+def _is_vscode_settings(rel: PurePosixPath) -> bool:
+    return rel.name == "settings.json" and rel.parent.name == ".vscode"
+
+
+def _extract_template_archives(
+    project_path: Path,
+    zip_paths: list[Path],
+    *,
+    verbose: bool = True,
+    tracker: StepTracker | None = None,
+) -> dict:
+    """Stream one or more template archives into project_path in a single pass.
+
+    Each member is written straight from the archive to its final path; there
+    is no intermediate extraction directory. Files present in more than one
+    archive (the shared .specify/ tree) are taken from the last archive and
+    written once. .vscode/settings.json is merged into existing settings
+    instead of overwritten.
+
+    Returns:
+        Dict with the number of archive ``entries``, files ``written`` and
+        whether a wrapping top-level directory was ``flattened``
+    """
+    project_path.mkdir(parents=True, exist_ok=True)
+    entries = 0
+    flattened = False
+    with ExitStack() as stack:
+        plan: dict[PurePosixPath, Tuple[zipfile.ZipFile, zipfile.ZipInfo]] = {}
+        settings = []
+        directories = set()
+        for zip_path in zip_paths:
+            zip_ref = stack.enter_context(zipfile.ZipFile(zip_path, "r"))
+            entries += len(zip_ref.infolist())
+            members, wrapped = _template_archive_members(zip_ref)
+            flattened = flattened or wrapped
+            for info, rel in members:
+                if info.is_dir():
+                    directories.add(rel)
+                elif _is_vscode_settings(rel):
+                    settings.append((zip_ref, info, rel))
+                else:
+                    plan[rel] = (zip_ref, info)
+
+        for rel in directories:
+            project_path.joinpath(*rel.parts).mkdir(parents=True, exist_ok=True)
+
+        for rel, (zip_ref, info) in plan.items():
+            dest_file = project_path.joinpath(*rel.parts)
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            if verbose and not tracker and dest_file.exists():
+                console.print(f"[yellow]Overwriting file:[/yellow] {rel}")
+            with zip_ref.open(info) as src, open(dest_file, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+        for zip_ref, info, rel in settings:
+            dest_file = project_path.joinpath(*rel.parts)
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            write_vscode_settings(zip_ref.read(info), dest_file, rel, verbose, tracker)
+
+    return {
+        "entries": entries,
+        "written": len(plan) + len(settings),
+        "flattened": flattened,
+    }
+
+
+class _ArchiveTail:
+    """Seekable view of the last bytes of a remote archive.
+
+    Holds just enough of the file for zipfile to parse the end of central
+    directory record and the central directory; reads before the fetched
+    range raise OSError.
+    """
+
+    def __init__(self, data: bytes, size: int):
+        self.data = data
+        self.size = size
+        self.start = size - len(data)
+        self.pos = 0
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 1:
+            offset += self.pos
+        elif whence == 2:
+            offset += self.size
+        self.pos = offset
+        return self.pos
+
+    def tell(self) -> int:
+        return self.pos
+
+    def read(self, n: int = -1) -> bytes:
+        if self.pos < self.start:
+            raise OSError("Read outside the fetched archive tail")
+        end = self.size if n is None or n < 0 else min(self.pos + n, self.size)
+        chunk = self.data[self.pos - self.start : end - self.start]
+        self.pos += len(chunk)
+        return chunk
+
+
+class _StreamingZipExtractor:
+    """Extract template archive members from the download stream as bytes arrive.
+
+    The member layout comes from a central directory fetched ahead of the
+    body. Chunks pass through a bounded queue to a worker thread, so writing
+    files overlaps with the network transfer while memory stays bounded.
+    """
+
+    LOCAL_HEADER_SIZE = 30
+    QUEUE_CHUNKS = 256
+
+    def __init__(
+        self,
+        project_path: Path,
+        zip_ref: zipfile.ZipFile,
+        *,
+        verbose: bool = False,
+        tracker: StepTracker | None = None,
+    ):
+        self.project_path = project_path
+        self.verbose = verbose
+        self.tracker = tracker
+        self.entries = len(zip_ref.infolist())
+        members, self.flattened = _template_archive_members(zip_ref)
+
+        self.directories = []
+        self.targets = []
+        for info, rel in members:
+            if info.is_dir():
+                self.directories.append(rel)
+                continue
+            if info.flag_bits & 0x1 or info.compress_type not in (
+                zipfile.ZIP_STORED,
+                zipfile.ZIP_DEFLATED,
+            ):
+                raise ValueError(f"Cannot stream-extract {info.filename}")
+            self.targets.append((info, rel))
+        self.targets.sort(key=lambda target: target[0].header_offset)
+
+        self.settings = []
+        self._queue = queue.Queue(maxsize=self.QUEUE_CHUNKS)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._error = None
+        self._buffer = bytearray()
+        self._buffer_offset = 0
+        self._index = 0
+        self._out = None
+
+    def start(self) -> None:
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        for rel in self.directories:
+            self.project_path.joinpath(*rel.parts).mkdir(parents=True, exist_ok=True)
+        self._thread.start()
+
+    def feed(self, chunk: bytes) -> None:
+        """Queue a chunk of the archive body; raises if extraction has failed."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def finish(self) -> dict:
+        """Wait for the worker and return stats like _extract_template_archives."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        if self._index < len(self.targets):
+            raise RuntimeError("Template archive ended before all files were extracted")
+        for content, dest_file, rel in self.settings:
+            write_vscode_settings(content, dest_file, rel, self.verbose, self.tracker)
+        return {
+            "entries": self.entries,
+            "written": len(self.targets),
+            "flattened": self.flattened,
+            "streamed": True,
+        }
+
+    def abort(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._out is not None:
+            self._out[0].close()
+            self._out = None
+
+    def _run(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._error is not None:
+                # Keep draining so the producer never blocks on a full queue
+                continue
+            try:
+                self._consume(chunk)
+            except Exception as e:
+                self._error = e
+                if self._out is not None:
+                    self._out[0].close()
+                    self._out = None
+
+    def _consume(self, chunk: bytes) -> None:
+        self._buffer += chunk
+        while self._index < len(self.targets):
+            info, rel = self.targets[self._index]
+            if self._out is None:
+                start = info.header_offset - self._buffer_offset
+                if start > len(self._buffer):
+                    # Skipping bytes of members that are not extracted
+                    self._buffer_offset += len(self._buffer)
+                    self._buffer.clear()
+                    return
+                header_end = start + self.LOCAL_HEADER_SIZE
+                if len(self._buffer) < header_end:
+                    return
+                header = bytes(self._buffer[start:header_end])
+                if header[:4] != b"PK\x03\x04":
+                    raise RuntimeError(f"Bad local header for {info.filename}")
+                name_len, extra_len = struct.unpack("<HH", header[26:30])
+                data_start = header_end + name_len + extra_len
+                if len(self._buffer) < data_start:
+                    return
+                del self._buffer[:data_start]
+                self._buffer_offset += data_start
+                self._open_member(info, rel)
+
+            sink, decompressor, remaining, crc = self._out
+            take = min(remaining, len(self._buffer))
+            data = bytes(self._buffer[:take])
+            del self._buffer[:take]
+            self._buffer_offset += take
+            remaining -= take
+            if decompressor is not None:
+                data = decompressor.decompress(data)
+                if remaining == 0:
+                    data += decompressor.flush()
+            sink.write(data)
+            crc = zlib.crc32(data, crc)
+            self._out = (sink, decompressor, remaining, crc)
+            if remaining:
+                return
+            self._close_member(info, rel)
+
+    def _open_member(self, info: zipfile.ZipInfo, rel: PurePosixPath) -> None:
+        if _is_vscode_settings(rel):
+            sink = io.BytesIO()
+        else:
+            dest_file = self.project_path.joinpath(*rel.parts)
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            if self.verbose and not self.tracker and dest_file.exists():
+                console.print(f"[yellow]Overwriting file:[/yellow] {rel}")
+            sink = open(dest_file, "wb")
+        decompressor = (
+            zlib.decompressobj(-zlib.MAX_WBITS)
+            if info.compress_type == zipfile.ZIP_DEFLATED
+            else None
+        )
+        self._out = (sink, decompressor, info.compress_size, 0)
+
+    def _close_member(self, info: zipfile.ZipInfo, rel: PurePosixPath) -> None:
+        sink, _, _, crc = self._out
+        self._out = None
+        self._index += 1
+        if isinstance(sink, io.BytesIO):
+            dest_file = self.project_path.joinpath(*rel.parts)
+            dest_file.parent.mkdir(parents=True, exist_ok=True)
+            self.settings.append((sink.getvalue(), dest_file, rel))
+        else:
+            sink.close()
+        if crc != info.CRC:
+            raise RuntimeError(f"CRC mismatch for {info.filename} in template archive")
+
+
+def _prepare_streaming_extraction(
+    client: httpx.Client,
+    download_url: str,
+    file_size: int,
+    project_path: Path,
+    *,
+    github_token: str = None,
+    verbose: bool = False,
+    tracker: StepTracker | None = None,
+    tail_bytes: int = 64 * 1024,
+) -> _StreamingZipExtractor | None:
+    """Fetch the central directory of a remote archive and start a streaming extractor.
+
+    Returns None when the server ignores range requests, the central directory
+    does not fit in the fetched tail, or the archive uses features the
+    streaming extractor does not handle; callers then extract after download.
+    """
+    import httpx
+
+    headers = _github_auth_headers(github_token)
+    headers["Range"] = f"bytes=-{tail_bytes}"
+    try:
+        with client.stream(
+            "GET", download_url, timeout=30, follow_redirects=True, headers=headers
+        ) as response:
+            if response.status_code != 206:
+                return None
+            content_range = response.headers.get("content-range", "")
+            total = int(content_range.rpartition("/")[2])
+            if file_size and total != file_size:
+                return None
+            tail = response.read()
+        with zipfile.ZipFile(_ArchiveTail(tail, total)) as zip_ref:
+            extractor = _StreamingZipExtractor(
+                project_path, zip_ref, verbose=verbose, tracker=tracker
+            )
+    except (httpx.HTTPError, OSError, ValueError, zipfile.BadZipFile):
+        return None
+    extractor.start()
+    return extractor
+
+
+def download_and_extract_template(
+    project_path: Path,
+    ai_assistant: str | list[str],
+    script_type: str,
+    is_current_dir: bool = False,
+    *,
+    verbose: bool = True,
+    tracker: StepTracker | None = None,
+    client: httpx.Client = None,
+    debug: bool = False,
+    github_token: str = None,
+    use_cache: bool = True,
+    offline: bool = False,
+    bundle_dir: Path | None = None,
+    stream: bool = False,
+) -> Path:
+    """Download the latest release and extract it to create a new project.
+    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+    With offline=True the archive is resolved from the TemplateBundle instead of GitHub,
+    and client may be None.
+    ai_assistant may be a list of agents; their archives are fetched from one release
+    lookup. Archives are streamed straight into the project in a single pass, with no
+    temporary extraction directory. With stream=True a single downloaded archive is
+    extracted into a new project directory while it downloads; into the current
+    directory it is extracted only after its size and checksum are verified, since a
+    failed download could not be cleaned out of existing files.
+    """
+    current_dir = Path.cwd()
+    ai_assistants = [ai_assistant] if isinstance(ai_assistant, str) else list(ai_assistant)
+
+    if tracker:
+        tracker.start(
+            "fetch", "reading template bundle" if offline else "contacting GitHub API"
+        )
+    try:
+        if offline:
+            try:
+                bundle = TemplateBundle(bundle_dir)
+                archives = [bundle.resolve(ai, script_type) for ai in ai_assistants]
+            except RuntimeError as e:
+                if tracker is None:
+                    console.print(f"[red]Error resolving offline template[/red]")
+                    console.print(Panel(str(e), title="Bundle Error", border_style="red"))
+                raise
+        elif len(ai_assistants) == 1:
+            archives = [
+                download_template_from_github(
+                    ai_assistants[0],
+                    current_dir,
+                    script_type=script_type,
+                    verbose=verbose and tracker is None,
+                    show_progress=(tracker is None),
+                    client=client,
+                    debug=debug,
+                    github_token=github_token,
+                    use_cache=use_cache,
+                    extract_into=project_path if stream and not is_current_dir else None,
+                    tracker=tracker,
+                )
+            ]
+        else:
+            archives = download_templates_from_github(
+                ai_assistants,
+                current_dir,
+                script_type=script_type,
+                client=client,
+                debug=debug,
+                github_token=github_token,
+                use_cache=use_cache,
+            )
+        zip_path, meta = archives[0]
+        if tracker:
+            total_size = sum(m["size"] for _, m in archives)
+            tracker.complete(
+                "fetch", f"release {meta['release']} ({total_size:,} bytes)"
+            )
+            tracker.add("download", "Download template")
+            if len(archives) > 1:
+                hits = sum(1 for _, m in archives if m["cache_hit"])
+                download_detail = f"{len(archives)} archives"
+                if meta.get("offline"):
+                    download_detail += " (offline bundle)"
+                elif hits:
+                    download_detail += f" ({hits} cached)"
+            elif meta.get("offline"):
+                download_detail = f"{meta['filename']} (offline bundle)"
+            elif meta["cache_hit"]:
+                download_detail = f"{meta['filename']} (cached)"
+            else:
+                download_detail = meta["filename"]
+            tracker.complete("download", download_detail)
+    except Exception as e:
+        if tracker:
+            tracker.error("fetch", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error downloading template:[/red] {e}")
+        if stream and not is_current_dir and project_path.exists():
+            # Remove whatever was extracted before the download failed
+            shutil.rmtree(project_path)
+        raise
+
+    if tracker:
+        tracker.add("extract", "Extract template")
+        tracker.start("extract")
+    elif verbose:
+        console.print("Extracting template...")
+
+    try:
+        if not is_current_dir:
+            project_path.mkdir(parents=True, exist_ok=stream)
+
+        stats = meta.get("extracted") if len(archives) == 1 else None
+        if stats is None:
+            stats = _extract_template_archives(
+                project_path,
+                [path for path, _ in archives],
+                verbose=verbose,
+                tracker=tracker,
+            )
+        if tracker:
+            tracker.start("zip-list")
+            tracker.complete("zip-list", f"{stats['entries']} entries")
+            if stats["flattened"]:
+                tracker.add("flatten", "Flatten nested directory")
+                tracker.complete("flatten")
+            tracker.start("extracted-summary")
+            summary = f"{stats['written']} files"
+            if len(archives) > 1:
+                summary += f" from {len(archives)} archives"
+            elif stats.get("streamed"):
+                summary += " (streamed during download)"
+            tracker.complete("extracted-summary", summary)
+        elif verbose:
+            console.print(f"[cyan]ZIP contains {stats['entries']} items[/cyan]")
+            if stats["flattened"]:
+                console.print("[cyan]Flattened nested directory structure[/cyan]")
+            if is_current_dir:
+                console.print(
+                    f"[cyan]Template files merged into current directory[/cyan]"
+                )
+            else:
+                console.print(
+                    f"[cyan]Extracted {stats['written']} files to {project_path}[/cyan]"
+                )
+
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error extracting template:[/red] {e}")
+                if debug:
+                    console.print(
+                        Panel(str(e), title="Extraction Error", border_style="red")
+                    )
+
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise typer.Exit(1)
+    else:
+        if tracker:
+            tracker.complete("extract")
+    finally:
+        if tracker:
+            tracker.add("cleanup", "Remove temporary archive")
+
+        for archive_path, archive_meta in archives:
+            if archive_meta.get("cached"):
+                # Archive belongs to the template cache or bundle; keep it
+                continue
+            if archive_path.exists():
+                archive_path.unlink()
+                if verbose and not tracker:
+                    console.print(f"Cleaned up: {archive_path.name}")
+        if tracker:
+            if all(m.get("cached") for _, m in archives):
+                tracker.complete(
+                    "cleanup",
+                    "archive kept in template bundle"
+                    if meta.get("offline")
+                    else "archive kept in template cache",
+                )
+            else:
+                tracker.complete("cleanup")
+
+    return project_path
+
+
+def ensure_executable_scripts(
+    project_path: Path, tracker: StepTracker | None = None
+) -> None:
+    """Ensure POSIX .sh scripts under .specify/scripts (recursively) have execute bits (no-op on Windows)."""
+    if os.name == "nt":
+        return  # Windows: skip silently
+    scripts_root = project_path / ".specify" / "scripts"
+    if not scripts_root.is_dir():
+        return
+    failures: list[str] = []
+    updated = 0
+    for script in scripts_root.rglob("*.sh"):
+        try:
+            if script.is_symlink() or not script.is_file():
+                continue
+            try:
+                with script.open("rb") as f:
+                    if f.read(2) != b"#!":
+                        continue
+            except Exception:
+                continue
+            st = script.stat()
+            mode = st.st_mode
+            if mode & 0o111:
+                continue
+            new_mode = mode
+            if mode & 0o400:
+                new_mode |= 0o100
+            if mode & 0o040:
+                new_mode |= 0o010
+            if mode & 0o004:
+                new_mode |= 0o001
+            if not (new_mode & 0o100):
+                new_mode |= 0o100
+            os.chmod(script, new_mode)
+            updated += 1
+        except Exception as e:
+            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+    if tracker:
+        detail = f"{updated} updated" + (
+            f", {len(failures)} failed" if failures else ""
+        )
+        tracker.add("chmod", "Set script permissions recursively")
+        (tracker.error if failures else tracker.complete)("chmod", detail)
+    else:
+        if updated:
+            console.print(
+                f"[cyan]Updated execute permissions on {updated} script(s) recursively[/cyan]"
+            )
+        if failures:
+            console.print("[yellow]Some scripts could not be updated:[/yellow]")
+            for f in failures:
+                console.print(f"  - {f}")
+
+
+def ensure_constitution_from_template(
+    project_path: Path, tracker: StepTracker | None = None
+) -> None:
+    """Copy constitution template to memory if it doesn't exist (preserves existing constitution on reinitialization)."""
+    memory_constitution = project_path / ".specify" / "memory" / "constitution.md"
+    template_constitution = (
+        project_path / ".specify" / "templates" / "constitution-template.md"
+    )
+
+    # If constitution already exists in memory, preserve it
+    if memory_constitution.exists():
+        if tracker:
+            tracker.add("constitution", "Constitution setup")
+            tracker.skip("constitution", "existing file preserved")
+        return
+
+    # If template doesn't exist, something went wrong with extraction
+    if not template_constitution.exists():
+        if tracker:
+            tracker.add("constitution", "Constitution setup")
+            tracker.error("constitution", "template not found")
+        return
+
+    # Copy template to memory directory
+    try:
+        memory_constitution.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(template_constitution, memory_constitution)
+        if tracker:
+            tracker.add("constitution", "Constitution setup")
+            tracker.complete("constitution", "copied from template")
+        else:
+            console.print(f"[cyan]Initialized constitution from template[/cyan]")
+    except Exception as e:
+        if tracker:
+            tracker.add("constitution", "Constitution setup")
+            tracker.error("constitution", str(e))
+        else:
+            console.print(
+                f"[yellow]Warning: Could not initialize constitution: {e}[/yellow]"
+            )
+
+
+def _parse_ai_assistants(value: str) -> list[str]:
+    """Parse a comma-separated --ai value, exiting on unknown agents."""
+    agents = list(dict.fromkeys(a.strip() for a in value.split(",") if a.strip()))
+    invalid = [a for a in agents if a not in AGENT_CONFIG]
+    if invalid or not agents:
+        console.print(
+            f"[red]Error:[/red] Invalid AI assistant '{', '.join(invalid) or value}'. Choose from: {', '.join(AGENT_CONFIG.keys())}"
+        )
+        raise typer.Exit(1)
+    return agents
+
+
+@app.command()
+def init(
+    project_name: str = typer.Argument(
+        None,
+        help="Name for your new project directory (optional if using --here, or use '.' for current directory)",
+    ),
+    ai_assistant: str = typer.Option(
+        None,
+        "--ai",
+        help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, amp, shai, q, agy, bob, or qoder (comma-separate several to set up multiple agents)",
+    ),
+    script_type: str = typer.Option(
+        None, "--script", help="Script type to use: sh or ps"
+    ),
+    ignore_agent_tools: bool = typer.Option(
+        False,
+        "--ignore-agent-tools",
+        help="Skip checks for AI agent tools like Claude Code",
+    ),
+    no_git: bool = typer.Option(
+        False, "--no-git", help="Skip git repository initialization"
+    ),
+    here: bool = typer.Option(
+        False,
+        "--here",
+        help="Initialize project in the current directory instead of creating a new one",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Force merge/overwrite when using --here (skip confirmation)",
+    ),
+    skip_tls: bool = typer.Option(
+        False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Show verbose diagnostic output for network and extraction failures",
+    ),
+    github_token: str = typer.Option(
+        None,
+        "--github-token",
+        help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the local template and release metadata caches and always download",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Use templates from a local bundle (see 'specify templates prefetch') without network access",
+    ),
+    bundle_dir: Path = typer.Option(
+        None,
+        "--bundle-dir",
+        help="Template bundle directory for --offline (or set SPECIFY_TEMPLATE_BUNDLE_DIR)",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Extract the template while it downloads (single agent, new project directory only; falls back when the server does not support range requests)",
+    ),
+):
+    """
+    Initialize a new Specify project from the latest template.
+
+    This command will:
+    1. Check that required tools are installed (git is optional)
+    2. Let you choose your AI assistant
+    3. Download the appropriate template from GitHub
+    4. Extract the template to a new project directory or current directory
+    5. Initialize a fresh git repository (if not --no-git and no existing repo)
+    6. Optionally set up AI assistant commands
+
+    Examples:
+        specify init my-project
+        specify init my-project --ai claude
+        specify init my-project --ai copilot --no-git
+        specify init --ignore-agent-tools my-project
+        specify init . --ai claude         # Initialize in current directory
+        specify init .                     # Initialize in current directory (interactive AI selection)
+        specify init --here --ai claude    # Alternative syntax for current directory
+        specify init --here --ai codex
+        specify init --here --ai codebuddy
+        specify init --here
+        specify init --here --force  # Skip confirmation when current directory not empty
+        specify init my-project --ai claude --offline  # Use templates from 'specify templates prefetch'
+        specify init my-project --ai claude,copilot  # Set up several agents at once
+    """
+
+    show_banner()
+
+    if project_name == ".":
+        here = True
+        project_name = None  # Clear project_name to use existing validation logic
+
+    if here and project_name:
+        console.print(
+            "[red]Error:[/red] Cannot specify both project name and --here flag"
+        )
+        raise typer.Exit(1)
+
+    if not here and not project_name:
+        console.print(
+            "[red]Error:[/red] Must specify either a project name, use '.' for current directory, or use --here flag"
+        )
+        raise typer.Exit(1)
+
+    if here:
+        project_name = Path.cwd().name
+        project_path = Path.cwd()
+
+        existing_items = list(project_path.iterdir())
+        if existing_items:
+            console.print(
+                f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)"
+            )
+            console.print(
+                "[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]"
+            )
+            if force:
+                console.print(
+                    "[cyan]--force supplied: skipping confirmation and proceeding with merge[/cyan]"
+                )
+            else:
+                response = typer.confirm("Do you want to continue?")
+                if not response:
+                    console.print("[yellow]Operation cancelled[/yellow]")
+                    raise typer.Exit(0)
+    else:
+        project_path = Path(project_name).resolve()
+        if project_path.exists():
+            error_panel = Panel(
+                f"Directory '[cyan]{project_name}[/cyan]' already exists\n"
+                "Please choose a different project name or remove the existing directory.",
+                title="[red]Directory Conflict[/red]",
+                border_style="red",
+                padding=(1, 2),
+            )
+            console.print()
+            console.print(error_panel)
+            raise typer.Exit(1)
+
+    current_dir = Path.cwd()
+
+    setup_lines = [
+        "[cyan]Specify Project Setup[/cyan]",
+        "",
+        f"{'Project':<15} [green]{project_path.name}[/green]",
+        f"{'Working Path':<15} [dim]{current_dir}[/dim]",
+    ]
+
+    if not here:
+        setup_lines.append(f"{'Target Path':<15} [dim]{project_path}[/dim]")
+
+    console.print(Panel("\n".join(setup_lines), border_style="cyan", padding=(1, 2)))
+
+    should_init_git = False
+    if not no_git:
+        should_init_git = check_tool("git")
+        if not should_init_git:
+            console.print(
+                "[yellow]Git not found - will skip repository initialization[/yellow]"
+            )
+
+    if ai_assistant:
+        selected_ais = _parse_ai_assistants(ai_assistant)
+    else:
+        # Create options dict for selection (agent_key: display_name)
+        ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
+        selected_ais = [
+            select_with_arrows(ai_choices, "Choose your AI assistant:", "copilot")
+        ]
+    selected_ai = ", ".join(selected_ais)
+
+    for agent_key in [] if ignore_agent_tools else selected_ais:
+        agent_config = AGENT_CONFIG.get(agent_key)
+        if agent_config and agent_config["requires_cli"]:
+            install_url = agent_config["install_url"]
+            if not check_tool(agent_key):
+                error_panel = Panel(
+                    f"[cyan]{agent_key}[/cyan] not found\n"
+                    f"Install from: [cyan]{install_url}[/cyan]\n"
+                    f"{agent_config['name']} is required to continue with this project type.\n\n"
+                    "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
+                    title="[red]Agent Detection Error[/red]",
+                    border_style="red",
+                    padding=(1, 2),
+                )
+                console.print()
+                console.print(error_panel)
+                raise typer.Exit(1)
+
+    if script_type:
+        if script_type not in SCRIPT_TYPE_CHOICES:
+            console.print(
+                f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}"
+            )
+            raise typer.Exit(1)
+        selected_script = script_type
+    else:
+        default_script = "ps" if os.name == "nt" else "sh"
+
+        if sys.stdin.isatty():
+            selected_script = select_with_arrows(
+                SCRIPT_TYPE_CHOICES,
+                "Choose script type (or press Enter)",
+                default_script,
+            )
+        else:
+            selected_script = default_script
+
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
+
+    tracker = StepTracker("Initialize Specify Project")
+
+    sys._specify_tracker_active = True
+
+    tracker.add("precheck", "Check required tools")
+    tracker.complete("precheck", "ok")
+    tracker.add("ai-select", "Select AI assistant")
+    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.add("script-select", "Select script type")
+    tracker.complete("script-select", selected_script)
+    for key, label in [
+        ("fetch", "Fetch latest release"),
+        ("download", "Download template"),
+        ("extract", "Extract template"),
+        ("zip-list", "Archive contents"),
+        ("extracted-summary", "Extraction summary"),
+        ("chmod", "Ensure scripts executable"),
+        ("constitution", "Constitution setup"),
+        ("ml-commands", "ML commands setup"),
+        ("cleanup", "Cleanup"),
+        ("git", "Initialize git repository"),
+        ("final", "Finalize"),
+    ]:
+        tracker.add(key, label)
+
+    # Track git error message outside Live context so it persists
+    git_error_message = None
+
+    from rich.live import Live
+
+    with Live(
+        tracker.render(), console=console, refresh_per_second=8, transient=True
+    ) as live:
+        tracker.attach_refresh(lambda: live.update(tracker.render()))
+        try:
+            # An offline init reads the bundle and must not build an SSL context
+            local_client = None if offline else network.get_client(verify=not skip_tls)
+
+            download_and_extract_template(
+                project_path,
+                selected_ais,
+                selected_script,
+                here,
+                verbose=False,
+                tracker=tracker,
+                client=local_client,
+                debug=debug,
+                github_token=github_token,
+                use_cache=not no_cache,
+                offline=offline,
+                bundle_dir=bundle_dir,
+                stream=stream,
+            )
+
+            ensure_executable_scripts(project_path, tracker=tracker)
+
+            ensure_constitution_from_template(project_path, tracker=tracker)
+
+            tracker.start("ml-commands")
+            for agent_key in selected_ais:
+                _add_ml_commands_to_project(
+                    project_path,
+                    verbose=False,
+                    ai_assistant=agent_key,
+                    script_type=selected_script,
+                )
+            tracker.complete("ml-commands", "5 ML command files added")
+
+            if not no_git:
+                tracker.start("git")
+                if is_git_repo(project_path):
+                    tracker.complete("git", "existing repo detected")
+                elif should_init_git:
+                    success, error_msg = init_git_repo(project_path, quiet=True)
+                    if success:
+                        tracker.complete("git", "initialized")
+                    else:
+                        tracker.error("git", "init failed")
+                        git_error_message = error_msg
+                else:
+                    tracker.skip("git", "git not available")
+            else:
+                tracker.skip("git", "--no-git flag")
+
+            tracker.complete("final", "project ready")
+        except Exception as e:
+            tracker.error("final", str(e))
+            console.print(
+                Panel(
+                    f"Initialization failed: {e}", title="Failure", border_style="red"
+                )
+            )
+            if debug:
+                _env_pairs = [
+                    ("Python", sys.version.split()[0]),
+                    ("Platform", sys.platform),
+                    ("CWD", str(Path.cwd())),
+                ]
+                _label_width = max(len(k) for k, _ in _env_pairs)
+                env_lines = [
+                    f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]"
+                    for k, v in _env_pairs
+                ]
+                console.print(
+                    Panel(
+                        "\n".join(env_lines),
+                        title="Debug Environment",
+                        border_style="magenta",
+                    )
+                )
+            if not here and project_path.exists():
+                shutil.rmtree(project_path)
+            raise typer.Exit(1)
+        finally:
+            pass
+
+    console.print(tracker.render())
+    console.print("\n[bold green]Project ready.[/bold green]")
+
+    # Show git error details if initialization failed
+    if git_error_message:
+        console.print()
+        git_error_panel = Panel(
+            f"[yellow]Warning:[/yellow] Git repository initialization failed\n\n"
+            f"{git_error_message}\n\n"
+            f"[dim]You can initialize git manually later with:[/dim]\n"
+            f"[cyan]cd {project_path if not here else '.'}[/cyan]\n"
+            f"[cyan]git init[/cyan]\n"
+            f"[cyan]git add .[/cyan]\n"
+            f'[cyan]git commit -m "Initial commit"[/cyan]',
+            title="[red]Git Initialization Failed[/red]",
+            border_style="red",
+            padding=(1, 2),
+        )
+        console.print(git_error_panel)
+
+    # Agent folder security notice
+    agent_folders = [
+        AGENT_CONFIG[agent_key]["folder"]
+        for agent_key in selected_ais
+        if agent_key in AGENT_CONFIG
+    ]
+    if agent_folders:
+        agent_folder = ", ".join(agent_folders)
+        security_notice = Panel(
+            f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
+            f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
+            title="[yellow]Agent Folder Security[/yellow]",
+            border_style="yellow",
+            padding=(1, 2),
+        )
+        console.print()
+        console.print(security_notice)
+
+    steps_lines = []
+    if not here:
+        steps_lines.append(
+            f"1. Go to the project folder: [cyan]cd {project_name}[/cyan]"
+        )
+        step_num = 2
+    else:
+        steps_lines.append("1. You're already in the project directory!")
+        step_num = 2
+
+    # Add Codex-specific setup step if needed
+    if "codex" in selected_ais:
+        codex_path = project_path / ".codex"
+        quoted_path = shlex.quote(str(codex_path))
+        if os.name == "nt":  # Windows
+            cmd = f"setx CODEX_HOME {quoted_path}"
+        else:  # Unix-like systems
+            cmd = f"export CODEX_HOME={quoted_path}"
+
+        steps_lines.append(
+            f"{step_num}. Set [cyan]CODEX_HOME[/cyan] environment variable before running Codex: [cyan]{cmd}[/cyan]"
+        )
+        step_num += 1
+
+    steps_lines.append(f"{step_num}. Start using slash commands with your AI agent:")
+
+    steps_lines.append(
+        "   2.1 [cyan]/speckit.constitution[/] - Establish project principles"
+    )
+    steps_lines.append(
+        "   2.2 [cyan]/speckit.specify[/] - Create baseline specification"
+    )
+    steps_lines.append("   2.3 [cyan]/speckit.plan[/] - Create implementation plan")
+    steps_lines.append("   2.4 [cyan]/speckit.tasks[/] - Generate actionable tasks")
+    steps_lines.append("   2.5 [cyan]/speckit.implement[/] - Execute implementation")
+
+    steps_panel = Panel(
+        "\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1, 2)
+    )
+    console.print()
+    console.print(steps_panel)
+
+    enhancement_lines = [
+        "Optional commands that you can use for your specs [bright_black](improve quality & confidence)[/bright_black]",
+        "",
+        f"○ [cyan]/speckit.clarify[/] [bright_black](optional)[/bright_black] - Ask structured questions to de-risk ambiguous areas before planning (run before [cyan]/speckit.plan[/] if used)",
+        f"○ [cyan]/speckit.analyze[/] [bright_black](optional)[/bright_black] - Cross-artifact consistency & alignment report (after [cyan]/speckit.tasks[/], before [cyan]/speckit.implement[/])",
+        f"○ [cyan]/speckit.checklist[/] [bright_black](optional)[/bright_black] - Generate quality checklists to validate requirements completeness, clarity, and consistency (after [cyan]/speckit.plan[/])",
+    ]
+    enhancements_panel = Panel(
+        "\n".join(enhancement_lines),
+        title="Enhancement Commands",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+    console.print()
+    console.print(enhancements_panel)
+
+
+@app.command("init-ml")
+def init_ml(
+    project_name: str = typer.Argument(
+        None,
+        help="Name for your new ML project directory (optional if using --here, or use '.' for current directory)",
+    ),
+    ai_assistant: str = typer.Option(
+        None,
+        "--ai",
+        help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, amp, shai, q, agy, bob, or qoder (comma-separate several to set up multiple agents)",
+    ),
+    script_type: str = typer.Option(
+        None, "--script", help="Script type to use: sh or ps"
+    ),
+    ignore_agent_tools: bool = typer.Option(
+        False,
+        "--ignore-agent-tools",
+        help="Skip checks for AI agent tools like Claude Code",
+    ),
+    no_git: bool = typer.Option(
+        False, "--no-git", help="Skip git repository initialization"
+    ),
+    here: bool = typer.Option(
+        False,
+        "--here",
+        help="Initialize project in the current directory instead of creating a new one",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Force merge/overwrite when using --here (skip confirmation)",
+    ),
+    skip_tls: bool = typer.Option(
+        False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Show verbose diagnostic output for network and extraction failures",
+    ),
+    github_token: str = typer.Option(
+        None,
+        "--github-token",
+        help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the local template and release metadata caches and always download",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Use templates from a local bundle (see 'specify templates prefetch') without network access",
+    ),
+    bundle_dir: Path = typer.Option(
+        None,
+        "--bundle-dir",
+        help="Template bundle directory for --offline (or set SPECIFY_TEMPLATE_BUNDLE_DIR)",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Extract the template while it downloads (single agent, new project directory only; falls back when the server does not support range requests)",
+    ),
+):
+    """
+    Initialize a new Specify ML project from the latest template.
+
+    This command will:
+    1. Check that required tools are installed (git is optional)
+    2. Let you choose your AI assistant
+    3. Download the appropriate template from GitHub
+    4. Extract the template to a new project directory or current directory
+    5. Initialize a fresh git repository (if not --no-git and no existing repo)
+    6. Set up ML-specific commands and templates
+
+    Examples:
+        specify init-ml my-ml-project
+        specify init-ml my-ml-project --ai claude
+        specify init-ml my-ml-project --ai copilot --no-git
+        specify init-ml --ignore-agent-tools my-ml-project
+        specify init-ml . --ai claude         # Initialize in current directory
+        specify init-ml .                     # Initialize in current directory (interactive AI selection)
+        specify init-ml --here --ai claude    # Alternative syntax for current directory
+        specify init-ml --here --ai codex
+        specify init-ml --here --ai codebuddy
+        specify init-ml --here
+        specify init-ml --here --force  # Skip confirmation when current directory not empty
+        specify init-ml my-ml-project --ai claude --offline  # Use templates from 'specify templates prefetch'
+        specify init-ml my-ml-project --ai claude,copilot  # Set up several agents at once
+    """
+
+    show_banner()
+
+    if project_name == ".":
+        here = True
+        project_name = None  # Clear project_name to use existing validation logic
+
+    if here and project_name:
+        console.print(
+            "[red]Error:[/red] Cannot specify both project name and --here flag"
+        )
+        raise typer.Exit(1)
+
+    if not here and not project_name:
+        console.print(
+            "[red]Error:[/red] Must specify either a project name, use '.' for current directory, or use --here flag"
+        )
+        raise typer.Exit(1)
+
+    if here:
+        project_name = Path.cwd().name
+        project_path = Path.cwd()
+
+        existing_items = list(project_path.iterdir())
+        if existing_items:
+            console.print(
+                f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)"
+            )
+            console.print(
+                "[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]"
+            )
+            if force:
+                console.print(
+                    "[cyan]--force supplied: skipping confirmation and proceeding with merge[/cyan]"
+                )
+            else:
+                response = typer.confirm("Do you want to continue?")
+                if not response:
+                    console.print("[yellow]Operation cancelled[/yellow]")
+                    raise typer.Exit(0)
+    else:
+        project_path = Path(project_name).resolve()
+        if project_path.exists():
+            error_panel = Panel(
+                f"Directory '[cyan]{project_name}[/cyan]' already exists\n"
+                "Please choose a different project name or remove the existing directory.",
+                title="[red]Directory Conflict[/red]",
+                border_style="red",
+                padding=(1, 2),
+            )
+            console.print()
+            console.print(error_panel)
+            raise typer.Exit(1)
+
+    current_dir = Path.cwd()
+
+    setup_lines = [
+        "[cyan]Specify ML Project Setup[/cyan]",
+        "",
+        f"{'Project':<15} [green]{project_path.name}[/green]",
+        f"{'Working Path':<15} [dim]{current_dir}[/dim]",
+    ]
+
+    if not here:
+        setup_lines.append(f"{'Target Path':<15} [dim]{project_path}[/dim]")
+
+    console.print(Panel("\n".join(setup_lines), border_style="cyan", padding=(1, 2)))
+
+    should_init_git = False
+    if not no_git:
+        should_init_git = check_tool("git")
+        if not should_init_git:
+            console.print(
+                "[yellow]Git not found - will skip repository initialization[/yellow]"
+            )
+
+    if ai_assistant:
+        selected_ais = _parse_ai_assistants(ai_assistant)
+    else:
+        # Create options dict for selection (agent_key: display_name)
+        ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
+        selected_ais = [
+            select_with_arrows(ai_choices, "Choose your AI assistant:", "copilot")
+        ]
+    selected_ai = ", ".join(selected_ais)
+
+    for agent_key in [] if ignore_agent_tools else selected_ais:
+        agent_config = AGENT_CONFIG.get(agent_key)
+        if agent_config and agent_config["requires_cli"]:
+            install_url = agent_config["install_url"]
+            if not check_tool(agent_key):
+                error_panel = Panel(
+                    f"[cyan]{agent_key}[/cyan] not found\n"
+                    f"Install from: [cyan]{install_url}[/cyan]\n"
+                    f"{agent_config['name']} is required to continue with this project type.\n\n"
+                    "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
+                    title="[red]Agent Detection Error[/red]",
+                    border_style="red",
+                    padding=(1, 2),
+                )
+                console.print()
+                console.print(error_panel)
+                raise typer.Exit(1)
+
+    if script_type:
+        if script_type not in SCRIPT_TYPE_CHOICES:
+            console.print(
+                f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}"
+            )
+            raise typer.Exit(1)
+        selected_script = script_type
+    else:
+        default_script = "ps" if os.name == "nt" else "sh"
+
+        if sys.stdin.isatty():
+            selected_script = select_with_arrows(
+                SCRIPT_TYPE_CHOICES,
+                "Choose script type (or press Enter)",
+                default_script,
+            )
+        else:
+            selected_script = default_script
+
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
+
+    tracker = StepTracker("Initialize Specify ML Project")
+
+    sys._specify_tracker_active = True
+
+    tracker.add("precheck", "Check required tools")
+    tracker.complete("precheck", "ok")
+    tracker.add("ai-select", "Select AI assistant")
+    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.add("script-select", "Select script type")
+    tracker.complete("script-select", selected_script)
+    for key, label in [
+        ("fetch", "Fetch latest release"),
+        ("download", "Download template"),
+        ("extract", "Extract template"),
+        ("zip-list", "Archive contents"),
+        ("extracted-summary", "Extraction summary"),
+        ("chmod", "Ensure scripts executable"),
+        ("constitution", "Constitution setup"),
+        ("ml-commands", "Add ML command files"),
+        ("ml-templates", "Add ML templates"),
+        ("ml-scripts", "Add ML scripts and configs"),
+        ("cleanup", "Cleanup"),
+        ("git", "Initialize git repository"),
+        ("final", "Finalize"),
+    ]:
+        tracker.add(key, label)
+
+    # Track git error message outside Live context so it persists
+    git_error_message = None
+
+    from rich.live import Live
+
+    with Live(
+        tracker.render(), console=console, refresh_per_second=8, transient=True
+    ) as live:
+        tracker.attach_refresh(lambda: live.update(tracker.render()))
+        try:
+            # An offline init reads the bundle and must not build an SSL context
+            local_client = None if offline else network.get_client(verify=not skip_tls)
+
+            download_and_extract_template(
+                project_path,
+                selected_ais,
+                selected_script,
+                here,
+                verbose=False,
+                tracker=tracker,
+                client=local_client,
+                debug=debug,
+                github_token=github_token,
+                use_cache=not no_cache,
+                offline=offline,
+                bundle_dir=bundle_dir,
+                stream=stream,
+            )
+
+            ensure_executable_scripts(project_path, tracker=tracker)
+
+            ensure_constitution_from_template(project_path, tracker=tracker)
+
+            tracker.start("ml-commands")
+            for agent_key in selected_ais:
+                _add_ml_commands_to_project(
+                    project_path,
+                    verbose=False,
+                    ai_assistant=agent_key,
+                    script_type=selected_script,
+                )
+            tracker.complete("ml-commands", "5 ML command files added")
+
+            tracker.start("ml-templates")
+            _add_ml_templates_to_project(project_path, verbose=False)
+            tracker.complete("ml-templates", "ML spec template added")
+
+            tracker.start("ml-scripts")
+            _add_ml_scripts_to_project(project_path, verbose=False)
+            tracker.complete("ml-scripts", "ML scripts and configs added")
+
+            if not no_git:
+                tracker.start("git")
+                if is_git_repo(project_path):
+                    tracker.complete("git", "existing repo detected")
+                elif should_init_git:
+                    success, error_msg = init_git_repo(project_path, quiet=True)
+                    if success:
+                        tracker.complete("git", "initialized")
+                    else:
+                        tracker.error("git", "init failed")
+                        git_error_message = error_msg
+                else:
+                    tracker.skip("git", "git not available")
+            else:
+                tracker.skip("git", "--no-git flag")
+
+            tracker.complete("final", "ML project ready")
+        except Exception as e:
+            tracker.error("final", str(e))
+            console.print(
+                Panel(
+                    f"Initialization failed: {e}", title="Failure", border_style="red"
+                )
+            )
+            if debug:
+                _env_pairs = [
+                    ("Python", sys.version.split()[0]),
+                    ("Platform", sys.platform),
+                    ("CWD", str(Path.cwd())),
+                ]
+                _label_width = max(len(k) for k, _ in _env_pairs)
+                env_lines = [
+                    f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]"
+                    for k, v in _env_pairs
+                ]
+                console.print(
+                    Panel(
+                        "\n".join(env_lines),
+                        title="Debug Environment",
+                        border_style="magenta",
+                    )
+                )
+            if not here and project_path.exists():
+                shutil.rmtree(project_path)
+            raise typer.Exit(1)
+        finally:
+            pass
+
+    console.print(tracker.render())
+    console.print("\n[bold green]ML project ready.[/bold green]")
+
+    # Show git error details if initialization failed
+    if git_error_message:
+        console.print()
+        git_error_panel = Panel(
+            f"[yellow]Warning:[/yellow] Git repository initialization failed\n\n"
+            f"{git_error_message}\n\n"
+            f"[dim]You can initialize git manually later with:[/dim]\n"
+            f"[cyan]cd {project_path if not here else '.'}[/cyan]\n"
+            f"[cyan]git init[/cyan]\n"
+            f"[cyan]git add .[/cyan]\n"
+            f'[cyan]git commit -m "Initial commit"[/cyan]',
+            title="[red]Git Initialization Failed[/red]",
+            border_style="red",
+            padding=(1, 2),
+        )
+        console.print(git_error_panel)
+
+    # Agent folder security notice
+    agent_folders = [
+        AGENT_CONFIG[agent_key]["folder"]
+        for agent_key in selected_ais
+        if agent_key in AGENT_CONFIG
+    ]
+    if agent_folders:
+        agent_folder = ", ".join(agent_folders)
+        security_notice = Panel(
+            f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
+            f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
+            title="[yellow]Agent Folder Security[/yellow]",
+            border_style="yellow",
+            padding=(1, 2),
+        )
+        console.print()
+        console.print(security_notice)
+
+    steps_lines = []
+    if not here:
+        steps_lines.append(
+            f"1. Go to the project folder: [cyan]cd {project_name}[/cyan]"
+        )
+        step_num = 2
+    else:
+        steps_lines.append("1. You're already in the project directory!")
+        step_num = 2
+
+    # Add Codex-specific setup step if needed
+    if "codex" in selected_ais:
+        codex_path = project_path / ".codex"
+        quoted_path = shlex.quote(str(codex_path))
+        if os.name == "nt":  # Windows
+            cmd = f"setx CODEX_HOME {quoted_path}"
+        else:  # Unix-like systems
+            cmd = f"export CODEX_HOME={quoted_path}"
+
+        steps_lines.append(
+            f"{step_num}. Set [cyan]CODEX_HOME[/cyan] environment variable before running Codex: [cyan]{cmd}[/cyan]"
+        )
+        step_num += 1
+
+    steps_lines.append(f"{step_num}. Start using ML slash commands with your AI agent:")
+
+    steps_lines.append(
+        "   2.1 [cyan]/speckit.specify-ml[/] - Create ML specification with ML-specific requirements"
+    )
+    steps_lines.append(
+        "   2.2 [cyan]/speckit.plan-ml[/] - Create ML implementation plan"
+    )
+    steps_lines.append(
+        "   2.3 [cyan]/speckit.tasks-ml[/] - Generate ML tasks with ML priorities"
+    )
+    steps_lines.append("   2.4 [cyan]/speckit.clarify-ml[/] - Clarify ML requirements")
+    steps_lines.append(
+        "   2.5 [cyan]/speckit.setup-ml[/] - Setup ML environment interactively"
+    )
+    steps_lines.append("   2.6 [cyan]/speckit.implement[/] - Execute implementation")
+
+    steps_panel = Panel(
+        "\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1, 2)
+    )
+    console.print()
+    console.print(steps_panel)
+
+    ml_features_lines = [
+        "ML-specific commands and templates have been added to your project.",
+        "",
+        "ML Commands:",
+        "  • /speckit.specify-ml - ML specification with metrics, data, validation requirements",
+        "  • /speckit.plan-ml - ML planning with architecture and MLOps phases",
+        "  • /speckit.tasks-ml - ML task breakdown with ML priorities",
+        "  • /speckit.clarify-ml - ML clarification with ML taxonomy",
+        "  • /speckit.setup-ml - Interactive ML environment setup",
+        "",
+        "ML Templates:",
+        "  • ml-spec-template.md - ML specification template",
+        "  • ml-plan-template.md - ML plan template",
+        "  • ml-tasks-template.md - ML tasks template",
+        "",
+        "Regular commands are still available:",
+        "  • /speckit.specify - General specification",
+        "  • /speckit.plan - General planning",
+        "  • /speckit.tasks - General tasks",
+        "  • /speckit.clarify - General clarification",
+    ]
+    ml_features_panel = Panel(
+        "\n".join(ml_features_lines),
+        title="ML-Specific Features",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+    console.print()
+    console.print(ml_features_panel)
+
+
+@app.command()
+def check():
+    """Check that all required tools are installed."""
+    show_banner()
+    console.print("[bold]Checking for installed tools...[/bold]\n")
+
+    tracker = StepTracker("Check Available Tools")
+
+    tracker.add("git", "Git version control")
+    git_ok = check_tool("git", tracker=tracker)
+
+    agent_results = {}
+    for agent_key, agent_config in AGENT_CONFIG.items():
+        agent_name = agent_config["name"]
+        requires_cli = agent_config["requires_cli"]
+
+        tracker.add(agent_key, agent_name)
+
+        if requires_cli:
+            agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
+        else:
+            # IDE-based agent - skip CLI check and mark as optional
+            tracker.skip(agent_key, "IDE-based, no CLI check")
+            agent_results[agent_key] = False  # Don't count IDE agents as "found"
+
+    # Check VS Code variants (not in agent config)
+    tracker.add("code", "Visual Studio Code")
+    code_ok = check_tool("code", tracker=tracker)
+
+    tracker.add("code-insiders", "Visual Studio Code Insiders")
+    code_insiders_ok = check_tool("code-insiders", tracker=tracker)
+
+    console.print(tracker.render())
+
+    console.print("\n[bold green]Specify CLI is ready to use![/bold green]")
+
+    if not git_ok:
+        console.print("[dim]Tip: Install git for repository management[/dim]")
+
+    if not any(agent_results.values()):
+        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
+
+
+@app.command()
+def version():
+    """Display version and system information."""
+    import platform
+    import importlib.metadata
+
+    show_banner()
+
+    # Get CLI version from package metadata
+    cli_version = "unknown"
+    try:
+        cli_version = importlib.metadata.version("specify-cli")
+    except Exception:
+        # Fallback: try reading from pyproject.toml if running from source
+        try:
+            import tomllib
+
+            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+            if pyproject_path.exists():
+                with open(pyproject_path, "rb") as f:
+                    data = tomllib.load(f)
+                    cli_version = data.get("project", {}).get("version", "unknown")
+        except Exception:
+            pass
+
+    # Fetch latest template release version
+    repo_owner = "github"
+    repo_name = "spec-kit"
+    api_url = f"{_github_api_url()}/repos/{repo_owner}/{repo_name}/releases/latest"
+
+    template_version = "unknown"
+    release_date = "unknown"
+
+    try:
+        _, release_data = _get_json_revalidated(
+            network.get_client(),
+            api_url,
+            headers=_github_auth_headers(),
+            timeout=10,
+            cache=HttpMetadataCache(),
+            # Informational only: one attempt, then report "unknown"
+            max_retries=0,
+        )
+        if release_data is not None:
+            template_version = release_data.get("tag_name", "unknown")
+            # Remove 'v' prefix if present
+            if template_version.startswith("v"):
+                template_version = template_version[1:]
+            release_date = release_data.get("published_at", "unknown")
+            if release_date != "unknown":
+                # Format the date nicely
+                try:
+                    dt = datetime.fromisoformat(release_date.replace("Z", "+00:00"))
+                    release_date = dt.strftime("%Y-%m-%d")
+                except Exception:
+                    pass
+    except Exception:
+        pass
+
+    from rich.table import Table
+
+    info_table = Table(show_header=False, box=None, padding=(0, 2))
+    info_table.add_column("Key", style="cyan", justify="right")
+    info_table.add_column("Value", style="white")
+
+    info_table.add_row("CLI Version", cli_version)
+    info_table.add_row("Template Version", template_version)
+    info_table.add_row("Released", release_date)
+    info_table.add_row("", "")
+    info_table.add_row("Python", platform.python_version())
+    info_table.add_row("Platform", platform.system())
+    info_table.add_row("Architecture", platform.machine())
+    info_table.add_row("OS Version", platform.version())
+
+    panel = Panel(
+        info_table,
+        title="[bold cyan]Specify CLI Information[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+    console.print(panel)
+    console.print()
+
+
+# ===== Template Commands =====
+
+templates_app = typer.Typer(
+    name="templates",
+    help="Manage release template bundles for offline init",
+    add_completion=False,
+)
+app.add_typer(templates_app, name="templates")
+
+
+@templates_app.command("prefetch")
+def templates_prefetch(
+    bundle_dir: Path = typer.Option(
+        None,
+        "--bundle-dir",
+        help="Directory to store the bundle in (or set SPECIFY_TEMPLATE_BUNDLE_DIR)",
+    ),
+    ai_assistant: str = typer.Option(
+        None,
+        "--ai",
+        help="Comma-separated AI assistants to fetch templates for (default: all)",
+    ),
+    script_type: str = typer.Option(
+        None, "--script", help="Script type to fetch: sh or ps (default: both)"
+    ),
+    skip_tls: bool = typer.Option(
+        False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Show verbose diagnostic output for network failures",
+    ),
+    github_token: str = typer.Option(
+        None,
+        "--github-token",
+        help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)",
+    ),
+):
+    """
+    Download release template archives into a local bundle for offline init.
+
+    The bundle directory can be copied to machines without network access
+    and used with 'specify init --offline'.
+
+    Examples:
+        specify templates prefetch
+        specify templates prefetch --ai claude,copilot --script sh
+        specify templates prefetch --bundle-dir ./specify-bundle
+    """
+    agents = list(AGENT_CONFIG.keys())
+    if ai_assistant:
+        agents = _parse_ai_assistants(ai_assistant)
+
+    script_types = list(SCRIPT_TYPE_CHOICES.keys())
+    if script_type:
+        if script_type not in SCRIPT_TYPE_CHOICES:
+            console.print(
+                f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}"
+            )
+            raise typer.Exit(1)
+        script_types = [script_type]
+
+    bundle = TemplateBundle(bundle_dir)
+    local_client = network.get_client(verify=not skip_tls)
+
+    console.print("[cyan]Fetching latest release information...[/cyan]")
+    try:
+        release_data = _fetch_latest_release(
+            local_client, debug=debug, github_token=github_token
+        )
+    except Exception as e:
+        console.print(f"[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+
+    release_tag = release_data["tag_name"]
+    wanted = []
+    for agent in agents:
+        for script in script_types:
+            asset = _find_template_asset(release_data.get("assets", []), agent, script)
+            if asset is not None and asset not in wanted:
+                wanted.append(asset)
+
+    if not wanted:
+        console.print(
+            f"[yellow]No matching template assets in release {release_tag}[/yellow]"
+        )
+        raise typer.Exit(1)
+
+    previous = bundle.load_manifest() or {}
+    if previous.get("release") == release_tag:
+        bundled_assets = dict(previous["assets"])
+    else:
+        # New release: drop archives from the previous one
+        for old_name in previous.get("assets", {}):
+            (bundle.root / old_name).unlink(missing_ok=True)
+        for part_path in bundle.root.glob("*.part"):
+            part_path.unlink(missing_ok=True)
+        bundled_assets = {}
+
+    bundle.root.mkdir(parents=True, exist_ok=True)
+    console.print(
+        f"[cyan]Release:[/cyan] {release_tag} ({len(wanted)} template archive(s))\n"
+    )
+
+    from .extensions import _file_lock
+
+    fetched = 0
+    failures = []
+    for asset in wanted:
+        name = asset["name"]
+        dest = bundle.root / name
+        expected_sha256 = _asset_sha256(asset)
+        existing = bundled_assets.get(name)
+        if (
+            existing
+            and dest.exists()
+            and dest.stat().st_size == asset["size"]
+            and (expected_sha256 is None or existing.get("sha256") == expected_sha256)
+        ):
+            console.print(f"  [dim]•[/dim] {name} [dim](already bundled)[/dim]")
+            continue
+
+        try:
+            # Interrupted downloads keep a .part file that the next run resumes;
+            # the lock keeps concurrent prefetches from appending to it together
+            with _file_lock(bundle.root / f"{name}.lock"):
+                digest = _download_release_asset(
+                    local_client,
+                    asset["browser_download_url"],
+                    dest,
+                    expected_size=asset["size"],
+                    debug=debug,
+                    github_token=github_token,
+                )
+            if expected_sha256 and digest != expected_sha256:
+                dest.unlink(missing_ok=True)
+                raise RuntimeError(
+                    f"checksum mismatch (expected {expected_sha256}, got {digest})"
+                )
+        except Exception as e:
+            failures.append(name)
+            console.print(f"  [red]✗[/red] {name}: {e}")
+            continue
+
+        bundled_assets[name] = {"sha256": digest, "size": dest.stat().st_size}
+        fetched += 1
+        console.print(f"  [green]✓[/green] {name} ({asset['size']:,} bytes)")
+
+    bundle.save_manifest(
+        {
+            "release": release_tag,
+            "published_at": release_data.get("published_at"),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "assets": bundled_assets,
+        }
+    )
+
+    console.print(
+        f"\n[green]✓[/green] Bundle ready: {bundle.root} "
+        f"({fetched} downloaded, {len(bundled_assets)} total)"
+    )
+    bundle_flag = f" --bundle-dir {shlex.quote(str(bundle.root))}" if bundle_dir else ""
+    console.print(
+        f"Use it with: [cyan]specify init <project> --offline{bundle_flag}[/cyan]"
+    )
+    if failures:
+        console.print(f"[red]Error:[/red] {len(failures)} archive(s) failed to download")
+        raise typer.Exit(1)
+
+
+# ===== Extension Commands =====
+
+extension_app = typer.Typer(
+    name="extension",
+    help="Manage spec-kit extensions",
+    add_completion=False,
+)
+app.add_typer(extension_app, name="extension")
+
+
+def get_speckit_version() -> str:
+    """Get current spec-kit version."""
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("specify-cli")
+    except Exception:
+        # Fallback: try reading from pyproject.toml
+        try:
+            import tomllib
+
+            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+            if pyproject_path.exists():
+                with open(pyproject_path, "rb") as f:
+                    data = tomllib.load(f)
+                    return data.get("project", {}).get("version", "unknown")
+        except Exception:
+            # Intentionally ignore any errors while reading/parsing pyproject.toml.
+            # If this lookup fails for any reason, we fall back to returning "unknown" below.
+            pass
+    return "unknown"
+
+
+@extension_app.command("list")
+def extension_list(
+    available: bool = typer.Option(
+        False, "--available", help="Show available extensions from catalog"
+    ),
+    all_extensions: bool = typer.Option(
+        False, "--all", help="Show both installed and available"
+    ),
+):
+    """List installed extensions."""
+    from .extensions import ExtensionManager
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    manager = ExtensionManager(project_root)
+    installed = manager.list_installed()
+
+    if not installed and not (available or all_extensions):
+        console.print("[yellow]No extensions installed.[/yellow]")
+        console.print("\nInstall an extension with:")
+        console.print("  specify extension add <extension-name>")
+        return
+
+    if installed:
+        console.print("\n[bold cyan]Installed Extensions:[/bold cyan]\n")
+
+        for ext in installed:
+            status_icon = "✓" if ext["enabled"] else "✗"
+            status_color = "green" if ext["enabled"] else "red"
+
+            console.print(
+                f"  [{status_color}]{status_icon}[/{status_color}] [bold]{ext['name']}[/bold] (v{ext['version']})"
+            )
+            console.print(f"     {ext['description']}")
+            console.print(
+                f"     Commands: {ext['command_count']} | Hooks: {ext['hook_count']} | Status: {'Enabled' if ext['enabled'] else 'Disabled'}"
+            )
+            console.print()
+
+    if available or all_extensions:
+        console.print("\nInstall an extension:")
+        console.print("  [cyan]specify extension add <name>[/cyan]")
+
+
+@extension_app.command("add")
+def extension_add(
+    extension: str = typer.Argument(help="Extension name or path"),
+    dev: bool = typer.Option(False, "--dev", help="Install from local directory"),
+    from_url: Optional[str] = typer.Option(
+        None, "--from", help="Install from custom URL"
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="Show per-agent command write times and file counts"
+    ),
+    install_mode: Optional[str] = typer.Option(
+        None,
+        "--install-mode",
+        help="With --dev: auto, copy, reflink, hardlink or symlink (link to the source directory)",
+    ),
+):
+    """Install an extension."""
+    from .extensions import (
+        ExtensionManager,
+        ExtensionCatalog,
+        ExtensionError,
+        ValidationError,
+        CompatibilityError,
+    )
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    if install_mode and not dev:
+        console.print("[red]Error:[/red] --install-mode can only be used with --dev")
+        raise typer.Exit(1)
+
+    manager = ExtensionManager(project_root)
+    speckit_version = get_speckit_version()
+
+    try:
+        with console.status(f"[cyan]Installing extension: {extension}[/cyan]"):
+            if dev:
+                # Install from local directory
+                source_path = Path(extension).expanduser().resolve()
+                if not source_path.exists():
+                    console.print(
+                        f"[red]Error:[/red] Directory not found: {source_path}"
+                    )
+                    raise typer.Exit(1)
+
+                if not (source_path / "extension.yml").exists():
+                    console.print(
+                        f"[red]Error:[/red] No extension.yml found in {source_path}"
+                    )
+                    raise typer.Exit(1)
+
+                manifest = manager.install_from_directory(
+                    source_path, speckit_version, install_mode=install_mode
+                )
+
+            elif from_url:
+                # Install from URL (ZIP file)
+                from urllib.parse import urlparse
+
+                import httpx
+
+                # Validate URL
+                parsed = urlparse(from_url)
+                is_localhost = parsed.hostname in ("localhost", "127.0.0.1", "::1")
+
+                if parsed.scheme != "https" and not (
+                    parsed.scheme == "http" and is_localhost
+                ):
+                    console.print("[red]Error:[/red] URL must use HTTPS for security.")
+                    console.print("HTTP is only allowed for localhost URLs.")
+                    raise typer.Exit(1)
+
+                # Warn about untrusted sources
+                console.print("[yellow]Warning:[/yellow] Installing from external URL.")
+                console.print("Only install extensions from sources you trust.\n")
+                console.print(f"Downloading from {from_url}...")
+
+                # Download ZIP to temp location
+                download_dir = (
+                    project_root / ".specify" / "extensions" / ".cache" / "downloads"
+                )
+                download_dir.mkdir(parents=True, exist_ok=True)
+                zip_path = download_dir / f"{extension}-url-download.zip"
+
+                try:
+                    # Streamed to disk, with the same size limit as catalog downloads
+                    network.download(
+                        from_url,
+                        zip_path,
+                        max_bytes=ExtensionCatalog(project_root).max_download_bytes(),
+                        timeout=60,
+                    )
+
+                    # Install from downloaded ZIP
+                    manifest = manager.install_from_zip(zip_path, speckit_version)
+                except network.DownloadTooLargeError as e:
+                    console.print(f"[red]Error:[/red] Extension download rejected: {e}")
+                    raise typer.Exit(1)
+                except httpx.HTTPError as e:
+                    console.print(
+                        f"[red]Error:[/red] Failed to download from {from_url}: {e}"
+                    )
+                    raise typer.Exit(1)
+                finally:
+                    # Clean up downloaded ZIP
+                    if zip_path.exists():
+                        zip_path.unlink()
+
+            else:
+                # Install from catalog
+                catalog = ExtensionCatalog(project_root)
+
+                # Check if extension exists in catalog
+                ext_info = catalog.get_extension_info(extension)
+                if not ext_info:
+                    console.print(
+                        f"[red]Error:[/red] Extension '{extension}' not found in catalog"
+                    )
+                    console.print("\nSearch available extensions:")
+                    console.print("  specify extension search")
+                    raise typer.Exit(1)
+
+                # Download extension ZIP
+                console.print(
+                    f"Downloading {ext_info['name']} v{ext_info.get('version', 'unknown')}..."
+                )
+                zip_path = catalog.download_extension(extension)
+
+                try:
+                    # Install from downloaded ZIP
+                    manifest = manager.install_from_zip(zip_path, speckit_version)
+                finally:
+                    # Clean up downloaded ZIP
+                    if zip_path.exists():
+                        zip_path.unlink()
+
+        console.print(f"\n[green]✓[/green] Extension installed successfully!")
+        console.print(f"\n[bold]{manifest.name}[/bold] (v{manifest.version})")
+        console.print(f"  {manifest.description}")
+        console.print(f"\n[bold cyan]Provided commands:[/bold cyan]")
+        for cmd in manifest.commands:
+            console.print(f"  • {cmd['name']} - {cmd.get('description', '')}")
+
+        if timings and manager.registration_timings:
+            console.print(f"\n[bold cyan]Command registration:[/bold cyan]")
+            for agent_name, seconds in manager.registration_timings.items():
+                console.print(f"  • {agent_name}: {seconds * 1000:.1f} ms")
+            counts = manager.registration_counts
+            console.print(
+                f"  {counts['written']} file(s) written, {counts['skipped']} already up to date"
+            )
+
+        console.print(f"\n[yellow]⚠[/yellow]  Configuration may be required")
+        console.print(f"   Check: .specify/extensions/{manifest.id}/")
+
+    except ValidationError as e:
+        console.print(f"\n[red]Validation Error:[/red] {e}")
+        raise typer.Exit(1)
+    except CompatibilityError as e:
+        console.print(f"\n[red]Compatibility Error:[/red] {e}")
+        raise typer.Exit(1)
+    except ExtensionError as e:
+        console.print(f"\n[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@extension_app.command("remove")
+def extension_remove(
+    extension: str = typer.Argument(help="Extension ID to remove"),
+    keep_config: bool = typer.Option(
+        False, "--keep-config", help="Don't remove config files"
+    ),
+    force: bool = typer.Option(False, "--force", help="Skip confirmation"),
+):
+    """Uninstall an extension."""
+    from .extensions import ExtensionManager
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    manager = ExtensionManager(project_root)
+
+    # Check if extension is installed
+    if not manager.registry.is_installed(extension):
+        console.print(f"[red]Error:[/red] Extension '{extension}' is not installed")
+        raise typer.Exit(1)
+
+    # Get extension info
+    ext_manifest = manager.get_extension(extension)
+    if ext_manifest:
+        ext_name = ext_manifest.name
+        cmd_count = len(ext_manifest.commands)
+    else:
+        ext_name = extension
+        cmd_count = 0
+
+    # Confirm removal
+    if not force:
+        console.print(f"\n[yellow]⚠  This will remove:[/yellow]")
+        console.print(f"   • {cmd_count} commands from AI agent")
+        console.print(f"   • Extension directory: .specify/extensions/{extension}/")
+        if not keep_config:
+            console.print(f"   • Config files (will be backed up)")
+        console.print()
+
+        confirm = typer.confirm("Continue?")
+        if not confirm:
+            console.print("Cancelled")
+            raise typer.Exit(0)
+
+    # Remove extension
+    success = manager.remove(extension, keep_config=keep_config)
+
+    if success:
+        console.print(f"\n[green]✓[/green] Extension '{ext_name}' removed successfully")
+        if keep_config:
+            console.print(
+                f"\nConfig files preserved in .specify/extensions/{extension}/"
+            )
+        else:
+            console.print(
+                f"\nConfig files backed up to .specify/extensions/.backup/{extension}/"
+            )
+        console.print(f"\nTo reinstall: specify extension add {extension}")
+    else:
+        console.print(f"[red]Error:[/red] Failed to remove extension")
+        raise typer.Exit(1)
+
+
+@extension_app.command("search")
+def extension_search(
+    query: str = typer.Argument(None, help="Search query (optional)"),
+    tag: Optional[str] = typer.Option(None, "--tag", help="Filter by tag"),
+    author: Optional[str] = typer.Option(None, "--author", help="Filter by author"),
+    verified: bool = typer.Option(
+        False, "--verified", help="Show only verified extensions"
+    ),
+):
+    """Search for available extensions in catalog."""
+    from .extensions import ExtensionCatalog, ExtensionError
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    catalog = ExtensionCatalog(project_root)
+
+    try:
+        console.print("🔍 Searching extension catalog...")
+        results = catalog.search(
+            query=query, tag=tag, author=author, verified_only=verified
+        )
+
+        if not results:
+            console.print("\n[yellow]No extensions found matching criteria[/yellow]")
+            if query or tag or author or verified:
+                console.print("\nTry:")
+                console.print("  • Broader search terms")
+                console.print("  • Remove filters")
+                console.print("  • specify extension search (show all)")
+            raise typer.Exit(0)
+
+        console.print(f"\n[green]Found {len(results)} extension(s):[/green]\n")
+
+        for ext in results:
+            # Extension header
+            verified_badge = " [green]✓ Verified[/green]" if ext.get("verified") else ""
+            console.print(
+                f"[bold]{ext['name']}[/bold] (v{ext['version']}){verified_badge}"
+            )
+            console.print(f"  {ext['description']}")
+
+            # Metadata
+            console.print(f"\n  [dim]Author:[/dim] {ext.get('author', 'Unknown')}")
+            if ext.get("tags"):
+                tags_str = ", ".join(ext["tags"])
+                console.print(f"  [dim]Tags:[/dim] {tags_str}")
+
+            # Stats
+            stats = []
+            if ext.get("downloads") is not None:
+                stats.append(f"Downloads: {ext['downloads']:,}")
+            if ext.get("stars") is not None:
+                stats.append(f"Stars: {ext['stars']}")
+            if stats:
+                console.print(f"  [dim]{' | '.join(stats)}[/dim]")
+
+            # Links
+            if ext.get("repository"):
+                console.print(f"  [dim]Repository:[/dim] {ext['repository']}")
+
+            # Install command
+            console.print(
+                f"\n  [cyan]Install:[/cyan] specify extension add {ext['id']}"
+            )
+            console.print()
+
+    except ExtensionError as e:
+        console.print(f"\n[red]Error:[/red] {e}")
+        console.print(
+            "\nTip: The catalog may be temporarily unavailable. Try again later."
+        )
+        raise typer.Exit(1)
+
+
+@extension_app.command("info")
+def extension_info(
+    extension: str = typer.Argument(help="Extension ID or name"),
+):
+    """Show detailed information about an extension."""
+    from .extensions import ExtensionCatalog, ExtensionManager, ExtensionError
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    catalog = ExtensionCatalog(project_root)
+    manager = ExtensionManager(project_root)
+
+    try:
+        ext_info = catalog.get_extension_info(extension)
+
+        if not ext_info:
+            console.print(
+                f"[red]Error:[/red] Extension '{extension}' not found in catalog"
+            )
+            console.print("\nTry: specify extension search")
+            raise typer.Exit(1)
+
+        # Header
+        verified_badge = (
+            " [green]✓ Verified[/green]" if ext_info.get("verified") else ""
+        )
+        console.print(
+            f"\n[bold]{ext_info['name']}[/bold] (v{ext_info['version']}){verified_badge}"
+        )
+        console.print(f"ID: {ext_info['id']}")
+        console.print()
+
+        # Description
+        console.print(f"{ext_info['description']}")
+        console.print()
+
+        # Author and License
+        console.print(f"[dim]Author:[/dim] {ext_info.get('author', 'Unknown')}")
+        console.print(f"[dim]License:[/dim] {ext_info.get('license', 'Unknown')}")
+        console.print()
+
+        # Requirements
+        if ext_info.get("requires"):
+            console.print("[bold]Requirements:[/bold]")
+            reqs = ext_info["requires"]
+            if reqs.get("speckit_version"):
+                console.print(f"  • Spec Kit: {reqs['speckit_version']}")
+            if reqs.get("tools"):
+                for tool in reqs["tools"]:
+                    tool_name = tool["name"]
+                    tool_version = tool.get("version", "any")
+                    required = " (required)" if tool.get("required") else " (optional)"
+                    console.print(f"  • {tool_name}: {tool_version}{required}")
+            console.print()
+
+        # Provides
+        if ext_info.get("provides"):
+            console.print("[bold]Provides:[/bold]")
+            provides = ext_info["provides"]
+            if provides.get("commands"):
+                console.print(f"  • Commands: {provides['commands']}")
+            if provides.get("hooks"):
+                console.print(f"  • Hooks: {provides['hooks']}")
+            console.print()
+
+        # Tags
+        if ext_info.get("tags"):
+            tags_str = ", ".join(ext_info["tags"])
+            console.print(f"[bold]Tags:[/bold] {tags_str}")
+            console.print()
+
+        # Statistics
+        stats = []
+        if ext_info.get("downloads") is not None:
+            stats.append(f"Downloads: {ext_info['downloads']:,}")
+        if ext_info.get("stars") is not None:
+            stats.append(f"Stars: {ext_info['stars']}")
+        if stats:
+            console.print(f"[bold]Statistics:[/bold] {' | '.join(stats)}")
+            console.print()
+
+        # Links
+        console.print("[bold]Links:[/bold]")
+        if ext_info.get("repository"):
+            console.print(f"  • Repository: {ext_info['repository']}")
+        if ext_info.get("homepage"):
+            console.print(f"  • Homepage: {ext_info['homepage']}")
+        if ext_info.get("documentation"):
+            console.print(f"  • Documentation: {ext_info['documentation']}")
+        if ext_info.get("changelog"):
+            console.print(f"  • Changelog: {ext_info['changelog']}")
+        console.print()
+
+        # Installation status and command
+        is_installed = manager.registry.is_installed(ext_info["id"])
+        if is_installed:
+            console.print("[green]✓ Installed[/green]")
+            console.print(f"\nTo remove: specify extension remove {ext_info['id']}")
+        else:
+            console.print("[yellow]Not installed[/yellow]")
+            console.print(
+                f"\n[cyan]Install:[/cyan] specify extension add {ext_info['id']}"
+            )
+
+    except ExtensionError as e:
+        console.print(f"\n[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@extension_app.command("update")
+def extension_update(
+    extension: str = typer.Argument(None, help="Extension ID to update (or all)"),
+):
+    """Update extension(s) to latest version."""
+    from .extensions import ExtensionManager, ExtensionCatalog, ExtensionError
+    from packaging import version as pkg_version
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    manager = ExtensionManager(project_root)
+    catalog = ExtensionCatalog(project_root)
+
+    try:
+        # Get list of extensions to update
+        if extension:
+            # Update specific extension
+            if not manager.registry.is_installed(extension):
+                console.print(
+                    f"[red]Error:[/red] Extension '{extension}' is not installed"
+                )
+                raise typer.Exit(1)
+            extensions_to_update = [extension]
+        else:
+            # Update all extensions
+            installed = manager.list_installed()
+            extensions_to_update = [ext["id"] for ext in installed]
+
+        if not extensions_to_update:
+            console.print("[yellow]No extensions installed[/yellow]")
+            raise typer.Exit(0)
+
+        console.print("🔄 Checking for updates...\n")
+
+        updates_available = []
+
+        for ext_id in extensions_to_update:
+            # Get installed version
+            metadata = manager.registry.get(ext_id)
+            installed_version = pkg_version.Version(metadata["version"])
+
+            # Get catalog info
+            ext_info = catalog.get_extension_info(ext_id)
+            if not ext_info:
+                console.print(f"⚠  {ext_id}: Not found in catalog (skipping)")
+                continue
+
+            catalog_version = pkg_version.Version(ext_info["version"])
+
+            if catalog_version > installed_version:
+                updates_available.append(
+                    {
+                        "id": ext_id,
+                        "installed": str(installed_version),
+                        "available": str(catalog_version),
+                        "download_url": ext_info.get("download_url"),
+                    }
+                )
+            else:
+                console.print(f"✓ {ext_id}: Up to date (v{installed_version})")
+
+        if not updates_available:
+            console.print("\n[green]All extensions are up to date![/green]")
+            raise typer.Exit(0)
+
+        # Show available updates
+        console.print("\n[bold]Updates available:[/bold]\n")
+        for update in updates_available:
+            console.print(
+                f"  • {update['id']}: {update['installed']} → {update['available']}"
+            )
+
+        console.print()
+        confirm = typer.confirm("Update these extensions?")
+        if not confirm:
+            console.print("Cancelled")
+            raise typer.Exit(0)
+
+        # Perform updates
+        console.print()
+        for update in updates_available:
+            ext_id = update["id"]
+            console.print(f"📦 Updating {ext_id}...")
+
+            # TODO: Implement download and reinstall from URL
+            # For now, just show  message
+            console.print(
+                f"[yellow]Note:[/yellow] Automatic update not yet implemented. "
+                f"Please update manually:"
+            )
+            console.print(f"  specify extension remove {ext_id} --keep-config")
+            console.print(f"  specify extension add {ext_id}")
+
+        console.print(
+            "\n[cyan]Tip:[/cyan] Automatic updates will be available in a future version"
+        )
+
+    except ExtensionError as e:
+        console.print(f"\n[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _set_extensions_enabled(extensions: List[str], enabled: bool):
+    """Enable or disable extensions, writing the registry and extensions.yml once."""
+    from .extensions import ExtensionManager, HookExecutor
+
+    project_root = Path.cwd()
+
+    # Check if we're in a spec-kit project
+    specify_dir = project_root / ".specify"
+    if not specify_dir.exists():
+        console.print(
+            "[red]Error:[/red] Not a spec-kit project (no .specify/ directory)"
+        )
+        console.print("Run this command from a spec-kit project root")
+        raise typer.Exit(1)
+
+    manager = ExtensionManager(project_root)
+    hook_executor = HookExecutor(project_root)
+    state = "enabled" if enabled else "disabled"
+
+    for extension in extensions:
+        if not manager.registry.is_installed(extension):
+            console.print(f"[red]Error:[/red] Extension '{extension}' is not installed")
+            raise typer.Exit(1)
+
+    changed = []
+    for extension in dict.fromkeys(extensions):
+        metadata = manager.registry.get(extension)
+        if metadata.get("enabled", True) == enabled:
+            console.print(f"[yellow]Extension '{extension}' is already {state}[/yellow]")
+        else:
+            changed.append(extension)
+
+    if not changed:
+        raise typer.Exit(0)
+
+    # Update registry and hooks in extensions.yml, one write each
+    with manager.registry.transaction():
+        for extension in changed:
+            manager.registry.update(extension, {"enabled": enabled})
+    hook_executor.set_hooks_enabled(changed, enabled)
+
+    for extension in changed:
+        console.print(f"[green]✓[/green] Extension '{extension}' {state}")
+    return changed
+
+
+@extension_app.command("enable")
+def extension_enable(
+    extensions: List[str] = typer.Argument(help="Extension ID(s) to enable"),
+):
+    """Enable disabled extensions."""
+    _set_extensions_enabled(extensions, True)
+
+
+@extension_app.command("disable")
+def extension_disable(
+    extensions: List[str] = typer.Argument(help="Extension ID(s) to disable"),
+):
+    """Disable extensions without removing them."""
+    changed = _set_extensions_enabled(extensions, False)
+
+    console.print(f"\nCommands will no longer be available. Hooks will not execute.")
+    console.print(f"To re-enable: specify extension enable {' '.join(changed)}")
+
+
+# ===== Hook Commands =====
+
+hooks_app = typer.Typer(
+    name="hooks",
+    help="Inspect extension hooks",
+    add_completion=False,
+)
+app.add_typer(hooks_app, name="hooks")
+
+
+@hooks_app.command("check")
+def hooks_check(
+    event: str = typer.Argument(help="Event name (e.g. after_tasks)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the result as JSON"),
+):
+    """Show the extension hooks to run for an event, with conditions evaluated."""
+    code = _hooks_fast.hooks_check(event, json_output)
+    if code:
+        raise typer.Exit(code)
+
+
+def _add_ml_templates_to_project(project_path: Path, verbose: bool = True) -> None:
+    """Copy ML template files from spec-kit repository to the project.
+
+    Args:
+        project_path: Path to the project directory
+        verbose: Whether to print verbose output
+    """
+    import shutil
+
+    repo_root = Path(__file__).parent.parent.parent
+    source_templates_dir = repo_root / "templates"
+    target_templates_dir = project_path / ".specify" / "templates"
+
+    target_templates_dir.mkdir(parents=True, exist_ok=True)
+
+    ml_templates = [
+        "ml-spec-template.md",
+    ]
+
+    for template_file in ml_templates:
+        source_path = source_templates_dir / template_file
+        target_path = target_templates_dir / template_file
+
+        if not source_path.exists():
+            if verbose:
+                console.print(
+                    f"[yellow]Warning:[/yellow] ML template not found: {source_path}"
+                )
+            continue
+
+        shutil.copy2(source_path, target_path)
+        if verbose:
+            console.print(f"[cyan]Copied ML template:[/cyan] {template_file}")
+
+
+def _add_ml_scripts_to_project(project_path: Path, verbose: bool = True) -> None:
+    """Copy ML scripts and config files from spec-kit repository to the project.
+
+    Args:
+        project_path: Path to the project directory
+        verbose: Whether to print verbose output
+    """
+    import shutil
+
+    repo_root = Path(__file__).parent.parent.parent
+    source_ml_dir = repo_root / ".ml-spec"
+    target_ml_dir = project_path / ".ml-spec"
+
+    if not source_ml_dir.exists():
+        if verbose:
+            console.print(
+                f"[yellow]Warning:[/yellow] ML scripts directory not found: {source_ml_dir}"
+            )
+        return
+
+    # Copy scripts
+    source_scripts_dir = source_ml_dir / "scripts"
+    target_scripts_dir = target_ml_dir / "scripts"
+
+    if source_scripts_dir.exists():
+        target_scripts_dir.mkdir(parents=True, exist_ok=True)
+
+        for script_file in ["check_environment.py", "setup-env.sh"]:
+            source_path = source_scripts_dir / script_file
+            target_path = target_scripts_dir / script_file
+
+            if source_path.exists():
+                shutil.copy2(source_path, target_path)
+                if verbose:
+                    console.print(f"[cyan]Copied ML script:[/cyan] {script_file}")
+            elif verbose:
+                console.print(
+                    f"[yellow]Warning:[/yellow] ML script not found: {source_path}"
+                )
+
+    # Copy config files
+    source_config_dir = source_ml_dir / "config"
+    target_config_dir = target_ml_dir / "config"
+
+    if source_config_dir.exists():
+        target_config_dir.mkdir(parents=True, exist_ok=True)
+
+        for config_file in source_config_dir.iterdir():
+            if config_file.is_file():
+                target_path = target_config_dir / config_file.name
+                shutil.copy2(config_file, target_path)
+                if verbose:
+                    console.print(f"[cyan]Copied ML config:[/cyan] {config_file.name}")
+
+    # Copy config.yaml
+    source_config_yaml = source_ml_dir / "config.yaml"
+    target_config_yaml = target_ml_dir / "config.yaml"
+
+    if source_config_yaml.exists():
+        shutil.copy2(source_config_yaml, target_config_yaml)
+        if verbose:
+            console.print(f"[cyan]Copied ML config:[/cyan] config.yaml")
+
+    # Copy Makefile
+    source_makefile = repo_root / "Makefile"
+    target_makefile = project_path / "Makefile"
+
+    if source_makefile.exists():
+        shutil.copy2(source_makefile, target_makefile)
+        if verbose:
+            console.print(f"[cyan]Copied Makefile[/cyan]")
+
+    # Copy ML examples to specs/ (for compatibility with standard project structure)
+    source_examples_dir = source_ml_dir / "examples"
+    target_specs_dir = project_path / "specs"
+
+    if source_examples_dir.exists():
+        target_specs_dir.mkdir(parents=True, exist_ok=True)
+
+        for example_dir in source_examples_dir.iterdir():
+            if example_dir.is_dir():
+                target_example_dir = target_specs_dir / f"000-{example_dir.name}"
+                if target_example_dir.exists():
+                    if verbose:
+                        console.print(
+                            f"[yellow]Skipping existing example:[/yellow] {example_dir.name}"
+                        )
+                    continue
+
+                shutil.copytree(example_dir, target_example_dir)
+                if verbose:
+                    console.print(
+                        f"[cyan]Copied ML example:[/cyan] {example_dir.name} → specs/000-{example_dir.name}"
+                    )
+
+
+def _add_ml_commands_to_project(
+    project_path: Path,
+    verbose: bool = True,
+    ai_assistant: str = "opencode",
+    script_type: str = "sh",
+) -> None:
+    """Copy ML command files from spec-kit repository and generate agent-specific commands.
+
+    Args:
+        project_path: Path to the project directory
+        verbose: Whether to print verbose output
+        ai_assistant: AI assistant to generate commands for (opencode, claude, etc.)
+        script_type: Script type to use (sh or ps)
+    """
+    import re
+    import shutil
+
+    repo_root = Path(__file__).parent.parent.parent
+    source_commands_dir = repo_root / "templates" / "commands"
+    target_commands_dir = project_path / ".specify" / "templates" / "commands"
+
+    target_commands_dir.mkdir(parents=True, exist_ok=True)
+
+    ml_commands = [
+        "specify-ml.md",
+        "plan-ml.md",
+        "tasks-ml.md",
+        "clarify-ml.md",
+        "setup-ml.md",
+    ]
+
+    # Copy ML command templates to .specify/templates/commands
+    for command_file in ml_commands:
+        source_path = source_commands_dir / command_file
+        target_path = target_commands_dir / command_file
+
+        if not source_path.exists():
+            if verbose:
+                console.print(
+                    f"[yellow]Warning:[/yellow] ML command template not found: {source_path}"
+                )
+            continue
+
+        shutil.copy2(source_path, target_path)
+        if verbose:
+            console.print(f"[cyan]Copied ML command template:[/cyan] {command_file}")
+
+    # Generate agent-specific ML commands (e.g., .opencode/command/)
+    agent_config = AGENT_CONFIG.get(ai_assistant)
+    if agent_config:
+        agent_folder = agent_config["folder"]
+        target_agent_commands_dir = project_path / agent_folder.rstrip("/")
+
+        # For folders like .claude/, .opencode/, create commands subdirectory
+        if agent_folder.endswith("/"):
+            target_agent_commands_dir = target_agent_commands_dir / "command"
+
+        target_agent_commands_dir.mkdir(parents=True, exist_ok=True)
+
+        for command_file in ml_commands:
+            source_path = source_commands_dir / command_file
+            target_path = target_agent_commands_dir / f"speckit.{command_file}"
+
+            if not source_path.exists():
+                if verbose:
+                    console.print(
+                        f"[yellow]Warning:[/yellow] ML command template not found: {source_path}"
+                    )
+                continue
+
+            # Extract script command from YAML frontmatter
+            try:
+                with open(source_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+
+                # Find script command in YAML frontmatter for the specified script type
+                pattern = rf'^\s+{script_type}:\s*"([^"]*)"'
+                script_match = re.search(pattern, content, re.MULTILINE)
+                script_command = script_match.group(1) if script_match else ""
+
+                # Replace {SCRIPT} placeholder with actual script command
+                updated_content = re.sub(r"\{SCRIPT\}", script_command, content)
+
+                # Remove scripts: section from frontmatter
+                # Match from "scripts:" to the next section start or end of frontmatter
+                updated_content = re.sub(
+                    r"scripts:\s*\n(?:\s+\w+:\s*.*\n)+",
+                    "",
+                    updated_content,
+                )
+
+                # Replace {ARGS} with $ARGUMENTS
+                updated_content = re.sub(r"\{ARGS\}", r"\$ARGUMENTS", updated_content)
+
+                # Replace __AGENT__ with agent name
+                updated_content = re.sub(r"__AGENT__", ai_assistant, updated_content)
+
+                # Rewrite paths from (/?) to .specify/
+                updated_content = re.sub(r"\(/?\)", r".specify/", updated_content)
+
+                with open(target_path, "w", encoding="utf-8") as f:
+                    f.write(updated_content)
+
+                if verbose:
+                    console.print(
+                        f"[cyan]Generated ML command:[/cyan] speckit.{command_file}"
+                    )
+
+            except Exception as e:
+                if verbose:
+                    console.print(
+                        f"[yellow]Warning:[/yellow] Failed to generate {command_file}: {e}"
+                    )
+
+
+def main():
+    app()
+
+
+if __name__ == "__main__":
+    main()
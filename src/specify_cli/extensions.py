@@ -6,19 +6,23 @@ Extensions are modular packages that add commands and functionality to spec-kit
 without bloating the core framework.
 """
 
+import copy
+import errno
 import json
 import hashlib
+import os
 import tempfile
+import time
 import zipfile
 import shutil
-from pathlib import Path
-from typing import Optional, Dict, List, Any
+import sys
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Optional, Dict, List, Any, Mapping, Set
 from datetime import datetime, timezone
 import re
 
-import yaml
-from packaging import version as pkg_version
-from packaging.specifiers import SpecifierSet, InvalidSpecifier
+from . import catalog_index, hook_conditions, network, yaml_io
 
 
 class ExtensionError(Exception):
@@ -55,12 +59,30 @@ class ExtensionManifest:
         self.data = self._load_yaml(manifest_path)
         self._validate()
 
+    @classmethod
+    def from_validated(cls, manifest_path: Path, data: dict) -> "ExtensionManifest":
+        """Build a manifest from data that already passed validation (no re-parse)."""
+        manifest = cls.__new__(cls)
+        manifest.path = manifest_path
+        manifest.data = data
+        return manifest
+
+    @classmethod
+    def from_data(cls, data: dict, manifest_path: Optional[Path] = None) -> "ExtensionManifest":
+        """Build a manifest from parsed YAML data, validating it.
+
+        Raises:
+            ValidationError: If the data is not a valid manifest
+        """
+        manifest = cls.from_validated(manifest_path, data)
+        manifest._validate()
+        return manifest
+
     def _load_yaml(self, path: Path) -> dict:
         """Load YAML file safely."""
         try:
-            with open(path, 'r') as f:
-                return yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
+            return yaml_io.load_file(path) or {}
+        except yaml_io.YAMLError as e:
             raise ValidationError(f"Invalid YAML in {path}: {e}")
         except FileNotFoundError:
             raise ValidationError(f"Manifest not found: {path}")
@@ -93,6 +115,8 @@ class ExtensionManifest:
             )
 
         # Validate semantic version
+        from packaging import version as pkg_version
+
         try:
             pkg_version.Version(ext["version"])
         except pkg_version.InvalidVersion:
@@ -161,45 +185,495 @@ class ExtensionManifest:
             return f"sha256:{hashlib.sha256(f.read()).hexdigest()}"
 
 
+# Process-wide memo of validated manifests: abspath -> (stat stamp, manifest)
+_MANIFEST_MEMO: Dict[str, tuple] = {}
+
+
+class ManifestCache:
+    """Cache of validated extension manifests, invalidated by file stat.
+
+    Lookups are served from a process-wide memo first, then from an on-disk
+    JSON cache (``.specify/extensions/.cache/manifests.json``) holding the
+    already-validated manifest data, so repeated ``extension list`` runs skip
+    both YAML parsing and validation. An entry is reused only while the
+    manifest's mtime, size and inode are unchanged. Returned manifests are
+    shared and must be treated as read-only.
+    """
+
+    CACHE_FILE = "manifests.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory of the on-disk cache; None keeps it in memory only
+        """
+        self.cache_dir = cache_dir
+        self.cache_file = cache_dir / self.CACHE_FILE if cache_dir else None
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+
+    def _disk_entries(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_file is not None:
+                try:
+                    with open(self.cache_file, 'r') as f:
+                        cached = json.load(f)
+                    if cached.get("format") == self.FORMAT_VERSION:
+                        self._entries = cached.get("manifests", {})
+                except (OSError, ValueError, AttributeError):
+                    pass
+        return self._entries
+
+    def get(self, manifest_path: Path) -> ExtensionManifest:
+        """Return the validated manifest at manifest_path.
+
+        Raises:
+            ValidationError: If the manifest is missing or invalid
+        """
+        key = os.path.abspath(manifest_path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            raise ValidationError(f"Manifest not found: {manifest_path}")
+        stamp = [st.st_mtime_ns, st.st_size, st.st_ino]
+
+        memo = _MANIFEST_MEMO.get(key)
+        if memo is not None and memo[0] == stamp:
+            return memo[1]
+
+        entry = self._disk_entries().get(key)
+        if entry is not None and entry.get("stat") == stamp:
+            manifest = ExtensionManifest.from_validated(manifest_path, entry["data"])
+        else:
+            manifest = ExtensionManifest(manifest_path)
+            if self.cache_file is not None:
+                try:
+                    json.dumps(manifest.data)
+                except (TypeError, ValueError):
+                    # YAML types without a JSON form (e.g. dates) stay memory-only
+                    pass
+                else:
+                    self._entries[key] = {"stat": stamp, "data": manifest.data}
+                    self._dirty = True
+
+        _MANIFEST_MEMO[key] = (stamp, manifest)
+        return manifest
+
+    def forget(self, manifest_path: Path):
+        """Drop the cached entry for manifest_path."""
+        key = os.path.abspath(manifest_path)
+        _MANIFEST_MEMO.pop(key, None)
+        if key in self._disk_entries():
+            del self._entries[key]
+            self._dirty = True
+
+    def flush(self):
+        """Write new entries to the on-disk cache; failures are ignored."""
+        if not self._dirty or self.cache_file is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_text(
+                self.cache_file,
+                json.dumps({"format": self.FORMAT_VERSION, "manifests": self._entries}),
+            )
+            self._dirty = False
+        except OSError:
+            pass
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Hold an exclusive advisory lock on lock_path for the duration of the block.
+
+    Uses flock on POSIX and msvcrt.locking on Windows; the lock file itself is
+    left in place.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _atomic_write_text(path: Path, text: str):
+    """Write text to path via a fsynced temporary file and an atomic rename."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ioctl request for a reflink clone of a whole file (Linux, <linux/fs.h>)
+_FICLONE = 0x40049409
+
+
+def _reflink(src: str, dst: str):
+    """Create dst as a copy-on-write clone of src.
+
+    Raises:
+        OSError: If the platform or filesystem does not support reflinks
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflinks are only supported on Linux")
+    import fcntl
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+
+
+class _TreeCloner:
+    """copytree copy_function that links or clones files instead of copying bytes.
+
+    "hardlink" tries a hardlink, then a reflink, then a copy; "reflink" tries
+    a reflink, then a copy. The first failure of a strategy disables it for
+    the rest of the tree, so a cross-device install costs one failed call.
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+
+    def __call__(self, src: str, dst: str) -> str:
+        if self.mode == "hardlink":
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                self.mode = "reflink"
+        if self.mode == "reflink":
+            try:
+                _reflink(src, dst)
+                shutil.copystat(src, dst)
+                return dst
+            except OSError:
+                self.mode = "copy"
+        return shutil.copy2(src, dst)
+
+
+def _extension_archive_members(
+    zf: zipfile.ZipFile,
+) -> tuple[List[tuple], str]:
+    """Return the members of an extension archive and its root directory.
+
+    Paths are checked lexically, without touching the filesystem. The root is
+    "" when ``extension.yml`` sits at the top of the archive, or the single
+    top-level directory holding it. Members are returned as (ZipInfo, path
+    relative to the root) pairs; anything outside the root is dropped.
+
+    Raises:
+        ValidationError: If a member path is unsafe or there is no extension.yml
+    """
+    entries = []
+    for info in zf.infolist():
+        rel = PurePosixPath(info.filename.replace("\\", "/"))
+        if rel.is_absolute() or ".." in rel.parts or ":" in (rel.parts or ("",))[0]:
+            raise ValidationError(
+                f"Unsafe path in ZIP archive: {info.filename} (potential path traversal)"
+            )
+        if rel.parts:
+            entries.append((info, rel))
+
+    names = {rel for _, rel in entries}
+    if PurePosixPath("extension.yml") in names:
+        return entries, ""
+
+    top_dirs = {
+        rel.parts[0] for info, rel in entries if len(rel.parts) > 1 or info.is_dir()
+    }
+    if len(top_dirs) == 1:
+        root = top_dirs.pop()
+        if PurePosixPath(root, "extension.yml") in names:
+            return [
+                (info, PurePosixPath(*rel.parts[1:]))
+                for info, rel in entries
+                if rel.parts[0] == root and len(rel.parts) > 1
+            ], root
+
+    raise ValidationError("No extension.yml found in ZIP file")
+
+
+class _InstallTransaction:
+    """Undo log for an extension install staged under a scratch directory.
+
+    Directories are moved into place with renames; files that are written in
+    place are first copied into the scratch directory. rollback() puts every
+    recorded path back the way it was, newest change first.
+    """
+
+    def __init__(self, scratch_dir: Path):
+        self.scratch_dir = scratch_dir
+        self._undo = []
+
+    def _backup_path(self) -> Path:
+        return self.scratch_dir / "backup" / str(len(self._undo))
+
+    def move_into_place(self, staged: Path, dest: Path):
+        """Rename staged to dest, keeping any existing dest for rollback."""
+        backup = None
+        if dest.exists() or dest.is_symlink():
+            backup = self._backup_path()
+            backup.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(dest, backup)
+        os.replace(staged, dest)
+        self._undo.append((dest, backup))
+
+    def preserve(self, paths: List[Path]):
+        """Record files about to be written in place so rollback can restore them."""
+        for path in paths:
+            backup = None
+            if path.exists() or path.is_symlink():
+                backup = self._backup_path()
+                backup.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, backup, follow_symlinks=False)
+            self._undo.append((path, backup))
+
+    def on_rollback(self, action):
+        """Run action() during rollback, in reverse order with the other changes."""
+        self._undo.append((action, None))
+
+    def rollback(self):
+        """Undo every recorded change; failures of single steps are ignored."""
+        for target, backup in reversed(self._undo):
+            try:
+                if callable(target):
+                    target()
+                    continue
+                if target.is_dir() and not target.is_symlink():
+                    shutil.rmtree(target)
+                elif target.exists() or target.is_symlink():
+                    target.unlink()
+                if backup is not None:
+                    os.replace(backup, target)
+            except Exception:
+                pass
+        self._undo = []
+
+
 class ExtensionRegistry:
-    """Manages the registry of installed extensions."""
+    """Manages the registry of installed extensions.
+
+    The registry is a JSON snapshot (``.registry``) that is only ever replaced
+    by an atomic rename, so a crash mid-write leaves the previous snapshot
+    intact. Mutations hold an exclusive lock on ``.registry.lock`` and first
+    pick up changes made by other processes.
+
+    In log mode each mutation appends one line to ``.registry.log`` instead of
+    rewriting the snapshot, and the log is folded back into the snapshot once
+    it outgrows the registry. Loading always replays the log, so both modes
+    read each other's files. The mode comes from the ``mode`` argument or
+    ``SPECIFY_REGISTRY_MODE``; ``auto`` (the default) switches to log mode for
+    registries with LOG_MODE_THRESHOLD or more extensions.
+    """
 
     REGISTRY_FILE = ".registry"
+    LOG_FILE = ".registry.log"
+    LOCK_FILE = ".registry.lock"
     SCHEMA_VERSION = "1.0"
+    MODES = ("auto", "snapshot", "log")
+    LOG_MODE_THRESHOLD = 100
+    COMPACT_MIN_ENTRIES = 256
 
-    def __init__(self, extensions_dir: Path):
+    def __init__(self, extensions_dir: Path, mode: Optional[str] = None):
         """Initialize registry.
 
         Args:
             extensions_dir: Path to .specify/extensions/ directory
+            mode: "snapshot", "log" or "auto" (default: SPECIFY_REGISTRY_MODE or "auto")
+
+        Raises:
+            ExtensionError: If the mode is unknown
         """
+        mode = (mode or os.environ.get("SPECIFY_REGISTRY_MODE") or "auto").strip().lower()
+        if mode not in self.MODES:
+            raise ExtensionError(
+                f"Unknown registry mode '{mode}' (expected one of: {', '.join(self.MODES)})"
+            )
+        self.mode = mode
         self.extensions_dir = extensions_dir
         self.registry_path = extensions_dir / self.REGISTRY_FILE
+        self.log_path = extensions_dir / self.LOG_FILE
+        self.lock_path = extensions_dir / self.LOCK_FILE
+        self._snapshot_stat = None
+        self._log_stat = None
+        self._log_offset = 0
+        self._log_entries = 0
+        self._depth = 0
+        self._pending = []
         self.data = self._load()
 
+    @staticmethod
+    def _stat_key(path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _empty(self) -> dict:
+        return {
+            "schema_version": self.SCHEMA_VERSION,
+            "extensions": {}
+        }
+
     def _load(self) -> dict:
-        """Load registry from disk."""
-        if not self.registry_path.exists():
-            return {
-                "schema_version": self.SCHEMA_VERSION,
-                "extensions": {}
-            }
+        """Load the snapshot from disk and replay the mutation log on top of it."""
+        self._snapshot_stat = self._stat_key(self.registry_path)
+        self._log_offset = 0
+        self._log_entries = 0
 
+        data = self._empty()
+        if self._snapshot_stat is not None:
+            try:
+                with open(self.registry_path, 'r') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError):
+                # Corrupted or missing registry, start fresh
+                data = self._empty()
+
+        self._replay_log(data)
+        return data
+
+    def _replay_log(self, data: dict):
+        """Apply log entries written since the last replay to data."""
         try:
-            with open(self.registry_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            # Corrupted or missing registry, start fresh
-            return {
-                "schema_version": self.SCHEMA_VERSION,
-                "extensions": {}
-            }
+            with open(self.log_path, 'rb') as f:
+                f.seek(self._log_offset)
+                tail = f.read()
+        except FileNotFoundError:
+            self._log_stat = None
+            self._log_offset = 0
+            return
+
+        consumed = 0
+        for line in tail.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                # Torn final write; it is retried or discarded by its writer
+                break
+            consumed += len(line)
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._apply(data, entry)
+            self._log_entries += 1
+        self._log_offset += consumed
+        self._log_stat = self._stat_key(self.log_path)
+
+    @staticmethod
+    def _apply(data: dict, entry: dict):
+        extensions = data.setdefault("extensions", {})
+        if entry.get("op") == "add":
+            extensions[entry["id"]] = entry["metadata"]
+        elif entry.get("op") == "remove":
+            extensions.pop(entry["id"], None)
+
+    def _refresh(self):
+        """Pick up changes other processes committed since we last read."""
+        log_stat = self._stat_key(self.log_path)
+        log_replaced = (
+            (log_stat is None) != (self._log_stat is None)
+            or (log_stat is not None and log_stat[0] != self._log_stat[0])
+            or (log_stat is not None and log_stat[1] < self._log_offset)
+        )
+        if self._stat_key(self.registry_path) != self._snapshot_stat or log_replaced:
+            self.data = self._load()
+        else:
+            self._replay_log(self.data)
+
+    def _use_log(self) -> bool:
+        if self.mode == "auto":
+            return len(self.data["extensions"]) >= self.LOG_MODE_THRESHOLD
+        return self.mode == "log"
 
     def _save(self):
-        """Save registry to disk."""
+        """Save the full registry snapshot atomically and drop the log it supersedes."""
         self.extensions_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.registry_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        _atomic_write_text(self.registry_path, json.dumps(self.data, indent=2))
+        self.log_path.unlink(missing_ok=True)
+        self._snapshot_stat = self._stat_key(self.registry_path)
+        self._log_stat = None
+        self._log_offset = 0
+        self._log_entries = 0
+
+    def _append_log(self, entries: list):
+        """Append mutation entries to the log with a single fsynced write."""
+        payload = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        with open(self.log_path, 'ab') as f:
+            f.write(payload.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self._log_offset = f.tell()
+        self._log_stat = self._stat_key(self.log_path)
+        self._log_entries += len(entries)
+
+    def _commit(self):
+        entries, self._pending = self._pending, []
+        if not entries:
+            return
+        if not self._use_log():
+            self._save()
+        elif self._log_entries + len(entries) > max(self.COMPACT_MIN_ENTRIES, len(self.data["extensions"])):
+            self._save()
+        else:
+            self._append_log(entries)
+
+    @contextmanager
+    def transaction(self):
+        """Group several mutations under one lock and a single write.
+
+        Other processes' changes are loaded on entry; everything added or
+        removed inside the block is persisted when the outermost block exits.
+        """
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+
+        with _file_lock(self.lock_path):
+            self._refresh()
+            self._depth = 1
+            try:
+                yield self
+            except BaseException:
+                # Discard the in-memory changes of the failed block
+                self._pending = []
+                self.data = self._load()
+                raise
+            finally:
+                self._depth = 0
+            self._commit()
+
+    def _mutate(self, entry: dict):
+        with self.transaction():
+            self._apply(self.data, entry)
+            self._pending.append(entry)
 
     def add(self, extension_id: str, metadata: dict):
         """Add extension to registry.
@@ -208,11 +682,30 @@ class ExtensionRegistry:
             extension_id: Extension ID
             metadata: Extension metadata (version, source, etc.)
         """
-        self.data["extensions"][extension_id] = {
-            **metadata,
-            "installed_at": datetime.now(timezone.utc).isoformat()
-        }
-        self._save()
+        self._mutate({
+            "op": "add",
+            "id": extension_id,
+            "metadata": {
+                **metadata,
+                "installed_at": datetime.now(timezone.utc).isoformat()
+            },
+        })
+
+    def update(self, extension_id: str, changes: dict):
+        """Update fields of an installed extension, keeping its install time.
+
+        Args:
+            extension_id: Extension ID
+            changes: Metadata fields to set
+
+        Raises:
+            ExtensionError: If the extension is not installed
+        """
+        with self.transaction():
+            current = self.data["extensions"].get(extension_id)
+            if current is None:
+                raise ExtensionError(f"Extension '{extension_id}' is not installed")
+            self._mutate({"op": "add", "id": extension_id, "metadata": {**current, **changes}})
 
     def remove(self, extension_id: str):
         """Remove extension from registry.
@@ -220,8 +713,14 @@ class ExtensionRegistry:
         Args:
             extension_id: Extension ID
         """
-        if extension_id in self.data["extensions"]:
-            del self.data["extensions"][extension_id]
+        with self.transaction():
+            if extension_id in self.data["extensions"]:
+                self._mutate({"op": "remove", "id": extension_id})
+
+    def compact(self):
+        """Fold the mutation log into a fresh snapshot."""
+        with _file_lock(self.lock_path):
+            self._refresh()
             self._save()
 
     def get(self, extension_id: str) -> Optional[dict]:
@@ -258,6 +757,10 @@ class ExtensionRegistry:
 class ExtensionManager:
     """Manages extension lifecycle: installation, removal, updates."""
 
+    # Scratch space for installs in progress, under the extensions directory
+    STAGING_DIR = ".staging"
+    INSTALL_MODES = ("auto", "copy", "reflink", "hardlink", "symlink")
+
     def __init__(self, project_root: Path):
         """Initialize extension manager.
 
@@ -267,6 +770,10 @@ class ExtensionManager:
         self.project_root = project_root
         self.extensions_dir = project_root / ".specify" / "extensions"
         self.registry = ExtensionRegistry(self.extensions_dir)
+        self.manifests = ManifestCache(self.extensions_dir / ".cache")
+        # Per-agent command write times (seconds) and file counts of the last install
+        self.registration_timings: Dict[str, float] = {}
+        self.registration_counts: Dict[str, int] = {}
 
     def check_compatibility(
         self,
@@ -285,6 +792,9 @@ class ExtensionManager:
         Raises:
             CompatibilityError: If extension is incompatible
         """
+        from packaging import version as pkg_version
+        from packaging.specifiers import SpecifierSet, InvalidSpecifier
+
         required = manifest.requires_speckit_version
         current = pkg_version.Version(speckit_version)
 
@@ -306,14 +816,35 @@ class ExtensionManager:
         self,
         source_dir: Path,
         speckit_version: str,
-        register_commands: bool = True
+        register_commands: bool = True,
+        install_mode: Optional[str] = None
     ) -> ExtensionManifest:
         """Install extension from a local directory.
 
+        The extension is copied into a scratch directory under ``.staging/``
+        and renamed into place. ``install_mode`` selects how files get there:
+
+        - ``copy``: copy every file
+        - ``reflink``: copy-on-write clones where the filesystem supports
+          them (btrfs, XFS), copies elsewhere
+        - ``hardlink``: hardlinks on the same filesystem, then reflinks, then
+          copies; installed files share their inode with the source, so
+          editing one edits the other
+        - ``symlink``: the extension directory is a symlink to source_dir, so
+          source edits show up without reinstalling (for development)
+        - ``auto`` (default, or ``SPECIFY_INSTALL_MODE``): ``reflink``, which
+          falls back to copies where clones are not supported; the installed
+          files behave exactly like a copy
+
+        Command files and hooks are then registered and the registry entry is
+        added last. If any step fails, the extension directory, the command
+        files and the hooks are restored to their previous state.
+
         Args:
             source_dir: Path to extension directory
             speckit_version: Current spec-kit version
             register_commands: If True, register commands with AI agents
+            install_mode: "auto", "copy", "reflink", "hardlink" or "symlink"
 
         Returns:
             Installed extension manifest
@@ -321,49 +852,123 @@ class ExtensionManager:
         Raises:
             ValidationError: If manifest is invalid
             CompatibilityError: If extension is incompatible
+            ExtensionError: If the extension is already installed or the mode is unknown
         """
+        install_mode = (
+            install_mode or os.environ.get("SPECIFY_INSTALL_MODE") or "auto"
+        ).strip().lower()
+        if install_mode not in self.INSTALL_MODES:
+            raise ExtensionError(
+                f"Unknown install mode '{install_mode}' "
+                f"(expected one of: {', '.join(self.INSTALL_MODES)})"
+            )
+
         # Load and validate manifest
         manifest_path = source_dir / "extension.yml"
         manifest = ExtensionManifest(manifest_path)
 
-        # Check compatibility
+        self._check_installable(manifest, speckit_version)
+
+        def populate(staged_dir: Path):
+            if install_mode == "symlink":
+                staged_dir.symlink_to(Path(source_dir).resolve(), target_is_directory=True)
+            elif install_mode == "copy":
+                shutil.copytree(source_dir, staged_dir)
+            else:
+                clone_mode = "reflink" if install_mode == "auto" else install_mode
+                shutil.copytree(source_dir, staged_dir, copy_function=_TreeCloner(clone_mode))
+
+        return self._install_staged(manifest, populate, install_mode, register_commands)
+
+    def _check_installable(self, manifest: ExtensionManifest, speckit_version: str):
+        """Raise if manifest cannot be installed into this project.
+
+        Raises:
+            CompatibilityError: If extension is incompatible
+            ExtensionError: If the extension is already installed
+        """
         self.check_compatibility(manifest, speckit_version)
 
-        # Check if already installed
         if self.registry.is_installed(manifest.id):
             raise ExtensionError(
                 f"Extension '{manifest.id}' is already installed. "
                 f"Use 'specify extension remove {manifest.id}' first."
             )
 
-        # Install extension
-        dest_dir = self.extensions_dir / manifest.id
-        if dest_dir.exists():
-            shutil.rmtree(dest_dir)
+    def _install_staged(
+        self,
+        manifest: ExtensionManifest,
+        populate,
+        install_mode: str,
+        register_commands: bool = True
+    ) -> ExtensionManifest:
+        """Stage an extension, move it into place and register it; any failure rolls back.
 
-        shutil.copytree(source_dir, dest_dir)
+        Args:
+            manifest: Validated manifest of the extension
+            populate: Callable creating the extension tree at the path it is given
+            install_mode: Install mode recorded in the registry
+            register_commands: If True, register commands with AI agents
 
-        # Register commands with AI agents
-        registered_commands = {}
-        if register_commands:
-            registrar = CommandRegistrar()
-            # Register for all detected agents
-            registered_commands = registrar.register_commands_for_all_agents(
-                manifest, dest_dir, self.project_root
-            )
+        Returns:
+            The installed manifest
+        """
+        staging_root = self.extensions_dir / self.STAGING_DIR
+        staging_root.mkdir(parents=True, exist_ok=True)
+        scratch_dir = Path(tempfile.mkdtemp(dir=staging_root, prefix=f"{manifest.id}-"))
+        transaction = _InstallTransaction(scratch_dir)
 
-        # Register hooks
-        hook_executor = HookExecutor(self.project_root)
-        hook_executor.register_hooks(manifest)
+        try:
+            populate(scratch_dir / manifest.id)
+
+            dest_dir = self.extensions_dir / manifest.id
+            transaction.move_into_place(scratch_dir / manifest.id, dest_dir)
+
+            # Register commands with AI agents
+            registered_commands = {}
+            if register_commands:
+                registrar = CommandRegistrar()
+                # Register for all detected agents
+                transaction.preserve(registrar.command_files(
+                    registrar.detect_agents(self.project_root), manifest, self.project_root
+                ))
+                registered_commands = registrar.register_commands_for_all_agents(
+                    manifest, dest_dir, self.project_root
+                )
+                self.registration_timings = registrar.timings
+                self.registration_counts = {"written": registrar.written, "skipped": registrar.skipped}
+
+            # Register hooks
+            hook_executor = HookExecutor(self.project_root)
+            if manifest.hooks:
+                previous_hooks = hook_executor.get_extension_hooks(manifest.id)
+                previous_positions = hook_executor.get_extension_hook_positions(manifest.id)
+                transaction.on_rollback(
+                    lambda: hook_executor.restore_hooks(
+                        manifest.id, previous_hooks, previous_positions
+                    )
+                )
+            hook_executor.register_hooks(manifest)
 
-        # Update registry
-        self.registry.add(manifest.id, {
-            "version": manifest.version,
-            "source": "local",
-            "manifest_hash": manifest.get_hash(),
-            "enabled": True,
-            "registered_commands": registered_commands
-        })
+            # Update registry; this commits the install
+            with self.registry.transaction():
+                if self.registry.is_installed(manifest.id):
+                    raise ExtensionError(
+                        f"Extension '{manifest.id}' was installed concurrently by another process."
+                    )
+                self.registry.add(manifest.id, {
+                    "version": manifest.version,
+                    "source": "local",
+                    "manifest_hash": manifest.get_hash(),
+                    "enabled": True,
+                    "install_mode": install_mode,
+                    "registered_commands": registered_commands
+                })
+        except BaseException:
+            transaction.rollback()
+            raise
+        finally:
+            shutil.rmtree(scratch_dir, ignore_errors=True)
 
         return manifest
 
@@ -374,6 +979,11 @@ class ExtensionManager:
     ) -> ExtensionManifest:
         """Install extension from ZIP file.
 
+        Member paths are validated lexically and ``extension.yml`` is read
+        and checked straight from the archive, so a bad package fails before
+        anything is written. The extension files are then extracted in one
+        pass into the staged install directory.
+
         Args:
             zip_path: Path to extension ZIP file
             speckit_version: Current spec-kit version
@@ -385,41 +995,37 @@ class ExtensionManager:
             ValidationError: If manifest is invalid
             CompatibilityError: If extension is incompatible
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_path = Path(tmpdir)
-
-            # Extract ZIP safely (prevent Zip Slip attack)
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Validate all paths first before extracting anything
-                temp_path_resolved = temp_path.resolve()
-                for member in zf.namelist():
-                    member_path = (temp_path / member).resolve()
-                    # Use is_relative_to for safe path containment check
-                    try:
-                        member_path.relative_to(temp_path_resolved)
-                    except ValueError:
-                        raise ValidationError(
-                            f"Unsafe path in ZIP archive: {member} (potential path traversal)"
-                        )
-                # Only extract after all paths are validated
-                zf.extractall(temp_path)
-
-            # Find extension directory (may be nested)
-            extension_dir = temp_path
-            manifest_path = extension_dir / "extension.yml"
-
-            # Check if manifest is in a subdirectory
-            if not manifest_path.exists():
-                subdirs = [d for d in temp_path.iterdir() if d.is_dir()]
-                if len(subdirs) == 1:
-                    extension_dir = subdirs[0]
-                    manifest_path = extension_dir / "extension.yml"
-
-            if not manifest_path.exists():
-                raise ValidationError("No extension.yml found in ZIP file")
-
-            # Install from extracted directory
-            return self.install_from_directory(extension_dir, speckit_version)
+        try:
+            zf = zipfile.ZipFile(zip_path, 'r')
+        except zipfile.BadZipFile as e:
+            raise ValidationError(f"Invalid ZIP file {zip_path}: {e}")
+
+        with zf:
+            members, root = _extension_archive_members(zf)
+            manifest_name = f"{root}/extension.yml" if root else "extension.yml"
+            try:
+                manifest_data = yaml_io.load(zf.read(manifest_name)) or {}
+            except yaml_io.YAMLError as e:
+                raise ValidationError(f"Invalid YAML in {manifest_name}: {e}")
+
+            manifest = ExtensionManifest.from_data(manifest_data)
+            # Where extension.yml will be once installed
+            manifest.path = self.extensions_dir / manifest.id / "extension.yml"
+
+            self._check_installable(manifest, speckit_version)
+
+            def populate(staged_dir: Path):
+                staged_dir.mkdir()
+                for info, rel in members:
+                    target = staged_dir.joinpath(*rel.parts)
+                    if info.is_dir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with zf.open(info) as src, open(target, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+            return self._install_staged(manifest, populate, "zip")
 
     def remove(self, extension_id: str, keep_config: bool = False) -> bool:
         """Remove an installed extension.
@@ -452,9 +1058,21 @@ class ExtensionManager:
 
                 for cmd_name in cmd_names:
                     cmd_file = commands_dir / f"{cmd_name}{agent_config['extension']}"
-                    if cmd_file.exists():
+                    # Alias symlinks dangle once their command file is gone
+                    if cmd_file.is_symlink() or cmd_file.exists():
                         cmd_file.unlink()
 
+        if extension_dir.is_symlink():
+            # Symlink install: keep copies of the config files and drop the
+            # link without touching the source directory
+            linked_dir = extension_dir.resolve()
+            extension_dir.unlink()
+            extension_dir.mkdir()
+            for config_file in list(linked_dir.glob("*-config.yml")) + list(
+                linked_dir.glob("*-config.local.yml")
+            ):
+                shutil.copy2(config_file, extension_dir / config_file.name)
+
         if keep_config:
             # Preserve config files, only remove non-config files
             if extension_dir.exists():
@@ -489,6 +1107,9 @@ class ExtensionManager:
             if extension_dir.exists():
                 shutil.rmtree(extension_dir)
 
+        self.manifests.forget(extension_dir / "extension.yml")
+        self.manifests.flush()
+
         # Unregister hooks
         hook_executor = HookExecutor(self.project_root)
         hook_executor.unregister_hooks(extension_id)
@@ -511,7 +1132,7 @@ class ExtensionManager:
             manifest_path = ext_dir / "extension.yml"
 
             try:
-                manifest = ExtensionManifest(manifest_path)
+                manifest = self.manifests.get(manifest_path)
                 result.append({
                     "id": ext_id,
                     "name": manifest.name,
@@ -535,6 +1156,7 @@ class ExtensionManager:
                     "hook_count": 0
                 })
 
+        self.manifests.flush()
         return result
 
     def get_extension(self, extension_id: str) -> Optional[ExtensionManifest]:
@@ -553,9 +1175,11 @@ class ExtensionManager:
         manifest_path = ext_dir / "extension.yml"
 
         try:
-            return ExtensionManifest(manifest_path)
+            manifest = self.manifests.get(manifest_path)
         except ValidationError:
             return None
+        self.manifests.flush()
+        return manifest
 
 
 def version_satisfies(current: str, required: str) -> bool:
@@ -568,6 +1192,9 @@ def version_satisfies(current: str, required: str) -> bool:
     Returns:
         True if version satisfies requirement
     """
+    from packaging import version as pkg_version
+    from packaging.specifiers import SpecifierSet, InvalidSpecifier
+
     try:
         current_ver = pkg_version.Version(current)
         specifier = SpecifierSet(required)
@@ -577,7 +1204,15 @@ def version_satisfies(current: str, required: str) -> bool:
 
 
 class CommandRegistrar:
-    """Handles registration of extension commands with AI agents."""
+    """Handles registration of extension commands with AI agents.
+
+    Command files are written by a bounded thread pool, one task per command
+    and agent. Aliases are hardlinks to the command file by default, or
+    symlinks, falling back to a copy wherever a link cannot be created.
+    """
+
+    ALIAS_MODES = ("hardlink", "symlink", "copy")
+    DEFAULT_MAX_WORKERS = 8
 
     # Agent configurations with directory, format, and argument placeholder
     AGENT_CONFIGS = {
@@ -597,7 +1232,9 @@ class CommandRegistrar:
             "dir": ".github/agents",
             "format": "markdown",
             "args": "$ARGUMENTS",
-            "extension": ".md"
+            "extension": ".md",
+            # Read from the repository on GitHub, where symlinks are not followed
+            "symlink_aliases": False
         },
         "cursor": {
             "dir": ".cursor/commands",
@@ -679,6 +1316,39 @@ class CommandRegistrar:
         }
     }
 
+    def __init__(self, max_workers: Optional[int] = None, alias_mode: Optional[str] = None):
+        """Initialize the registrar.
+
+        Args:
+            max_workers: Writer threads (default: SPECIFY_REGISTER_WORKERS or 8)
+            alias_mode: "hardlink", "symlink" or "copy" (default: SPECIFY_ALIAS_MODE or "hardlink")
+
+        Raises:
+            ExtensionError: If the worker count or alias mode is invalid
+        """
+        if max_workers is None:
+            env_workers = os.environ.get("SPECIFY_REGISTER_WORKERS", "").strip()
+            try:
+                max_workers = int(env_workers) if env_workers else self.DEFAULT_MAX_WORKERS
+            except ValueError:
+                raise ExtensionError(f"Invalid SPECIFY_REGISTER_WORKERS: {env_workers}")
+        if max_workers < 1:
+            raise ExtensionError(f"Worker count must be at least 1, got {max_workers}")
+
+        alias_mode = (alias_mode or os.environ.get("SPECIFY_ALIAS_MODE") or "hardlink").strip().lower()
+        if alias_mode not in self.ALIAS_MODES:
+            raise ExtensionError(
+                f"Unknown alias mode '{alias_mode}' (expected one of: {', '.join(self.ALIAS_MODES)})"
+            )
+
+        self.max_workers = max_workers
+        self.alias_mode = alias_mode
+        # Wall time in seconds of the last registration, per agent
+        self.timings: Dict[str, float] = {}
+        # Files written and skipped as already up to date by the last registration
+        self.written = 0
+        self.skipped = 0
+
     @staticmethod
     def parse_frontmatter(content: str) -> tuple[dict, str]:
         """Parse YAML frontmatter from Markdown content.
@@ -701,8 +1371,8 @@ class CommandRegistrar:
         body = content[end_marker + 3:].strip()
 
         try:
-            frontmatter = yaml.safe_load(frontmatter_str) or {}
-        except yaml.YAMLError:
+            frontmatter = yaml_io.load(frontmatter_str) or {}
+        except yaml_io.YAMLError:
             frontmatter = {}
 
         return frontmatter, body
@@ -720,7 +1390,7 @@ class CommandRegistrar:
         if not fm:
             return ""
 
-        yaml_str = yaml.dump(fm, default_flow_style=False, sort_keys=False)
+        yaml_str = yaml_io.dump(fm)
         return f"---\n{yaml_str}---\n"
 
     def _adjust_script_paths(self, frontmatter: dict) -> dict:
@@ -809,6 +1479,255 @@ class CommandRegistrar:
         """
         return content.replace(from_placeholder, to_placeholder)
 
+    def _load_command_sources(
+        self,
+        manifest: ExtensionManifest,
+        extension_dir: Path
+    ) -> List[tuple]:
+        """Read and parse every command source of an extension once.
+
+        Args:
+            manifest: Extension manifest
+            extension_dir: Path to extension directory
+
+        Returns:
+            List of (command info, frontmatter, body) for sources that exist
+        """
+        sources = []
+        for cmd_info in manifest.commands:
+            source_file = extension_dir / cmd_info["file"]
+            if not source_file.exists():
+                continue
+
+            frontmatter, body = self.parse_frontmatter(source_file.read_text())
+            sources.append((cmd_info, self._adjust_script_paths(frontmatter), body))
+        return sources
+
+    def _render_command(
+        self,
+        agent_config: dict,
+        frontmatter: dict,
+        body: str,
+        ext_id: str
+    ) -> str:
+        """Render a parsed command in an agent's format.
+
+        Args:
+            agent_config: Entry of AGENT_CONFIGS
+            frontmatter: Command frontmatter (script paths already adjusted)
+            body: Command body content
+            ext_id: Extension ID
+
+        Returns:
+            Command file content
+
+        Raises:
+            ExtensionError: If the agent format is not supported
+        """
+        # Convert argument placeholders
+        body = self._convert_argument_placeholder(body, "$ARGUMENTS", agent_config["args"])
+
+        if agent_config["format"] == "markdown":
+            return self._render_markdown_command(frontmatter, body, ext_id)
+        if agent_config["format"] == "toml":
+            return self._render_toml_command(frontmatter, body, ext_id)
+        raise ExtensionError(f"Unsupported format: {agent_config['format']}")
+
+    def register_commands_for_agents(
+        self,
+        agent_names: List[str],
+        manifest: ExtensionManifest,
+        extension_dir: Path,
+        project_root: Path,
+        skip_failed: bool = False
+    ) -> Dict[str, List[str]]:
+        """Register extension commands for several agents at once.
+
+        Each command source is read and parsed once, and rendered once per
+        distinct (format, argument placeholder) pair; the output is then
+        written to every agent directory that shares it.
+
+        Args:
+            agent_names: Agent names (claude, gemini, copilot, etc.)
+            manifest: Extension manifest
+            extension_dir: Path to extension directory
+            project_root: Path to project root
+            skip_failed: Leave out agents that cannot be registered instead
+                of raising, so one broken agent directory does not stop the rest
+
+        Returns:
+            Dictionary mapping each agent name to its registered commands
+
+        Raises:
+            ExtensionError: If an agent or its format is not supported
+        """
+        for agent_name in agent_names:
+            if agent_name not in self.AGENT_CONFIGS and not skip_failed:
+                raise ExtensionError(f"Unsupported agent: {agent_name}")
+        agent_names = [name for name in agent_names if name in self.AGENT_CONFIGS]
+
+        sources = self._load_command_sources(manifest, extension_dir)
+
+        # (format, args) -> rendered output per source
+        rendered: Dict[tuple, List[str]] = {}
+        results = {}
+        # (agent, command file, content, alias files, alias mode)
+        tasks = []
+
+        for agent_name in agent_names:
+            agent_config = self.AGENT_CONFIGS[agent_name]
+            key = (agent_config["format"], agent_config["args"])
+            commands_dir = project_root / agent_config["dir"]
+            try:
+                if key not in rendered:
+                    rendered[key] = [
+                        self._render_command(agent_config, frontmatter, body, manifest.id)
+                        for _, frontmatter, body in sources
+                    ]
+                commands_dir.mkdir(parents=True, exist_ok=True)
+            except (ExtensionError, OSError):
+                if not skip_failed:
+                    raise
+                continue
+
+            alias_mode = self.alias_mode
+            if alias_mode == "symlink" and not agent_config.get("symlink_aliases", True):
+                alias_mode = "hardlink"
+
+            registered = []
+            for (cmd_info, _, _), output in zip(sources, rendered[key]):
+                cmd_name = cmd_info["name"]
+                dest_file = commands_dir / f"{cmd_name}{agent_config['extension']}"
+                aliases = cmd_info.get("aliases", [])
+                alias_files = [
+                    commands_dir / f"{alias}{agent_config['extension']}" for alias in aliases
+                ]
+                tasks.append((agent_name, dest_file, output, alias_files, alias_mode))
+                registered.append(cmd_name)
+                registered.extend(aliases)
+
+            results[agent_name] = registered
+
+        failed: Set[str] = set()
+        self.timings = self._run_writes(tasks, list(results), failed if skip_failed else None)
+        return {name: registered for name, registered in results.items() if name not in failed}
+
+    def _run_writes(
+        self,
+        tasks: List[tuple],
+        agent_names: List[str],
+        failed: Optional[Set[str]] = None
+    ) -> Dict[str, float]:
+        """Write command files, in parallel when there is more than one.
+
+        Sets ``written`` and ``skipped`` to the number of files written and
+        left untouched because they were already up to date.
+
+        Args:
+            tasks: (agent, command file, content, alias files, alias mode) tuples
+            agent_names: Agents being registered
+            failed: If given, collects the agents whose writes raised OSError
+                instead of re-raising it
+
+        Returns:
+            Wall time in seconds spent writing each agent's files
+        """
+        def run(task):
+            agent_name, dest_file, output, alias_files, alias_mode = task
+            start = time.perf_counter()
+            try:
+                written = self._write_command(dest_file, output, alias_files, alias_mode)
+            except OSError:
+                if failed is None:
+                    raise
+                failed.add(agent_name)
+                written = 0
+            return agent_name, start, time.perf_counter(), written
+
+        if self.max_workers == 1 or len(tasks) <= 1:
+            spans = [run(task) for task in tasks]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+                # list() re-raises the first write error once every task has finished
+                spans = list(pool.map(run, tasks))
+
+        total = sum(1 + len(task[3]) for task in tasks)
+        self.written = sum(written for *_, written in spans)
+        self.skipped = total - self.written
+
+        # Each agent's time runs from its first write starting to its last finishing
+        bounds: Dict[str, tuple] = {}
+        for agent_name, start, end, _ in spans:
+            first, last = bounds.get(agent_name, (start, end))
+            bounds[agent_name] = (min(first, start), max(last, end))
+        return {
+            name: bounds[name][1] - bounds[name][0] if name in bounds else 0.0
+            for name in agent_names
+        }
+
+    @staticmethod
+    def _has_content(path: Path, output: str) -> bool:
+        """Return True if path is a regular file already holding output."""
+        try:
+            return not path.is_symlink() and path.read_text() == output
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    @classmethod
+    def _write_command(
+        cls,
+        dest_file: Path,
+        output: str,
+        alias_files: List[Path],
+        alias_mode: str
+    ) -> int:
+        """Write a command file and its aliases, skipping files already up to date.
+
+        Unchanged files are left alone so their mtime does not move and file
+        watchers of the agent directories are not triggered.
+
+        Args:
+            dest_file: Command file to write
+            output: Rendered command content
+            alias_files: Alias files pointing at the same command
+            alias_mode: "hardlink", "symlink" or "copy"
+
+        Returns:
+            Number of files written
+        """
+        written = 0
+        if not cls._has_content(dest_file, output):
+            dest_file.write_text(output)
+            written += 1
+
+        for alias_file in alias_files:
+            if alias_file.is_symlink():
+                if alias_mode == "symlink" and os.readlink(alias_file) == dest_file.name:
+                    continue
+                alias_file.unlink()
+            elif alias_file.exists():
+                # A hardlink to the command file or a copy with the same content
+                if os.path.samefile(alias_file, dest_file) or cls._has_content(alias_file, output):
+                    continue
+                alias_file.unlink()
+
+            written += 1
+            try:
+                if alias_mode == "hardlink":
+                    os.link(dest_file, alias_file)
+                    continue
+                if alias_mode == "symlink":
+                    alias_file.symlink_to(dest_file.name)
+                    continue
+            except OSError:
+                # Cross-device, unsupported filesystem or no symlink privilege
+                pass
+            alias_file.write_text(output)
+
+        return written
+
     def register_commands_for_agent(
         self,
         agent_name: str,
@@ -830,56 +1749,49 @@ class CommandRegistrar:
         Raises:
             ExtensionError: If agent is not supported
         """
-        if agent_name not in self.AGENT_CONFIGS:
-            raise ExtensionError(f"Unsupported agent: {agent_name}")
-
-        agent_config = self.AGENT_CONFIGS[agent_name]
-        commands_dir = project_root / agent_config["dir"]
-        commands_dir.mkdir(parents=True, exist_ok=True)
-
-        registered = []
-
-        for cmd_info in manifest.commands:
-            cmd_name = cmd_info["name"]
-            cmd_file = cmd_info["file"]
-
-            # Read source command file
-            source_file = extension_dir / cmd_file
-            if not source_file.exists():
-                continue
-
-            content = source_file.read_text()
-            frontmatter, body = self.parse_frontmatter(content)
-
-            # Adjust script paths
-            frontmatter = self._adjust_script_paths(frontmatter)
+        return self.register_commands_for_agents(
+            [agent_name], manifest, extension_dir, project_root
+        )[agent_name]
 
-            # Convert argument placeholders
-            body = self._convert_argument_placeholder(
-                body, "$ARGUMENTS", agent_config["args"]
-            )
+    def detect_agents(self, project_root: Path) -> List[str]:
+        """Return the agents whose top-level directory exists in the project.
 
-            # Render in agent-specific format
-            if agent_config["format"] == "markdown":
-                output = self._render_markdown_command(frontmatter, body, manifest.id)
-            elif agent_config["format"] == "toml":
-                output = self._render_toml_command(frontmatter, body, manifest.id)
-            else:
-                raise ExtensionError(f"Unsupported format: {agent_config['format']}")
+        Args:
+            project_root: Path to project root
 
-            # Write command file
-            dest_file = commands_dir / f"{cmd_name}{agent_config['extension']}"
-            dest_file.write_text(output)
+        Returns:
+            Agent names, in AGENT_CONFIGS order
+        """
+        return [
+            agent_name
+            for agent_name, agent_config in self.AGENT_CONFIGS.items()
+            if (project_root / agent_config["dir"].split("/")[0]).exists()
+        ]
 
-            registered.append(cmd_name)
+    def command_files(
+        self,
+        agent_names: List[str],
+        manifest: ExtensionManifest,
+        project_root: Path
+    ) -> List[Path]:
+        """Return every command and alias file registration would write.
 
-            # Register aliases
-            for alias in cmd_info.get("aliases", []):
-                alias_file = commands_dir / f"{alias}{agent_config['extension']}"
-                alias_file.write_text(output)
-                registered.append(alias)
+        Args:
+            agent_names: Agent names
+            manifest: Extension manifest
+            project_root: Path to project root
 
-        return registered
+        Returns:
+            Paths of the command and alias files
+        """
+        paths = []
+        for agent_name in agent_names:
+            agent_config = self.AGENT_CONFIGS[agent_name]
+            commands_dir = project_root / agent_config["dir"]
+            for cmd_info in manifest.commands:
+                for name in [cmd_info["name"], *cmd_info.get("aliases", [])]:
+                    paths.append(commands_dir / f"{name}{agent_config['extension']}")
+        return paths
 
     def register_commands_for_all_agents(
         self,
@@ -889,6 +1801,9 @@ class CommandRegistrar:
     ) -> Dict[str, List[str]]:
         """Register extension commands for all detected agents.
 
+        Agents whose format is unsupported or whose command directory
+        cannot be written are skipped.
+
         Args:
             manifest: Extension manifest
             extension_dir: Path to extension directory
@@ -897,25 +1812,14 @@ class CommandRegistrar:
         Returns:
             Dictionary mapping agent names to list of registered commands
         """
-        results = {}
-
-        # Detect which agents are present in the project
-        for agent_name, agent_config in self.AGENT_CONFIGS.items():
-            agent_dir = project_root / agent_config["dir"].split("/")[0]
-
-            # Register if agent directory exists
-            if agent_dir.exists():
-                try:
-                    registered = self.register_commands_for_agent(
-                        agent_name, manifest, extension_dir, project_root
-                    )
-                    if registered:
-                        results[agent_name] = registered
-                except ExtensionError:
-                    # Skip agent on error
-                    continue
+        detected = self.detect_agents(project_root)
+        if not detected:
+            return {}
 
-        return results
+        results = self.register_commands_for_agents(
+            detected, manifest, extension_dir, project_root, skip_failed=True
+        )
+        return {name: registered for name, registered in results.items() if registered}
 
     def register_commands_for_claude(
         self,
@@ -936,11 +1840,22 @@ class CommandRegistrar:
         return self.register_commands_for_agent("claude", manifest, extension_dir, project_root)
 
 
+# Process-wide parsed catalogs: catalog.json path -> (stat stamp, catalog, index or None)
+_CATALOGS: Dict[str, list] = {}
+
+
 class ExtensionCatalog:
-    """Manages extension catalog fetching, caching, and searching."""
+    """Manages extension catalog fetching, caching, and searching.
+
+    The parsed ``catalog.json`` is shared per process while the file's mtime,
+    size and inode are unchanged. search() is answered from a
+    catalog_index.CatalogIndex kept in ``.cache/catalog-index.json`` and
+    rebuilt only when the cached catalog changes.
+    """
 
     DEFAULT_CATALOG_URL = "https://raw.githubusercontent.com/github/spec-kit/main/extensions/catalog.json"
     CACHE_DURATION = 3600  # 1 hour in seconds
+    MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024
 
     def __init__(self, project_root: Path):
         """Initialize extension catalog manager.
@@ -953,6 +1868,14 @@ class ExtensionCatalog:
         self.cache_dir = self.extensions_dir / ".cache"
         self.cache_file = self.cache_dir / "catalog.json"
         self.cache_metadata_file = self.cache_dir / "catalog-metadata.json"
+        self.index_file = self.cache_dir / "catalog-index.json"
+
+    def _cache_stamp(self) -> Optional[list]:
+        try:
+            st = os.stat(self.cache_file)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size, st.st_ino]
 
     def get_catalog_url(self) -> str:
         """Get catalog URL from config or use default.
@@ -1029,27 +1952,34 @@ class ExtensionCatalog:
             force_refresh: If True, bypass cache and fetch from network
 
         Returns:
-            Catalog data dictionary
+            Catalog data dictionary (shared per process; do not modify)
 
         Raises:
             ExtensionError: If catalog cannot be fetched
         """
         # Check cache first unless force refresh
         if not force_refresh and self.is_cache_valid():
+            key = os.path.abspath(self.cache_file)
+            stamp = self._cache_stamp()
+            memo = _CATALOGS.get(key)
+            if memo is not None and memo[0] == stamp:
+                return memo[1]
             try:
-                return json.loads(self.cache_file.read_text())
+                catalog_data = json.loads(self.cache_file.read_text())
+                _CATALOGS[key] = [stamp, catalog_data, None]
+                return catalog_data
             except json.JSONDecodeError:
                 pass  # Fall through to network fetch
 
         # Fetch from network
         catalog_url = self.get_catalog_url()
 
-        try:
-            import urllib.request
-            import urllib.error
+        import httpx
 
-            with urllib.request.urlopen(catalog_url, timeout=10) as response:
-                catalog_data = json.loads(response.read())
+        try:
+            response = network.get(catalog_url, timeout=10)
+            response.raise_for_status()
+            catalog_data = json.loads(response.content)
 
             # Validate catalog structure
             if "schema_version" not in catalog_data or "extensions" not in catalog_data:
@@ -1065,10 +1995,11 @@ class ExtensionCatalog:
                 "catalog_url": catalog_url,
             }
             self.cache_metadata_file.write_text(json.dumps(metadata, indent=2))
+            _CATALOGS[os.path.abspath(self.cache_file)] = [self._cache_stamp(), catalog_data, None]
 
             return catalog_data
 
-        except urllib.error.URLError as e:
+        except httpx.HTTPError as e:
             raise ExtensionError(f"Failed to fetch catalog from {catalog_url}: {e}")
         except json.JSONDecodeError as e:
             raise ExtensionError(f"Invalid JSON in catalog: {e}")
@@ -1083,48 +2014,69 @@ class ExtensionCatalog:
         """Search catalog for extensions.
 
         Args:
-            query: Search query (searches name, description, tags)
+            query: Search query; every word must match a word (or the start
+                of one) in the id, name, tags, author or description. A query
+                without letters or digits is matched as a substring instead.
             tag: Filter by specific tag
             author: Filter by author name
             verified_only: If True, show only verified extensions
 
         Returns:
-            List of matching extension metadata
+            List of matching extension metadata, best match first when
+            searching by query and in catalog order otherwise
         """
         catalog = self.fetch_catalog()
         extensions = catalog.get("extensions", {})
+        index = self._search_index(catalog)
+
+        if query and not catalog_index.tokenize(query):
+            # Nothing for the index to look up (e.g. "-"): scan the filtered entries
+            query_lower = query.lower()
+            ids = [
+                ext_id
+                for ext_id in index.search(tag=tag, author=author, verified_only=verified_only)
+                if query_lower in self._searchable_text(ext_id, extensions[ext_id])
+            ]
+        else:
+            ids = index.search(query, tag=tag, author=author, verified_only=verified_only)
 
-        results = []
-
-        for ext_id, ext_data in extensions.items():
-            # Apply filters
-            if verified_only and not ext_data.get("verified", False):
-                continue
-
-            if author and ext_data.get("author", "").lower() != author.lower():
-                continue
-
-            if tag and tag.lower() not in [t.lower() for t in ext_data.get("tags", [])]:
-                continue
-
-            if query:
-                # Search in name, description, and tags
-                query_lower = query.lower()
-                searchable_text = " ".join(
-                    [
-                        ext_data.get("name", ""),
-                        ext_data.get("description", ""),
-                        ext_id,
-                    ]
-                    + ext_data.get("tags", [])
-                ).lower()
-
-                if query_lower not in searchable_text:
-                    continue
-
-            results.append({"id": ext_id, **ext_data})
+        return [{"id": ext_id, **extensions[ext_id]} for ext_id in ids]
 
-        return results
+    @staticmethod
+    def _searchable_text(ext_id: str, ext_data: Dict[str, Any]) -> str:
+        """Lower-cased id, name, tags, author and description of a catalog entry."""
+        ext_data = ext_data or {}
+        return " ".join(
+            [
+                ext_id,
+                str(ext_data.get("name") or ""),
+                str(ext_data.get("author") or ""),
+                str(ext_data.get("description") or ""),
+            ]
+            + [str(t) for t in ext_data.get("tags") or []]
+        ).lower()
+
+    def _search_index(self, catalog: Dict[str, Any]) -> catalog_index.CatalogIndex:
+        """Return the search index of catalog, loading or rebuilding it as needed."""
+        key = os.path.abspath(self.cache_file)
+        stamp = self._cache_stamp()
+        memo = _CATALOGS.get(key)
+        if memo is not None and memo[1] is catalog and memo[2] is not None:
+            return memo[2]
+
+        # Only trust the index on disk if catalog is what the cache file holds
+        source = stamp if memo is not None and memo[0] == stamp and memo[1] is catalog else None
+        index = catalog_index.CatalogIndex.load(self.index_file, source)
+        if index is None:
+            index = catalog_index.CatalogIndex.build(catalog.get("extensions", {}), source)
+            if source is not None:
+                try:
+                    _atomic_write_text(self.index_file, index.to_json())
+                except OSError:
+                    pass
+        if source is not None:
+            memo[2] = index
+        return index
 
     def get_extension_info(self, extension_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific extension.
@@ -1146,6 +2098,11 @@ class ExtensionCatalog:
     def download_extension(self, extension_id: str, target_dir: Optional[Path] = None) -> Path:
         """Download extension ZIP from catalog.
 
+        The archive is streamed to disk and may not exceed MAX_DOWNLOAD_BYTES
+        (or ``SPECIFY_EXTENSION_MAX_BYTES``). When the catalog entry has a
+        ``sha256`` field the archive must match it, and an archive with that
+        hash already in ``.cache/downloads`` is reused without a download.
+
         Args:
             extension_id: ID of the extension to download
             target_dir: Directory to save ZIP file (defaults to temp directory)
@@ -1154,10 +2111,10 @@ class ExtensionCatalog:
             Path to downloaded ZIP file
 
         Raises:
-            ExtensionError: If extension not found or download fails
+            ExtensionError: If extension not found, download fails or the
+                archive does not match its catalog checksum
         """
-        import urllib.request
-        import urllib.error
+        import httpx
 
         # Get extension info from catalog
         ext_info = self.get_extension_info(extension_id)
@@ -1177,27 +2134,82 @@ class ExtensionCatalog:
                 f"Extension download URL must use HTTPS: {download_url}"
             )
 
+        expected = str(ext_info.get("sha256") or "").strip().lower()
+        expected = expected.removeprefix("sha256:")
+        if expected and not re.fullmatch(r"[0-9a-f]{64}", expected):
+            raise ExtensionError(
+                f"Extension '{extension_id}' has an invalid sha256 in the catalog: {expected}"
+            )
+
         # Determine target path
+        downloads_dir = self.cache_dir / "downloads"
         if target_dir is None:
-            target_dir = self.cache_dir / "downloads"
+            target_dir = downloads_dir
         target_dir.mkdir(parents=True, exist_ok=True)
+        downloads_dir.mkdir(parents=True, exist_ok=True)
 
         version = ext_info.get("version", "unknown")
         zip_filename = f"{extension_id}-{version}.zip"
         zip_path = target_dir / zip_filename
 
+        # Reuse an archive already downloaded with the catalog's hash
+        if expected:
+            blob_path = downloads_dir / f"{expected}.zip"
+            if blob_path.exists():
+                if self._file_sha256(blob_path) == expected:
+                    return self._link_download(blob_path, zip_path)
+                blob_path.unlink()
+
         # Download the ZIP file
+        fd, tmp_name = tempfile.mkstemp(dir=downloads_dir, prefix=".download-", suffix=".zip")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
         try:
-            with urllib.request.urlopen(download_url, timeout=60) as response:
-                zip_data = response.read()
-
-            zip_path.write_bytes(zip_data)
-            return zip_path
+            digest = network.download(
+                download_url, tmp_path, max_bytes=self.max_download_bytes(), timeout=60
+            )
+            if expected and digest != expected:
+                raise ExtensionError(
+                    f"Checksum mismatch for {download_url}: expected sha256 {expected}, got {digest}"
+                )
+            blob_path = downloads_dir / f"{digest}.zip"
+            os.replace(tmp_path, blob_path)
+            return self._link_download(blob_path, zip_path)
 
-        except urllib.error.URLError as e:
+        except network.DownloadTooLargeError as e:
+            raise ExtensionError(f"Extension download rejected: {e}")
+        except httpx.HTTPError as e:
             raise ExtensionError(f"Failed to download extension from {download_url}: {e}")
         except IOError as e:
             raise ExtensionError(f"Failed to save extension ZIP: {e}")
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def max_download_bytes(self) -> int:
+        """Return the size limit for extension downloads in bytes."""
+        value = os.environ.get("SPECIFY_EXTENSION_MAX_BYTES", "").strip()
+        try:
+            return int(value) if value else self.MAX_DOWNLOAD_BYTES
+        except ValueError:
+            return self.MAX_DOWNLOAD_BYTES
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _link_download(blob_path: Path, zip_path: Path) -> Path:
+        """Expose a cached archive at zip_path, which callers may delete."""
+        zip_path.unlink(missing_ok=True)
+        try:
+            os.link(blob_path, zip_path)
+        except OSError:
+            shutil.copy2(blob_path, zip_path)
+        return zip_path
 
     def clear_cache(self):
         """Clear the catalog cache."""
@@ -1205,6 +2217,12 @@ class ExtensionCatalog:
             self.cache_file.unlink()
         if self.cache_metadata_file.exists():
             self.cache_metadata_file.unlink()
+        self.index_file.unlink(missing_ok=True)
+        _CATALOGS.pop(os.path.abspath(self.cache_file), None)
+
+
+# Process-wide merged configs: (extension dir, extension id) -> (stamp, config)
+_CONFIG_SNAPSHOTS: Dict[tuple, tuple] = {}
 
 
 class ConfigManager:
@@ -1215,18 +2233,30 @@ class ConfigManager:
     2. Project config (.specify/extensions/{ext-id}/{ext-id}-config.yml)
     3. Local config (.specify/extensions/{ext-id}/local-config.yml) - gitignored
     4. Environment variables (SPECKIT_{EXT_ID}_{KEY})
+
+    The merged result is kept in a process-wide snapshot per extension and
+    reused until one of the three files changes (mtime, size or inode) or a
+    matching environment variable is set, changed or removed.
     """
 
-    def __init__(self, project_root: Path, extension_id: str):
+    def __init__(
+        self,
+        project_root: Path,
+        extension_id: str,
+        environ: Optional[Mapping[str, str]] = None,
+    ):
         """Initialize config manager for an extension.
 
         Args:
             project_root: Root directory of the spec-kit project
             extension_id: ID of the extension
+            environ: Environment to read SPECKIT_* variables from
+                (default: os.environ)
         """
         self.project_root = project_root
         self.extension_id = extension_id
         self.extension_dir = project_root / ".specify" / "extensions" / extension_id
+        self.environ = environ
 
     def _load_yaml_config(self, file_path: Path) -> Dict[str, Any]:
         """Load configuration from YAML file.
@@ -1241,8 +2271,8 @@ class ConfigManager:
             return {}
 
         try:
-            return yaml.safe_load(file_path.read_text()) or {}
-        except (yaml.YAMLError, OSError):
+            return yaml_io.load_file(file_path) or {}
+        except (yaml_io.YAMLError, OSError):
             return {}
 
     def _get_extension_defaults(self) -> Dict[str, Any]:
@@ -1255,8 +2285,12 @@ class ConfigManager:
         if not manifest_path.exists():
             return {}
 
-        manifest_data = self._load_yaml_config(manifest_path)
-        return manifest_data.get("config", {}).get("defaults", {})
+        try:
+            manifest_data = ManifestCache().get(manifest_path).data
+        except ValidationError:
+            manifest_data = self._load_yaml_config(manifest_path)
+        # The cached manifest is shared; hand out a private copy
+        return copy.deepcopy(manifest_data.get("config", {}).get("defaults", {}))
 
     def _get_project_config(self) -> Dict[str, Any]:
         """Get project-level configuration.
@@ -1289,16 +2323,10 @@ class ConfigManager:
         Returns:
             Configuration dictionary from environment variables
         """
-        import os
-
         env_config = {}
-        ext_id_upper = self.extension_id.replace("-", "_").upper()
-        prefix = f"SPECKIT_{ext_id_upper}_"
-
-        for key, value in os.environ.items():
-            if not key.startswith(prefix):
-                continue
+        prefix = self._env_prefix()
 
+        for key, value in self._env_items():
             # Remove prefix and split into parts
             config_path = key[len(prefix):].lower().split("_")
 
@@ -1314,6 +2342,16 @@ class ConfigManager:
 
         return env_config
 
+    def _env_prefix(self) -> str:
+        ext_id_upper = self.extension_id.replace("-", "_").upper()
+        return f"SPECKIT_{ext_id_upper}_"
+
+    def _env_items(self) -> tuple:
+        """Return the extension's environment variables as sorted (name, value) pairs."""
+        environ = os.environ if self.environ is None else self.environ
+        prefix = self._env_prefix()
+        return tuple(sorted((k, v) for k, v in environ.items() if k.startswith(prefix)))
+
     def _merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively merge two configuration dictionaries.
 
@@ -1336,6 +2374,46 @@ class ConfigManager:
 
         return result
 
+    def _stamp(self) -> tuple:
+        """Return what the merged configuration depends on: file stats and env vars."""
+        stats = []
+        for path in (
+            self.extension_dir / "extension.yml",
+            self.extension_dir / f"{self.extension_id}-config.yml",
+            self.extension_dir / "local-config.yml",
+        ):
+            try:
+                st = os.stat(path)
+                stats.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                stats.append(None)
+
+        return tuple(stats), self._env_items()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Return the shared merged configuration, reloading it if it is stale.
+
+        The result is shared across callers and must not be mutated.
+        """
+        key = (os.path.abspath(self.extension_dir), self.extension_id)
+        stamp = self._stamp()
+        cached = _CONFIG_SNAPSHOTS.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        config = self._load_config()
+        _CONFIG_SNAPSHOTS[key] = (stamp, config)
+        return config
+
+    def _lookup(self, key_path: str) -> tuple:
+        """Return (found, value) for a dot-notation path in the snapshot."""
+        current = self._snapshot()
+        for key in key_path.split("."):
+            if not isinstance(current, dict) or key not in current:
+                return False, None
+            current = current[key]
+        return True, current
+
     def get_config(self) -> Dict[str, Any]:
         """Get final merged configuration for the extension.
 
@@ -1345,6 +2423,10 @@ class ConfigManager:
         Returns:
             Final merged configuration dictionary
         """
+        return copy.deepcopy(self._snapshot())
+
+    def _load_config(self) -> Dict[str, Any]:
+        """Read and merge all configuration layers."""
         # Start with defaults
         config = self._get_extension_defaults()
 
@@ -1374,16 +2456,11 @@ class ConfigManager:
             >>> url = config.get_value("connection.url")
             >>> timeout = config.get_value("connection.timeout", 30)
         """
-        config = self.get_config()
-        keys = key_path.split(".")
-
-        current = config
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
-                return default
-            current = current[key]
-
-        return current
+        found, value = self._lookup(key_path)
+        if not found:
+            return default
+        # Sections are shared with the snapshot; hand out a private copy
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     def has_value(self, key_path: str) -> bool:
         """Check if a configuration value exists.
@@ -1394,20 +2471,65 @@ class ConfigManager:
         Returns:
             True if value exists (even if None), False otherwise
         """
-        config = self.get_config()
-        keys = key_path.split(".")
+        return self._lookup(key_path)[0]
 
-        current = config
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
-                return False
-            current = current[key]
 
-        return True
+# Process-wide parsed extensions.yml files: config path -> (stamp, _HookTable)
+_HOOK_TABLES: Dict[str, tuple] = {}
+
+
+class _HookTable:
+    """Parsed extensions.yml with its hook entries indexed by event and extension.
+
+    The indexes point at the hook dicts inside config and are rebuilt lazily
+    after a change.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self._by_event: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._by_extension: Optional[Dict[str, List[tuple]]] = None
+
+    @property
+    def by_event(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Event name -> enabled hook entries, in registration order."""
+        if self._by_event is None:
+            self._by_event = {
+                event: [h for h in hook_list or [] if h.get("enabled", True)]
+                for event, hook_list in (self.config.get("hooks") or {}).items()
+            }
+        return self._by_event
+
+    @property
+    def by_extension(self) -> Dict[str, List[tuple]]:
+        """Extension ID -> (event name, hook entry) pairs, enabled or not."""
+        if self._by_extension is None:
+            index: Dict[str, List[tuple]] = {}
+            for event, hook_list in (self.config.get("hooks") or {}).items():
+                for hook in hook_list or []:
+                    index.setdefault(hook.get("extension"), []).append((event, hook))
+            self._by_extension = index
+        return self._by_extension
+
+    def changed(self, structure: bool = True):
+        """Drop indexes after hook entries were edited (structure: added or removed)."""
+        self._by_event = None
+        if structure:
+            self._by_extension = None
 
 
 class HookExecutor:
-    """Manages extension hook execution."""
+    """Manages extension hook execution.
+
+    The parsed ``.specify/extensions.yml`` and its hook indexes are shared
+    per process and reloaded when the file's mtime, size or inode changes.
+    A JSON copy in ``.specify/extensions/.cache/hooks.json``, stamped the same
+    way, lets new processes skip YAML parsing. Changes made inside
+    transaction() are written once, when it exits.
+    """
+
+    CACHE_FILE = "hooks.json"
+    FORMAT_VERSION = 1
 
     def __init__(self, project_root: Path):
         """Initialize hook executor.
@@ -1418,39 +2540,146 @@ class HookExecutor:
         self.project_root = project_root
         self.extensions_dir = project_root / ".specify" / "extensions"
         self.config_file = project_root / ".specify" / "extensions.yml"
+        # Serializes read-modify-write cycles of config_file across processes
+        self.lock_file = self.extensions_dir / ".hooks.lock"
+        self.cache_file = self.extensions_dir / ".cache" / self.CACHE_FILE
+        self._config_managers: Dict[str, ConfigManager] = {}
+        # SPECKIT_* variables captured once per check_hooks_for_event call
+        self._environ: Optional[Dict[str, str]] = None
+        # Private, mutable table of the open transaction
+        self._pending: Optional[_HookTable] = None
+        self._dirty = False
+        self._depth = 0
+
+    @staticmethod
+    def _default_config() -> Dict[str, Any]:
+        return {
+            "installed": [],
+            "settings": {"auto_execute_hooks": True},
+            "hooks": {},
+        }
+
+    def _stamp(self) -> Optional[list]:
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+    def _read_cache(self, stamp: list) -> Optional[Dict[str, Any]]:
+        """Return the config from hooks.json if it was made from this stamp."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get("format") == self.FORMAT_VERSION and cached.get("stat") == stamp:
+                return cached["config"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        return None
+
+    def _write_cache(self, stamp: Optional[list], config: Dict[str, Any]):
+        """Store config in hooks.json; failures are ignored."""
+        if stamp is None:
+            return
+        try:
+            text = json.dumps({"format": self.FORMAT_VERSION, "stat": stamp, "config": config})
+        except (TypeError, ValueError):
+            # YAML types without a JSON form (e.g. dates) stay uncached
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write_text(self.cache_file, text)
+        except OSError:
+            pass
+
+    def _table(self) -> _HookTable:
+        """Return the table to read from: the open transaction's, or the shared one.
+
+        The shared table must not be mutated.
+        """
+        if self._pending is not None:
+            return self._pending
+
+        key = os.path.abspath(self.config_file)
+        stamp = self._stamp()
+        cached = _HOOK_TABLES.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        if stamp is None:
+            config = self._default_config()
+        else:
+            config = self._read_cache(stamp)
+            if config is None:
+                try:
+                    config = yaml_io.load_file(self.config_file) or {}
+                except (yaml_io.YAMLError, OSError):
+                    config = self._default_config()
+                else:
+                    self._write_cache(stamp, config)
+        table = _HookTable(config)
+        _HOOK_TABLES[key] = (stamp, table)
+        return table
+
+    def _write(self, table: _HookTable):
+        """Write table to extensions.yml and make it the shared table."""
+        self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(self.config_file, yaml_io.dump(table.config))
+        stamp = self._stamp()
+        _HOOK_TABLES[os.path.abspath(self.config_file)] = (stamp, table)
+        self._write_cache(stamp, table.config)
+
+    @contextmanager
+    def transaction(self):
+        """Group several hook changes under one lock and a single write.
+
+        Changes made by other processes are loaded on entry; extensions.yml
+        is written once when the outermost block exits, and only if something
+        changed. If the block raises, its changes are discarded.
+        """
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+
+        with _file_lock(self.lock_file):
+            self._pending = _HookTable(copy.deepcopy(self._table().config))
+            self._dirty = False
+            self._depth = 1
+            try:
+                yield self
+            finally:
+                self._depth = 0
+                table, self._pending = self._pending, None
+            if self._dirty:
+                self._dirty = False
+                self._write(table)
 
     def get_project_config(self) -> Dict[str, Any]:
         """Load project-level extension configuration.
 
         Returns:
-            Extension configuration dictionary
+            Extension configuration dictionary (a private copy)
         """
-        if not self.config_file.exists():
-            return {
-                "installed": [],
-                "settings": {"auto_execute_hooks": True},
-                "hooks": {},
-            }
-
-        try:
-            return yaml.safe_load(self.config_file.read_text()) or {}
-        except (yaml.YAMLError, OSError):
-            return {
-                "installed": [],
-                "settings": {"auto_execute_hooks": True},
-                "hooks": {},
-            }
+        return copy.deepcopy(self._table().config)
 
     def save_project_config(self, config: Dict[str, Any]):
         """Save project-level extension configuration.
 
+        Inside a transaction the write is deferred until it exits.
+
         Args:
             config: Configuration dictionary to save
         """
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        self.config_file.write_text(
-            yaml.dump(config, default_flow_style=False, sort_keys=False)
-        )
+        table = _HookTable(copy.deepcopy(config))
+        if self._pending is not None:
+            self._pending = table
+            self._dirty = True
+        else:
+            self._write(table)
 
     def register_hooks(self, manifest: ExtensionManifest):
         """Register extension hooks in project config.
@@ -1461,46 +2690,43 @@ class HookExecutor:
         if not hasattr(manifest, "hooks") or not manifest.hooks:
             return
 
-        config = self.get_project_config()
-
-        # Ensure hooks dict exists
-        if "hooks" not in config:
-            config["hooks"] = {}
-
-        # Register each hook
-        for hook_name, hook_config in manifest.hooks.items():
-            if hook_name not in config["hooks"]:
-                config["hooks"][hook_name] = []
-
-            # Add hook entry
-            hook_entry = {
-                "extension": manifest.id,
-                "command": hook_config.get("command"),
-                "enabled": True,
-                "optional": hook_config.get("optional", True),
-                "prompt": hook_config.get(
-                    "prompt", f"Execute {hook_config.get('command')}?"
-                ),
-                "description": hook_config.get("description", ""),
-                "condition": hook_config.get("condition"),
-            }
-
-            # Check if already registered
-            existing = [
-                h
-                for h in config["hooks"][hook_name]
-                if h.get("extension") == manifest.id
-            ]
-
-            if not existing:
-                config["hooks"][hook_name].append(hook_entry)
-            else:
-                # Update existing
-                for i, h in enumerate(config["hooks"][hook_name]):
-                    if h.get("extension") == manifest.id:
-                        config["hooks"][hook_name][i] = hook_entry
-
-        self.save_project_config(config)
+        with self.transaction():
+            table = self._pending
+            hooks = table.config.setdefault("hooks", {})
+            if hooks is None:
+                hooks = table.config["hooks"] = {}
+
+            # Register each hook
+            for hook_name, hook_config in manifest.hooks.items():
+                hook_list = hooks.setdefault(hook_name, [])
+
+                # Add hook entry
+                hook_entry = {
+                    "extension": manifest.id,
+                    "command": hook_config.get("command"),
+                    "enabled": True,
+                    "optional": hook_config.get("optional", True),
+                    "prompt": hook_config.get(
+                        "prompt", f"Execute {hook_config.get('command')}?"
+                    ),
+                    "description": hook_config.get("description", ""),
+                    "condition": hook_config.get("condition"),
+                }
+                compiled = self._compile_condition(hook_entry["condition"])
+                if compiled is not None:
+                    hook_entry["condition_ast"] = compiled
+
+                # Replace an existing registration in place, else append
+                positions = [
+                    i for i, h in enumerate(hook_list) if h.get("extension") == manifest.id
+                ]
+                if not positions:
+                    hook_list.append(hook_entry)
+                for i in positions:
+                    hook_list[i] = copy.deepcopy(hook_entry)
+
+            table.changed()
+            self._dirty = True
 
     def unregister_hooks(self, extension_id: str):
         """Remove extension hooks from project config.
@@ -1508,25 +2734,86 @@ class HookExecutor:
         Args:
             extension_id: ID of extension to unregister
         """
-        config = self.get_project_config()
+        self.restore_hooks(extension_id, {})
 
-        if "hooks" not in config:
-            return
+    def get_extension_hooks(self, extension_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the hook entries registered by one extension.
 
-        # Remove hooks for this extension
-        for hook_name in config["hooks"]:
-            config["hooks"][hook_name] = [
-                h
-                for h in config["hooks"][hook_name]
-                if h.get("extension") != extension_id
-            ]
+        Args:
+            extension_id: Extension ID
 
-        # Clean up empty hook arrays
-        config["hooks"] = {
-            name: hooks for name, hooks in config["hooks"].items() if hooks
-        }
+        Returns:
+            Dictionary mapping event names to the extension's hook entries
+        """
+        entries: Dict[str, List[Dict[str, Any]]] = {}
+        for event, hook in self._table().by_extension.get(extension_id, ()):
+            entries.setdefault(event, []).append(copy.deepcopy(hook))
+        return entries
 
-        self.save_project_config(config)
+    def get_extension_hook_positions(self, extension_id: str) -> Dict[str, List[int]]:
+        """Get where one extension's hook entries sit in each event's hook list.
+
+        Args:
+            extension_id: Extension ID
+
+        Returns:
+            Dictionary mapping event names to the ascending list indexes of the
+            extension's entries, matching get_extension_hooks
+        """
+        table = self._table()
+        hooks = table.config.get("hooks") or {}
+        positions: Dict[str, List[int]] = {}
+        for event, _ in table.by_extension.get(extension_id, ()):
+            if event not in positions:
+                positions[event] = [
+                    i for i, h in enumerate(hooks.get(event) or [])
+                    if h.get("extension") == extension_id
+                ]
+        return positions
+
+    def restore_hooks(
+        self,
+        extension_id: str,
+        entries: Dict[str, List[Dict[str, Any]]],
+        positions: Optional[Dict[str, List[int]]] = None,
+    ):
+        """Replace an extension's hook entries, leaving other extensions' hooks alone.
+
+        Args:
+            extension_id: Extension ID
+            entries: Event name to hook entries, as returned by get_extension_hooks
+            positions: Original list indexes of the entries, as returned by
+                get_extension_hook_positions; entries are put back there so
+                the execution order of other extensions' hooks is unchanged.
+                Entries without a position are appended.
+        """
+        with self.transaction():
+            table = self._pending
+            if extension_id not in table.by_extension and not entries:
+                return
+            hooks = table.config.get("hooks") or {}
+
+            # Remove hooks for this extension from the events it has hooks for
+            for event in {event for event, _ in table.by_extension.get(extension_id, ())}:
+                hooks[event] = [
+                    h for h in hooks[event] if h.get("extension") != extension_id
+                ]
+
+            for hook_name, hook_list in entries.items():
+                target = hooks.setdefault(hook_name, [])
+                indexes = (positions or {}).get(hook_name) or []
+                if len(indexes) != len(hook_list):
+                    indexes = [len(target) + i for i in range(len(hook_list))]
+                # Ascending inserts rebuild the original list around the other entries
+                for index, hook in sorted(zip(indexes, copy.deepcopy(hook_list)), key=lambda p: p[0]):
+                    target.insert(index, hook)
+
+            # Clean up empty hook arrays
+            table.config["hooks"] = {
+                name: hook_list for name, hook_list in hooks.items() if hook_list
+            }
+            table.changed()
+            self._dirty = True
 
     def get_hooks_for_event(self, event_name: str) -> List[Dict[str, Any]]:
         """Get all registered hooks for a specific event.
@@ -1535,13 +2822,9 @@ class HookExecutor:
             event_name: Name of the event (e.g., 'after_tasks')
 
         Returns:
-            List of hook configurations
+            List of enabled hook configurations
         """
-        config = self.get_project_config()
-        hooks = config.get("hooks", {}).get(event_name, [])
-
-        # Filter to enabled hooks only
-        return [h for h in hooks if h.get("enabled", True)]
+        return copy.deepcopy(self._table().by_event.get(event_name, []))
 
     def should_execute_hook(self, hook: Dict[str, Any]) -> bool:
         """Determine if a hook should be executed based on its condition.
@@ -1557,87 +2840,96 @@ class HookExecutor:
         if not condition:
             return True
 
-        # Parse and evaluate condition
+        # Evaluate the tree compiled at registration, or compile it now
         try:
-            return self._evaluate_condition(condition, hook.get("extension"))
+            return self._evaluate_condition(
+                condition, hook.get("extension"), self._stored_condition(hook)
+            )
         except Exception:
             # If condition evaluation fails, default to not executing
             return False
 
-    def _evaluate_condition(self, condition: str, extension_id: Optional[str]) -> bool:
+    def _config_manager(self, extension_id: str) -> ConfigManager:
+        """Return the ConfigManager of an extension, reused across conditions."""
+        manager = self._config_managers.get(extension_id)
+        if manager is None:
+            manager = self._config_managers[extension_id] = ConfigManager(
+                self.project_root, extension_id, self._environ
+            )
+        return manager
+
+    @staticmethod
+    def _compile_condition(condition: Any) -> Optional[Dict[str, Any]]:
+        """Compile a hook condition for storage in the hook entry.
+
+        Returns:
+            Record with the source text and its compiled tree, or None if
+            there is no condition or it does not parse
+        """
+        if not isinstance(condition, str) or not condition.strip():
+            return None
+        try:
+            tree = hook_conditions.parse(condition)
+        except hook_conditions.ConditionError:
+            return None
+        return {
+            "version": hook_conditions.VERSION,
+            "source": condition,
+            "tree": tree,
+        }
+
+    @staticmethod
+    def _stored_condition(hook: Dict[str, Any]) -> Optional[list]:
+        """Return the compiled tree stored with a hook if it is still current."""
+        stored = hook.get("condition_ast")
+        if (
+            isinstance(stored, dict)
+            and stored.get("version") == hook_conditions.VERSION
+            and stored.get("source") == hook.get("condition")
+        ):
+            return stored.get("tree")
+        return None
+
+    def _evaluate_condition(
+        self,
+        condition: str,
+        extension_id: Optional[str],
+        tree: Optional[list] = None,
+    ) -> bool:
         """Evaluate a hook condition expression.
 
-        Supported condition patterns:
-        - "config.key.path is set" - checks if config value exists
+        Supported tests, combinable with and/or/not and parentheses:
+        - "config.key.path is set" / "is not set" - checks if config value exists
         - "config.key.path == 'value'" - checks if config equals value
         - "config.key.path != 'value'" - checks if config not equals value
+        - "config.key.path in ['a', 'b']" / "not in" - checks membership
         - "env.VAR_NAME is set" - checks if environment variable exists
         - "env.VAR_NAME == 'value'" - checks if env var equals value
 
         Args:
             condition: Condition expression string
             extension_id: Extension ID for config lookup
+            tree: Compiled form of condition, if already known
 
         Returns:
             True if condition is met, False otherwise
         """
-        import os
-
-        condition = condition.strip()
-
-        # Pattern: "config.key.path is set"
-        if match := re.match(r'config\.([a-z0-9_.]+)\s+is\s+set', condition, re.IGNORECASE):
-            key_path = match.group(1)
-            if not extension_id:
+        if tree is None:
+            try:
+                tree = hook_conditions.compiled(condition)
+            except hook_conditions.ConditionError:
+                # Unknown condition format, default to False for safety
                 return False
 
-            config_manager = ConfigManager(self.project_root, extension_id)
-            return config_manager.has_value(key_path)
-
-        # Pattern: "config.key.path == 'value'" or "config.key.path != 'value'"
-        if match := re.match(r'config\.([a-z0-9_.]+)\s*(==|!=)\s*["\']([^"\']+)["\']', condition, re.IGNORECASE):
-            key_path = match.group(1)
-            operator = match.group(2)
-            expected_value = match.group(3)
-
+        def resolve(source: str, name: str):
+            if source == "env":
+                value = os.environ.get(name)
+                return value is not None, value if value is not None else ""
             if not extension_id:
-                return False
-
-            config_manager = ConfigManager(self.project_root, extension_id)
-            actual_value = config_manager.get_value(key_path)
-
-            # Normalize boolean values to lowercase for comparison
-            # (YAML True/False vs condition strings 'true'/'false')
-            if isinstance(actual_value, bool):
-                normalized_value = "true" if actual_value else "false"
-            else:
-                normalized_value = str(actual_value)
+                return None
+            return self._config_manager(extension_id)._lookup(name)
 
-            if operator == "==":
-                return normalized_value == expected_value
-            else:  # !=
-                return normalized_value != expected_value
-
-        # Pattern: "env.VAR_NAME is set"
-        if match := re.match(r'env\.([A-Z0-9_]+)\s+is\s+set', condition, re.IGNORECASE):
-            var_name = match.group(1).upper()
-            return var_name in os.environ
-
-        # Pattern: "env.VAR_NAME == 'value'" or "env.VAR_NAME != 'value'"
-        if match := re.match(r'env\.([A-Z0-9_]+)\s*(==|!=)\s*["\']([^"\']+)["\']', condition, re.IGNORECASE):
-            var_name = match.group(1).upper()
-            operator = match.group(2)
-            expected_value = match.group(3)
-
-            actual_value = os.environ.get(var_name, "")
-
-            if operator == "==":
-                return actual_value == expected_value
-            else:  # !=
-                return actual_value != expected_value
-
-        # Unknown condition format, default to False for safety
-        return False
+        return hook_conditions.evaluate(tree, resolve)
 
     def format_hook_message(
         self, event_name: str, hooks: List[Dict[str, Any]]
@@ -1692,7 +2984,7 @@ class HookExecutor:
             - hooks: List[Dict] - List of hooks (with condition evaluation applied)
             - message: str - Formatted message for display
         """
-        hooks = self.get_hooks_for_event(event_name)
+        hooks = self._table().by_event.get(event_name, [])
 
         if not hooks:
             return {
@@ -1701,11 +2993,17 @@ class HookExecutor:
                 "message": ""
             }
 
-        # Filter hooks by condition
-        executable_hooks = []
-        for hook in hooks:
-            if self.should_execute_hook(hook):
-                executable_hooks.append(hook)
+        # Filter hooks by condition, scanning os.environ once for all of them;
+        # copy only what is handed out
+        saved = self._environ, self._config_managers
+        self._environ = {k: v for k, v in os.environ.items() if k.startswith("SPECKIT_")}
+        self._config_managers = {}
+        try:
+            executable_hooks = [
+                copy.deepcopy(hook) for hook in hooks if self.should_execute_hook(hook)
+            ]
+        finally:
+            self._environ, self._config_managers = saved
 
         if not executable_hooks:
             return {
@@ -1744,24 +3042,32 @@ class HookExecutor:
             "prompt": hook.get("prompt", "")
         }
 
+    def set_hooks_enabled(self, extension_ids: List[str], enabled: bool):
+        """Enable or disable all hooks of several extensions with one write.
+
+        Args:
+            extension_ids: Extension IDs
+            enabled: New state of their hooks
+        """
+        with self.transaction():
+            table = self._pending
+            changed = False
+            for extension_id in extension_ids:
+                for _, hook in table.by_extension.get(extension_id, ()):
+                    if hook.get("enabled", True) != enabled:
+                        hook["enabled"] = enabled
+                        changed = True
+            if changed:
+                table.changed(structure=False)
+                self._dirty = True
+
     def enable_hooks(self, extension_id: str):
         """Enable all hooks for an extension.
 
         Args:
             extension_id: Extension ID
         """
-        config = self.get_project_config()
-
-        if "hooks" not in config:
-            return
-
-        # Enable all hooks for this extension
-        for hook_name in config["hooks"]:
-            for hook in config["hooks"][hook_name]:
-                if hook.get("extension") == extension_id:
-                    hook["enabled"] = True
-
-        self.save_project_config(config)
+        self.set_hooks_enabled([extension_id], True)
 
     def disable_hooks(self, extension_id: str):
         """Disable all hooks for an extension.
@@ -1769,17 +3075,4 @@ class HookExecutor:
         Args:
             extension_id: Extension ID
         """
-        config = self.get_project_config()
-
-        if "hooks" not in config:
-            return
-
-        # Disable all hooks for this extension
-        for hook_name in config["hooks"]:
-            for hook in config["hooks"][hook_name]:
-                if hook.get("extension") == extension_id:
-                    hook["enabled"] = False
-
-        self.save_project_config(config)
-
-
+        self.set_hooks_enabled([extension_id], False)
@@ -0,0 +1,243 @@
+"""
+Hook condition expressions for the Specify CLI.
+
+Hooks in ``extension.yml`` may carry a ``condition`` that decides whether the
+hook runs. Conditions are parsed once into a small tree made of plain lists
+and strings, so it can be stored next to the hook entry in
+``.specify/extensions.yml`` and evaluated later without re-parsing.
+
+Grammar (keywords are case-insensitive)::
+
+    expr       := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | "(" expr ")" | test
+    test       := ref "is" ["not"] "set"
+                | ref ("==" | "!=") value
+                | ref ["not"] "in" "[" value ("," value)* "]"
+    ref        := config.<key.path> | env.<VAR_NAME>
+    value      := 'quoted' | "quoted" | bare word (e.g. true, 3, prod)
+
+Compiled nodes::
+
+    ["or", node, node, ...]      ["and", node, node, ...]     ["not", node]
+    ["set", source, name]        ["eq", source, name, value]
+    ["ne", source, name, value]  ["in", source, name, [value, ...]]
+
+where source is "config" or "env". Values are compared as strings; YAML
+booleans compare as "true"/"false".
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+
+# Bumped whenever the node layout changes, so stale stored trees are recompiled
+VERSION = 1
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<str>'[^']*'|"[^"]*")
+        |(?P<op>==|!=|[()\[\],])
+        |(?P<word>[A-Za-z0-9_.\-]+)
+    )""",
+    re.VERBOSE,
+)
+_CONFIG_KEY_RE = re.compile(r"[A-Za-z0-9_]+(?:\.[A-Za-z0-9_]+)*")
+_ENV_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+_KEYWORDS = frozenset({"and", "or", "not", "in", "is", "set"})
+
+
+class ConditionError(ValueError):
+    """Raised when a hook condition cannot be parsed."""
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise ConditionError(f"Unexpected input at offset {pos}: {text[pos:pos + 20]!r}")
+        pos = match.end()
+        if match.group("str") is not None:
+            tokens.append(("value", match.group("str")[1:-1]))
+        elif match.group("op") is not None:
+            tokens.append(("op", match.group("op")))
+        else:
+            word = match.group("word")
+            lower = word.lower()
+            if lower in _KEYWORDS:
+                tokens.append(("kw", lower))
+            elif lower.startswith(("config.", "env.")):
+                tokens.append(("ref", word))
+            else:
+                tokens.append(("value", word))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser over the token list."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def error(self, message: str) -> ConditionError:
+        return ConditionError(f"{message} in condition {self.text!r}")
+
+    def peek(self) -> Tuple[str, str]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return ("end", "")
+
+    def take(self, kind: str, value: str = None) -> str:
+        tok_kind, tok_value = self.peek()
+        if tok_kind != kind or (value is not None and tok_value != value):
+            expected = value or kind
+            found = tok_value or "end of condition"
+            raise self.error(f"Expected {expected!r}, found {found!r}")
+        self.pos += 1
+        return tok_value
+
+    def accept(self, kind: str, value: str) -> bool:
+        if self.peek() == (kind, value):
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> list:
+        if not self.tokens:
+            raise self.error("Empty expression")
+        node = self.expr()
+        if self.pos != len(self.tokens):
+            raise self.error(f"Unexpected {self.peek()[1]!r}")
+        return node
+
+    def expr(self) -> list:
+        return self._chain("or", self.and_expr)
+
+    def and_expr(self) -> list:
+        return self._chain("and", self.not_expr)
+
+    def _chain(self, keyword: str, operand: Callable[[], list]) -> list:
+        nodes = [operand()]
+        while self.accept("kw", keyword):
+            nodes.append(operand())
+        return nodes[0] if len(nodes) == 1 else [keyword, *nodes]
+
+    def not_expr(self) -> list:
+        if self.accept("kw", "not"):
+            return ["not", self.not_expr()]
+        if self.accept("op", "("):
+            node = self.expr()
+            self.take("op", ")")
+            return node
+        return self.test()
+
+    def test(self) -> list:
+        source, name = self.ref()
+
+        if self.accept("kw", "is"):
+            negate = self.accept("kw", "not")
+            self.take("kw", "set")
+            node = ["set", source, name]
+            return ["not", node] if negate else node
+
+        if self.accept("op", "=="):
+            return ["eq", source, name, self.take("value")]
+        if self.accept("op", "!="):
+            return ["ne", source, name, self.take("value")]
+
+        negate = self.accept("kw", "not")
+        self.take("kw", "in")
+        self.take("op", "[")
+        values = [self.take("value")]
+        while self.accept("op", ","):
+            values.append(self.take("value"))
+        self.take("op", "]")
+        node = ["in", source, name, values]
+        return ["not", node] if negate else node
+
+    def ref(self) -> Tuple[str, str]:
+        word = self.take("ref")
+        source, _, name = word.partition(".")
+        source = source.lower()
+        if source == "config":
+            if not _CONFIG_KEY_RE.fullmatch(name):
+                raise self.error(f"Invalid config key {name!r}")
+            return source, name
+        if not _ENV_NAME_RE.fullmatch(name):
+            raise self.error(f"Invalid environment variable name {name!r}")
+        return source, name.upper()
+
+
+def parse(text: str) -> list:
+    """Compile a condition expression into a node tree.
+
+    The result is a fresh tree of lists and strings that can be stored in
+    YAML or JSON.
+
+    Raises:
+        ConditionError: If the expression is not valid
+    """
+    return _Parser(text.strip()).parse()
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(text: str) -> list:
+    return parse(text)
+
+
+def compiled(text: str) -> list:
+    """Return the compiled tree for an expression, memoized per process.
+
+    The returned tree is shared and must not be mutated.
+
+    Raises:
+        ConditionError: If the expression is not valid
+    """
+    return _parse_cached(text)
+
+
+def _as_text(value: Any) -> str:
+    # YAML True/False compare as the strings 'true'/'false'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def evaluate(node: list, resolve: Callable[[str, str], Tuple[bool, Any]]) -> bool:
+    """Evaluate a compiled tree.
+
+    Args:
+        node: Tree returned by parse() or compiled()
+        resolve: Called as resolve(source, name) and returns (found, value);
+            returning None means the reference cannot be resolved at all
+            (e.g. config without an extension), which makes the test false
+
+    Raises:
+        ConditionError: If the tree contains an unknown node
+    """
+    op = node[0]
+    if op == "and":
+        return all(evaluate(child, resolve) for child in node[1:])
+    if op == "or":
+        return any(evaluate(child, resolve) for child in node[1:])
+    if op == "not":
+        return not evaluate(node[1], resolve)
+
+    resolved = resolve(node[1], node[2])
+    if resolved is None:
+        return False
+    found, value = resolved
+    if op == "set":
+        return found
+    if op == "eq":
+        return _as_text(value) == node[3]
+    if op == "ne":
+        return _as_text(value) != node[3]
+    if op == "in":
+        return _as_text(value) in node[3]
+    raise ConditionError(f"Unknown condition node {op!r}")
@@ -0,0 +1,267 @@
+"""
+Shared HTTP transport for the Specify CLI.
+
+Every network call goes through one connection-pooled httpx client per TLS
+mode, so command sequences that make several requests (release lookups,
+template downloads, extension catalog and archive fetches) reuse connections
+instead of paying a TLS handshake per request. Certificates are verified
+against the system trust store via truststore. HTTP/2 is negotiated when the
+optional ``h2`` package is installed (``pip install specify-cli[http2]``).
+
+httpx and truststore are only imported when the first client is created, so
+importing this module costs nothing for commands that stay offline.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import ssl
+
+    import httpx
+
+
+# Timeouts (seconds) and connection pool limits of the shared clients
+TIMEOUT = 30.0
+CONNECT_TIMEOUT = 10.0
+MAX_CONNECTIONS = 16
+MAX_KEEPALIVE_CONNECTIONS = 8
+KEEPALIVE_EXPIRY = 30.0
+
+# Retry policy shared by downloads and API calls
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+# Longest Retry-After a request waits for; a server asking for more (e.g. an
+# exhausted GitHub rate limit) gets its answer returned instead of a retry
+RETRY_AFTER_MAX = 120.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Chunk size for streamed downloads
+CHUNK_SIZE = 64 * 1024
+
+_ssl_context: Optional[ssl.SSLContext] = None
+_clients: dict = {}
+_lock = threading.RLock()
+
+
+def ssl_context() -> ssl.SSLContext:
+    """Return the process-wide truststore SSL context."""
+    global _ssl_context
+    with _lock:
+        if _ssl_context is None:
+            import ssl
+
+            import truststore
+
+            _ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        return _ssl_context
+
+
+def http2_available() -> bool:
+    """Return True if the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_client(*, verify: bool = True) -> httpx.Client:
+    """Create a new pooled client with the shared TLS, timeout and pool settings."""
+    import httpx
+
+    return httpx.Client(
+        verify=ssl_context() if verify else False,
+        http2=http2_available(),
+        timeout=httpx.Timeout(TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def get_client(*, verify: bool = True) -> httpx.Client:
+    """Return the shared client, creating it on first use.
+
+    Args:
+        verify: Verify TLS certificates; False backs ``--skip-tls``
+
+    Returns:
+        Process-wide httpx.Client for the requested TLS mode
+    """
+    with _lock:
+        client = _clients.get(verify)
+        if client is None or client.is_closed:
+            client = _clients[verify] = create_client(verify=verify)
+        return client
+
+
+def close_clients() -> None:
+    """Close all shared clients and their pooled connections."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def _retry_after_seconds(headers: httpx.Headers) -> float:
+    """Seconds a Retry-After header (delta-seconds or HTTP-date) asks to wait; 0 if absent."""
+    value = headers.get("Retry-After", "").strip()
+    if not value:
+        return 0.0
+    if value.isdigit():
+        return float(value)
+    from email.utils import parsedate_to_datetime
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def retry_delay(attempt: int, headers: Optional[httpx.Headers] = None) -> Optional[float]:
+    """Delay before a retry, or None if the server asks to wait too long.
+
+    Without a Retry-After header this is exponential backoff capped at
+    BACKOFF_MAX. A Retry-After is honored in full up to RETRY_AFTER_MAX;
+    past that None is returned and the caller should give up rather than
+    retry before the server is ready.
+    """
+    delay = min(BACKOFF_BASE * (2**attempt), BACKOFF_MAX)
+    if headers is not None:
+        retry_after = _retry_after_seconds(headers)
+        if retry_after > RETRY_AFTER_MAX:
+            return None
+        delay = max(delay, retry_after)
+    return delay
+
+
+def get(
+    url: str,
+    *,
+    client: Optional[httpx.Client] = None,
+    headers: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+) -> httpx.Response:
+    """GET a URL with the shared retry policy and return the read response.
+
+    Transport errors and 429/5xx answers are retried with exponential backoff
+    (see retry_delay); any other status, or a 429/5xx whose Retry-After is
+    past RETRY_AFTER_MAX, is returned to the caller as-is.
+
+    Raises:
+        httpx.HTTPError: If the request still fails after the last retry
+    """
+    import httpx
+
+    if client is None:
+        client = get_client()
+    if max_retries is None:
+        max_retries = MAX_RETRIES
+    attempt = 0
+    while True:
+        try:
+            response = client.get(
+                url,
+                headers=headers,
+                timeout=timeout if timeout is not None else TIMEOUT,
+                follow_redirects=True,
+            )
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+            delay = retry_delay(attempt)
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                return response
+            delay = retry_delay(attempt, response.headers)
+            if delay is None:
+                return response
+        attempt += 1
+        time.sleep(delay)
+
+
+class DownloadTooLargeError(Exception):
+    """Raised when a download exceeds its size limit."""
+
+
+def download(
+    url: str,
+    dest_path: Path,
+    *,
+    max_bytes: Optional[int] = None,
+    client: Optional[httpx.Client] = None,
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+) -> str:
+    """Stream a URL to dest_path in chunks and return its SHA-256 hex digest.
+
+    Bytes go to a ``.part`` file next to dest_path that is renamed into place
+    once complete. Transport errors and 429/5xx answers are retried from the
+    start with the shared backoff policy.
+
+    Raises:
+        DownloadTooLargeError: If the body is larger than max_bytes
+        httpx.HTTPError: If the request fails after the last retry or the
+            server answers with another error status
+    """
+    import httpx
+
+    if client is None:
+        client = get_client()
+    if max_retries is None:
+        max_retries = MAX_RETRIES
+    part_path = dest_path.with_name(dest_path.name + ".part")
+    attempt = 0
+    try:
+        while True:
+            try:
+                with client.stream(
+                    "GET",
+                    url,
+                    timeout=timeout if timeout is not None else TIMEOUT,
+                    follow_redirects=True,
+                ) as response:
+                    delay = None
+                    if response.status_code in RETRY_STATUSES and attempt < max_retries:
+                        delay = retry_delay(attempt, response.headers)
+                    if delay is None:
+                        response.raise_for_status()
+                        length = response.headers.get("content-length", "")
+                        if max_bytes is not None and length.isdigit() and int(length) > max_bytes:
+                            raise DownloadTooLargeError(
+                                f"{url} is {int(length):,} bytes, over the {max_bytes:,} byte limit"
+                            )
+                        hasher = hashlib.sha256()
+                        received = 0
+                        with open(part_path, "wb") as f:
+                            for chunk in response.iter_bytes(CHUNK_SIZE):
+                                received += len(chunk)
+                                if max_bytes is not None and received > max_bytes:
+                                    raise DownloadTooLargeError(
+                                        f"{url} exceeds the {max_bytes:,} byte limit"
+                                    )
+                                f.write(chunk)
+                                hasher.update(chunk)
+                        os.replace(part_path, dest_path)
+                        return hasher.hexdigest()
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+                delay = retry_delay(attempt)
+            attempt += 1
+            time.sleep(delay)
+    finally:
+        part_path.unlink(missing_ok=True)
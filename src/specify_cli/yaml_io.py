@@ -0,0 +1,87 @@
+"""
+YAML parsing and emitting for the Specify CLI.
+
+All YAML the CLI reads or writes (extension manifests, extensions.yml,
+extension configs, command frontmatter) goes through this module, which uses
+PyYAML's libyaml-backed ``CSafeLoader``/``CSafeDumper`` when PyYAML was built
+against libyaml and falls back to the pure-Python ``SafeLoader``/``SafeDumper``
+otherwise. Both backends only construct plain Python types.
+
+Set ``SPECIFY_YAML_PURE=1`` to force the pure-Python backend, e.g. to rule out
+a libyaml difference when debugging.
+
+PyYAML is imported on first use: ``specify hooks check`` usually answers from
+the JSON hook cache and never parses YAML. ``YAMLError``, ``HAS_LIBYAML``,
+``Loader`` and ``Dumper`` are resolved then as well.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+_LAZY = ("yaml", "YAMLError", "HAS_LIBYAML", "Loader", "Dumper")
+
+
+def _setup() -> None:
+    global yaml, YAMLError, HAS_LIBYAML, Loader, Dumper
+    import yaml
+
+    YAMLError = yaml.YAMLError
+    HAS_LIBYAML = hasattr(yaml, "CSafeLoader") and hasattr(yaml, "CSafeDumper")
+    if HAS_LIBYAML and os.environ.get("SPECIFY_YAML_PURE", "").lower() not in ("1", "true", "yes"):
+        Loader = yaml.CSafeLoader
+        Dumper = yaml.CSafeDumper
+    else:
+        Loader = yaml.SafeLoader
+        Dumper = yaml.SafeDumper
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        _setup()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _yaml():
+    if "yaml" not in globals():
+        _setup()
+    return yaml
+
+
+def backend() -> str:
+    """Return the name of the YAML backend in use: "libyaml" or "python"."""
+    safe_loader = _yaml().SafeLoader
+    return "libyaml" if Loader is not safe_loader else "python"
+
+
+def load(stream) -> Any:
+    """Parse a YAML document from a string or file object.
+
+    Raises:
+        YAMLError: If the document is not valid YAML
+    """
+    return _yaml().load(stream, Loader=Loader)
+
+
+def load_file(path: Path) -> Any:
+    """Parse the YAML document stored at path.
+
+    Raises:
+        OSError: If the file cannot be read
+        YAMLError: If the document is not valid YAML
+    """
+    with open(path, 'rb') as f:
+        return _yaml().load(f, Loader=Loader)
+
+
+def dump(data: Any, stream=None, **kwargs) -> Optional[str]:
+    """Emit data as block-style YAML, keeping mapping order.
+
+    Keyword arguments are passed to ``yaml.dump`` and override the defaults
+    (``default_flow_style=False``, ``sort_keys=False``). Returns the YAML text
+    when stream is None.
+    """
+    kwargs.setdefault("default_flow_style", False)
+    kwargs.setdefault("sort_keys", False)
+    return _yaml().dump(data, stream, Dumper=Dumper, **kwargs)
@@ -0,0 +1 @@
+"""Benchmark harness for the Specify CLI (see run.py)."""
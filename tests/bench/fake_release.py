@@ -0,0 +1,147 @@
+"""
+Local stand-in for the GitHub releases API used by the benchmarks.
+
+Serves ``/repos/github/spec-kit/releases/latest`` and the template archives it
+lists from 127.0.0.1, so ``specify init`` can be timed without network access
+(point the CLI at it with SPECIFY_GITHUB_API_URL). Archive downloads support
+HTTP Range requests like the real release CDN.
+"""
+
+import hashlib
+import io
+import json
+import re
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from specify_cli import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+
+
+RELEASE_TAG = "v9.9.9"
+
+# Roughly the shape and size of a real template archive
+SCRIPTS = ["check-prerequisites", "common", "create-new-feature", "setup-plan", "update-agent-context"]
+TEMPLATES = ["agent-file-template", "checklist-template", "plan-template", "spec-template", "tasks-template"]
+COMMANDS = ["analyze", "checklist", "clarify", "constitution", "implement", "plan", "specify", "tasks", "taskstoissues"]
+
+
+def build_template_archive(agent: str, script_type: str, padding: int = 4000) -> bytes:
+    """Build a template ZIP for one agent/script combination."""
+    folder = AGENT_CONFIG[agent]["folder"].rstrip("/")
+    script_dir, script_ext = ("bash", ".sh") if script_type == "sh" else ("powershell", ".ps1")
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n" * (padding // 58)
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in SCRIPTS:
+            zf.writestr(f".specify/scripts/{script_dir}/{name}{script_ext}", f"# {name}\n{filler}")
+        for name in TEMPLATES:
+            zf.writestr(f".specify/templates/{name}.md", f"# {name}\n{filler}")
+        zf.writestr(".specify/memory/constitution.md", f"# Constitution\n{filler}")
+        for name in COMMANDS:
+            zf.writestr(
+                f"{folder}/commands/speckit.{name}.md",
+                f"---\ndescription: {name}\n---\n\n$ARGUMENTS\n{filler}",
+            )
+        zf.writestr(".vscode/settings.json", json.dumps({"chat.promptFiles": True}))
+    return buffer.getvalue()
+
+
+class FakeReleaseServer:
+    """Threaded HTTP server publishing one release with template archives.
+
+    Usage:
+        with FakeReleaseServer(["claude"]) as server:
+            env["SPECIFY_GITHUB_API_URL"] = server.url
+    """
+
+    def __init__(self, agents=None, script_types=None):
+        agents = agents or list(AGENT_CONFIG)
+        script_types = script_types or list(SCRIPT_TYPE_CHOICES)
+        self.archives = {
+            f"spec-kit-template-{agent}-{script}-{RELEASE_TAG}.zip": build_template_archive(agent, script)
+            for agent in agents
+            for script in script_types
+        }
+        self.requests = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def release(self) -> dict:
+        return {
+            "tag_name": RELEASE_TAG,
+            "published_at": "2026-01-01T00:00:00Z",
+            "assets": [
+                {
+                    "name": name,
+                    "size": len(data),
+                    "digest": "sha256:" + hashlib.sha256(data).hexdigest(),
+                    "browser_download_url": f"{self.url}/download/{name}",
+                }
+                for name, data in self.archives.items()
+            ],
+        }
+
+    def __enter__(self) -> "FakeReleaseServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(self.path)
+                if self.path.endswith("/releases/latest"):
+                    body = json.dumps(server.release()).encode()
+                    etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+                        return
+                    self._send(200, body, {"Content-Type": "application/json", "ETag": etag})
+                    return
+
+                name = self.path.rsplit("/", 1)[-1]
+                data = server.archives.get(name)
+                if data is None:
+                    self._send(404, b"not found")
+                    return
+                match = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+                if match is None:
+                    self._send(200, data, {"Content-Type": "application/zip"})
+                    return
+                first, last = match.groups()
+                if first:
+                    start, end = int(first), int(last) if last else len(data) - 1
+                else:
+                    start, end = max(0, len(data) - int(last)), len(data) - 1
+                self._send(
+                    206,
+                    data[start : end + 1],
+                    {"Content-Range": f"bytes {start}-{end}/{len(data)}"},
+                )
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
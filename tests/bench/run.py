@@ -0,0 +1,446 @@
+"""
+Benchmark harness for the Specify CLI hot paths.
+
+Measures, in fresh interpreter processes:
+- import time of the CLI module (specify_cli.cli)
+- ``specify init --no-git --ignore-agent-tools`` against a local fake release
+  server, with a cold and a warm template cache
+- ``specify extension add --dev`` for N commands x M agents
+- ``specify extension list`` with 1/50/500 installed extensions
+- hook resolution over a large ``extensions.yml`` and command registration,
+  in-process, with the libyaml and the pure-Python YAML backends
+- ``specify hooks check after_tasks --json`` over 50/500 extensions with
+  conditional hooks
+- ``specify extension search`` over a cached catalog of 1000/5000 entries
+
+Results are written as JSON; pass a previous results file with --baseline to
+fail when a median regresses past --max-regression.
+
+Usage:
+    python -m tests.bench --output bench-results.json
+    python -m tests.bench --quick --baseline bench-results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+
+from specify_cli import get_speckit_version
+from specify_cli import yaml_io
+from specify_cli.extensions import (
+    CommandRegistrar,
+    ExtensionManager,
+    ExtensionManifest,
+    HookExecutor,
+)
+
+from .fake_release import FakeReleaseServer
+
+
+SCHEMA_VERSION = 1
+
+# (commands, agents) combinations for extension add
+ADD_MATRIX = [(1, 1), (10, 4), (50, len(CommandRegistrar.AGENT_CONFIGS))]
+LIST_SIZES = [1, 50, 500]
+# (extensions in extensions.yml, commands registered) for the YAML backends
+YAML_SIZES = [(500, 50)]
+
+QUICK_ADD_MATRIX = [(5, 2)]
+QUICK_LIST_SIZES = [1, 50]
+QUICK_YAML_SIZES = [(50, 10)]
+# Extensions with hooks in extensions.yml for hooks check
+HOOKS_CHECK_SIZES = [50, 500]
+QUICK_HOOKS_CHECK_SIZES = [50]
+# Extensions in the cached catalog for extension search
+CATALOG_SIZES = [1000, 5000]
+QUICK_CATALOG_SIZES = [500]
+
+CLI_ENTRY = "import sys; from specify_cli import main; sys.argv[0] = 'specify'; main()"
+
+
+def run_cli(args: list, cwd: Path, env: dict) -> float:
+    """Run the CLI in a fresh process and return its wall time in seconds."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CLI_ENTRY, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"specify {' '.join(args)} failed ({result.returncode}):\n{result.stdout}\n{result.stderr}"
+        )
+    return elapsed
+
+
+def summarize(name: str, params: dict, samples: list) -> dict:
+    """Build a result record from samples in seconds."""
+    samples_ms = [round(s * 1000, 2) for s in samples]
+    return {
+        "name": name,
+        "params": params,
+        "unit": "ms",
+        "samples": samples_ms,
+        "median": round(statistics.median(samples_ms), 2),
+        "min": min(samples_ms),
+        "max": max(samples_ms),
+    }
+
+
+def base_env(workdir: Path) -> dict:
+    """Environment isolating the CLI's caches inside workdir."""
+    env = dict(os.environ)
+    env["SPECIFY_HTTP_CACHE_DIR"] = str(workdir / "http-cache")
+    env["SPECIFY_TEMPLATE_CACHE_DIR"] = str(workdir / "template-cache")
+    env["COLUMNS"] = "120"
+    env.pop("GH_TOKEN", None)
+    env.pop("GITHUB_TOKEN", None)
+    return env
+
+
+# ===== Benchmarks =====
+
+def bench_import(workdir: Path, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import specify_cli.cli"], check=True)
+        samples.append(time.perf_counter() - start)
+    return [summarize("import", {}, samples)]
+
+
+def bench_init(workdir: Path, repeat: int) -> list:
+    results = []
+    with FakeReleaseServer(agents=["claude"], script_types=["sh"]) as server:
+        for cache in ("cold", "warm"):
+            samples = []
+            for i in range(repeat + (1 if cache == "warm" else 0)):
+                run_dir = workdir / f"init-{cache}-{i}"
+                run_dir.mkdir()
+                env = base_env(workdir if cache == "warm" else run_dir)
+                env["SPECIFY_GITHUB_API_URL"] = server.url
+                elapsed = run_cli(
+                    [
+                        "init", "project", "--ai", "claude", "--script", "sh",
+                        "--no-git", "--ignore-agent-tools",
+                    ],
+                    run_dir,
+                    env,
+                )
+                # The first warm run only fills the shared cache
+                if cache == "cold" or i > 0:
+                    samples.append(elapsed)
+            results.append(summarize("init", {"cache": cache}, samples))
+    return results
+
+
+def make_project(root: Path, agents: int) -> Path:
+    """Create a spec-kit project with the first `agents` agent directories."""
+    (root / ".specify").mkdir(parents=True)
+    for config in list(CommandRegistrar.AGENT_CONFIGS.values())[:agents]:
+        (root / config["dir"]).mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def make_extension(root: Path, ext_id: str, commands: int) -> Path:
+    """Create an extension directory providing `commands` commands."""
+    (root / "commands").mkdir(parents=True)
+    provided = []
+    for i in range(commands):
+        name = f"cmd{i}"
+        (root / "commands" / f"{name}.md").write_text(
+            "---\n"
+            f"description: Benchmark command {i}\n"
+            "scripts:\n"
+            "  sh: ../../scripts/bash/setup.sh\n"
+            "---\n\n"
+            f"# Command {i}\n\nRun with $ARGUMENTS.\n" + "Details.\n" * 100
+        )
+        provided.append({"name": f"speckit.{ext_id}.{name}", "file": f"commands/{name}.md"})
+    manifest = {
+        "schema_version": "1.0",
+        "extension": {
+            "id": ext_id,
+            "name": f"Benchmark {ext_id}",
+            "version": "1.0.0",
+            "description": "Benchmark extension",
+        },
+        "requires": {"speckit_version": ">=0.0.1"},
+        "provides": {"commands": provided},
+        "hooks": {"after_tasks": {"command": provided[0]["name"], "optional": True}},
+    }
+    (root / "extension.yml").write_text(yaml.safe_dump(manifest, sort_keys=False))
+    return root
+
+
+def bench_extension_add(workdir: Path, repeat: int, matrix: list) -> list:
+    results = []
+    env = base_env(workdir)
+    for commands, agents in matrix:
+        source = make_extension(workdir / f"ext-{commands}", "bench", commands)
+        samples = []
+        for i in range(repeat):
+            project = make_project(workdir / f"add-{commands}x{agents}-{i}", agents)
+            samples.append(run_cli(["extension", "add", str(source), "--dev"], project, env))
+        results.append(
+            summarize("extension_add", {"commands": commands, "agents": agents}, samples)
+        )
+    return results
+
+
+def bench_extension_list(workdir: Path, repeat: int, sizes: list) -> list:
+    results = []
+    env = base_env(workdir)
+    speckit_version = get_speckit_version()
+    if speckit_version == "unknown":
+        speckit_version = "0.0.0"
+    for size in sizes:
+        project = make_project(workdir / f"list-{size}", 1)
+        manager = ExtensionManager(project)
+        for i in range(size):
+            source = make_extension(workdir / f"list-{size}-src" / f"ext-{i}", f"ext-{i}", 3)
+            manager.install_from_directory(source, speckit_version, register_commands=False)
+        samples = [run_cli(["extension", "list"], project, env) for _ in range(repeat)]
+        results.append(summarize("extension_list", {"installed": size}, samples))
+    return results
+
+
+@contextmanager
+def yaml_backend(name: str):
+    """Temporarily switch specify_cli.yaml_io to the named backend."""
+    saved = yaml_io.Loader, yaml_io.Dumper
+    if name == "libyaml":
+        yaml_io.Loader, yaml_io.Dumper = yaml.CSafeLoader, yaml.CSafeDumper
+    else:
+        yaml_io.Loader, yaml_io.Dumper = yaml.SafeLoader, yaml.SafeDumper
+    try:
+        yield
+    finally:
+        yaml_io.Loader, yaml_io.Dumper = saved
+
+
+def write_hooks_config(project: Path, extensions: int, condition: str = None):
+    """Write an extensions.yml registering three hooks for each extension.
+
+    With a condition, every other extension's hooks carry it.
+    """
+    hooks = {event: [] for event in ("after_tasks", "after_implement", "before_commit")}
+    for i in range(extensions):
+        for event, entries in hooks.items():
+            entries.append({
+                "extension": f"ext-{i}",
+                "command": f"speckit.ext-{i}.{event}",
+                "enabled": i % 10 != 0,
+                "optional": True,
+                "prompt": f"Execute speckit.ext-{i}.{event}?",
+                "description": f"Hook {event} of extension {i}",
+                "condition": condition if i % 2 else None,
+            })
+    config = {
+        "installed": [f"ext-{i}" for i in range(extensions)],
+        "settings": {"auto_execute_hooks": True},
+        "hooks": hooks,
+    }
+    (project / ".specify" / "extensions.yml").write_text(yaml.safe_dump(config, sort_keys=False))
+
+
+def bench_yaml(workdir: Path, repeat: int, sizes: list) -> list:
+    backends = ["libyaml", "python"] if yaml_io.HAS_LIBYAML else ["python"]
+    registrar = CommandRegistrar()
+    results = []
+    for extensions, commands in sizes:
+        project = make_project(workdir / f"yaml-{extensions}x{commands}", 1)
+        write_hooks_config(project, extensions)
+        source = make_extension(workdir / f"yaml-ext-{commands}", "bench", commands)
+        manifest = ExtensionManifest(source / "extension.yml")
+        for backend in backends:
+            with yaml_backend(backend):
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    HookExecutor(project).get_hooks_for_event("after_tasks")
+                    samples.append(time.perf_counter() - start)
+                results.append(summarize(
+                    "yaml_hooks", {"backend": backend, "extensions": extensions}, samples
+                ))
+
+                samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    registrar.register_commands_for_agent("claude", manifest, source, project)
+                    samples.append(time.perf_counter() - start)
+                results.append(summarize(
+                    "yaml_register", {"backend": backend, "commands": commands}, samples
+                ))
+    return results
+
+
+def bench_hooks_check(workdir: Path, repeat: int, sizes: list) -> list:
+    results = []
+    env = base_env(workdir)
+    env.pop("SPECKIT_BENCH_SKIP", None)
+    for size in sizes:
+        project = make_project(workdir / f"hooks-{size}", 1)
+        write_hooks_config(
+            project, size, "env.SPECKIT_BENCH_SKIP is not set and config.enabled != 'false'"
+        )
+        args = ["hooks", "check", "after_tasks", "--json"]
+        samples = [run_cli(args, project, env) for _ in range(repeat)]
+        results.append(summarize("hooks_check", {"extensions": size}, samples))
+    return results
+
+
+def write_catalog_cache(project: Path, size: int):
+    """Write a fresh cached catalog of size extensions; every 250th mentions "needle"."""
+    words = ["tracker", "sync", "docs", "review", "deploy", "metrics", "lint", "release"]
+    extensions = {}
+    for i in range(size):
+        ext_id = f"ext-{i}"
+        extensions[ext_id] = {
+            "name": f"Extension {i} {words[i % len(words)].title()}",
+            "id": ext_id,
+            "version": "1.0.0",
+            "description": " ".join(words[(i + j) % len(words)] for j in range(12))
+            + (" needle" if i % 250 == 0 else ""),
+            "author": f"author-{i % 40}",
+            "tags": [words[i % len(words)], words[(i * 3) % len(words)]],
+            "verified": i % 7 == 0,
+        }
+    cache_dir = project / ".specify" / "extensions" / ".cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / "catalog.json").write_text(
+        json.dumps({"schema_version": "1.0", "extensions": extensions}, indent=2)
+    )
+    (cache_dir / "catalog-metadata.json").write_text(json.dumps({
+        "cached_at": datetime.now(timezone.utc).isoformat(),
+        "catalog_url": "https://example.invalid/catalog.json",
+    }))
+
+
+def bench_catalog_search(workdir: Path, repeat: int, sizes: list) -> list:
+    results = []
+    env = base_env(workdir)
+    for size in sizes:
+        project = make_project(workdir / f"catalog-{size}", 1)
+        write_catalog_cache(project, size)
+        # The first run builds and saves the index; samples measure later runs
+        run_cli(["extension", "search", "needle"], project, env)
+        samples = [run_cli(["extension", "search", "needle"], project, env) for _ in range(repeat)]
+        results.append(summarize("catalog_search", {"extensions": size}, samples))
+    return results
+
+
+# ===== Reporting =====
+
+def result_key(result: dict) -> str:
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]"
+
+
+def compare(results: list, baseline: dict, max_regression: float) -> list:
+    """Return descriptions of benchmarks whose median regressed past the limit."""
+    previous = {result_key(r): r for r in baseline.get("benchmarks", [])}
+    regressions = []
+    for result in results:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        limit = old["median"] * (1 + max_regression)
+        if result["median"] > limit:
+            regressions.append(
+                f"{result_key(result)}: {result['median']:.1f} ms vs baseline "
+                f"{old['median']:.1f} ms (limit {limit:.1f} ms)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Specify CLI hot paths")
+    parser.add_argument("--output", type=Path, default=Path("bench-results.json"))
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark")
+    parser.add_argument("--quick", action="store_true", help="One sample and small sizes")
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=[
+            "import", "init", "extension_add", "extension_list", "yaml", "hooks_check",
+            "catalog_search",
+        ],
+        help="Run only the named benchmark (repeatable)",
+    )
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed median slowdown against the baseline (0.25 = 25%%)",
+    )
+    args = parser.parse_args(argv)
+
+    repeat = 1 if args.quick else args.repeat
+    add_matrix = QUICK_ADD_MATRIX if args.quick else ADD_MATRIX
+    list_sizes = QUICK_LIST_SIZES if args.quick else LIST_SIZES
+    yaml_sizes = QUICK_YAML_SIZES if args.quick else YAML_SIZES
+    hooks_check_sizes = QUICK_HOOKS_CHECK_SIZES if args.quick else HOOKS_CHECK_SIZES
+    catalog_sizes = QUICK_CATALOG_SIZES if args.quick else CATALOG_SIZES
+    benchmarks = {
+        "import": lambda d: bench_import(d, repeat),
+        "init": lambda d: bench_init(d, repeat),
+        "extension_add": lambda d: bench_extension_add(d, repeat, add_matrix),
+        "extension_list": lambda d: bench_extension_list(d, repeat, list_sizes),
+        "yaml": lambda d: bench_yaml(d, repeat, yaml_sizes),
+        "hooks_check": lambda d: bench_hooks_check(d, repeat, hooks_check_sizes),
+        "catalog_search": lambda d: bench_catalog_search(d, repeat, catalog_sizes),
+    }
+
+    results = []
+    for name, bench in benchmarks.items():
+        if args.only and name not in args.only:
+            continue
+        workdir = Path(tempfile.mkdtemp(prefix=f"specify-bench-{name}-"))
+        try:
+            for result in bench(workdir):
+                results.append(result)
+                print(f"{result_key(result):<45} median {result['median']:>9.1f} ms")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "specify_cli": get_speckit_version(),
+        },
+        "benchmarks": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
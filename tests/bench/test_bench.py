@@ -0,0 +1,115 @@
+"""
+Smoke tests for the benchmark harness.
+
+Tests cover:
+- The fake release server answers like the GitHub releases API
+- specify init against the fake server produces a project
+- A quick harness run writes well-formed JSON and detects regressions
+"""
+
+import json
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+from .fake_release import RELEASE_TAG, FakeReleaseServer
+from .run import CLI_ENTRY, base_env, compare, main
+
+
+# ===== Fake Release Server Tests =====
+
+class TestFakeReleaseServer:
+    """Test the local release server used by the init benchmark."""
+
+    def test_latest_release_and_revalidation(self):
+        """Test the release listing carries an ETag honored by If-None-Match."""
+        with FakeReleaseServer(agents=["claude"], script_types=["sh"]) as server:
+            response = httpx.get(f"{server.url}/repos/github/spec-kit/releases/latest")
+            assert response.status_code == 200
+            assert response.json()["tag_name"] == RELEASE_TAG
+            etag = response.headers["ETag"]
+
+            again = httpx.get(
+                f"{server.url}/repos/github/spec-kit/releases/latest",
+                headers={"If-None-Match": etag},
+            )
+            assert again.status_code == 304
+
+    def test_range_download(self):
+        """Test archive downloads honor HTTP Range requests."""
+        with FakeReleaseServer(agents=["claude"], script_types=["sh"]) as server:
+            asset = server.release()["assets"][0]
+            data = server.archives[asset["name"]]
+
+            response = httpx.get(asset["browser_download_url"], headers={"Range": "bytes=10-"})
+            assert response.status_code == 206
+            assert response.content == data[10:]
+
+    def test_init_against_server(self, temp_dir):
+        """Test specify init fetches its template from the fake server."""
+        with FakeReleaseServer(agents=["claude"], script_types=["sh"]) as server:
+            env = base_env(temp_dir)
+            env["SPECIFY_GITHUB_API_URL"] = server.url
+            result = subprocess.run(
+                [sys.executable, "-c", CLI_ENTRY, "init", "proj", "--ai", "claude",
+                 "--script", "sh", "--no-git", "--ignore-agent-tools"],
+                cwd=temp_dir,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0, result.stdout + result.stderr
+            assert any(path.startswith("/download/") for path in server.requests)
+
+        assert (temp_dir / "proj" / ".claude" / "commands" / "speckit.plan.md").exists()
+        assert (temp_dir / "proj" / ".specify" / "templates" / "spec-template.md").exists()
+
+
+# ===== Harness Tests =====
+
+class TestHarness:
+    """Test the benchmark runner and its JSON report."""
+
+    def test_quick_run_writes_report(self, temp_dir):
+        """Test a quick run reports every benchmark with millisecond samples."""
+        output = temp_dir / "results.json"
+        assert main(["--quick", "--output", str(output)]) == 0
+
+        report = json.loads(output.read_text())
+        names = {result["name"] for result in report["benchmarks"]}
+        assert names == {
+            "import", "init", "extension_add", "extension_list", "yaml_hooks", "yaml_register",
+            "hooks_check", "catalog_search",
+        }
+        for result in report["benchmarks"]:
+            assert result["unit"] == "ms"
+            assert result["samples"]
+            assert result["min"] <= result["median"] <= result["max"]
+
+    def test_baseline_regression_fails(self, temp_dir):
+        """Test a run slower than the baseline past the limit exits non-zero."""
+        baseline = temp_dir / "baseline.json"
+        baseline.write_text(json.dumps({
+            "benchmarks": [{"name": "import", "params": {}, "median": 0.001}],
+        }))
+        output = temp_dir / "results.json"
+
+        assert main(["--quick", "--only", "import", "--output", str(output),
+                     "--baseline", str(baseline)]) == 1
+
+    def test_compare_matches_params(self):
+        """Test regressions are matched on benchmark name and parameters."""
+        baseline = {"benchmarks": [
+            {"name": "extension_list", "params": {"installed": 1}, "median": 100.0},
+            {"name": "extension_list", "params": {"installed": 50}, "median": 100.0},
+        ]}
+        results = [
+            {"name": "extension_list", "params": {"installed": 1}, "median": 110.0},
+            {"name": "extension_list", "params": {"installed": 50}, "median": 200.0},
+        ]
+
+        regressions = compare(results, baseline, 0.25)
+        assert len(regressions) == 1
+        assert "installed=50" in regressions[0]
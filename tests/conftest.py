@@ -0,0 +1,15 @@
+"""Shared fixtures for the test suite."""
+
+import tempfile
+import shutil
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    tmpdir = tempfile.mkdtemp()
+    yield Path(tmpdir)
+    shutil.rmtree(tmpdir)
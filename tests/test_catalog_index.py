@@ -0,0 +1,106 @@
+"""
+Unit tests for the extension catalog search index.
+
+Tests cover:
+- Token and prefix matching with every query word required
+- BM25 ranking with field weights
+- Tag, author and verified filters
+- Saving and reloading the index against the catalog's stat stamp
+"""
+
+import pytest
+
+from specify_cli.catalog_index import CatalogIndex, tokenize
+
+
+# ===== Fixtures =====
+
+@pytest.fixture
+def extensions():
+    """A small catalog "extensions" mapping."""
+    return {
+        "jira": {
+            "name": "Jira Integration",
+            "description": "Create Jira issues from tasks",
+            "author": "Stats Perform",
+            "tags": ["issue-tracking", "jira"],
+            "verified": True,
+        },
+        "linear": {
+            "name": "Linear Integration",
+            "description": "Sync tasks with Linear, an alternative to Jira",
+            "author": "Community",
+            "tags": ["issue-tracking"],
+        },
+        "github": {
+            "name": "GitHub Projects",
+            "description": "Project boards for specs",
+            "author": "community",
+            "tags": ["vcs", "github"],
+            "verified": True,
+        },
+    }
+
+
+# ===== Search Tests =====
+
+class TestCatalogIndex:
+    """Test searching and ranking catalog entries."""
+
+    def test_tokenize(self):
+        """Test tokens are lower-cased alphanumeric runs."""
+        assert tokenize("Issue-Tracking for GitHub v2!") == ["issue", "tracking", "for", "github", "v2"]
+
+    def test_ranks_name_and_id_above_description(self, extensions):
+        """Test an extension named after the query ranks above one mentioning it."""
+        index = CatalogIndex.build(extensions)
+        assert index.search("jira") == ["jira", "linear"]
+
+    def test_prefix_and_all_words(self, extensions):
+        """Test partial words match and every query word must match."""
+        index = CatalogIndex.build(extensions)
+        assert index.search("integ") == ["jira", "linear"]
+        assert index.search("linear integration") == ["linear"]
+        assert index.search("jira boards") == []
+        assert index.search("!!!") == []
+
+    def test_exact_term_beats_prefix(self):
+        """Test an exact term match outranks a longer term sharing the prefix."""
+        index = CatalogIndex.build({
+            "specs": {"name": "Specs", "description": "x"},
+            "spec": {"name": "Spec", "description": "x"},
+        })
+        assert index.search("spec") == ["spec", "specs"]
+
+    def test_filters(self, extensions):
+        """Test tag, author and verified filters, alone and with a query."""
+        index = CatalogIndex.build(extensions)
+        assert index.search() == ["jira", "linear", "github"]
+        assert index.search(tag="Issue-Tracking") == ["jira", "linear"]
+        assert index.search(author="COMMUNITY") == ["linear", "github"]
+        assert index.search(verified_only=True) == ["jira", "github"]
+        assert index.search("tasks", tag="issue-tracking", verified_only=True) == ["jira"]
+        assert index.search(tag="missing") == []
+
+
+# ===== Persistence Tests =====
+
+class TestPersistence:
+    """Test saving and loading the index."""
+
+    def test_round_trip_checks_source(self, temp_dir, extensions):
+        """Test a saved index is reused only for the catalog stamp it was built from."""
+        path = temp_dir / "catalog-index.json"
+        stamp = [1, 2, 3]
+        path.write_text(CatalogIndex.build(extensions, stamp).to_json())
+
+        loaded = CatalogIndex.load(path, stamp)
+        assert loaded is not None
+        assert loaded.search("jira") == ["jira", "linear"]
+
+        assert CatalogIndex.load(path, [1, 2, 4]) is None
+        assert CatalogIndex.load(path, None) is None
+        assert CatalogIndex.load(temp_dir / "missing.json", stamp) is None
+
+        path.write_text("{not json")
+        assert CatalogIndex.load(path, stamp) is None
@@ -19,7 +19,10 @@ from specify_cli.extensions import (
     ExtensionManifest,
     ExtensionRegistry,
     ExtensionManager,
+    ManifestCache,
     CommandRegistrar,
+    ConfigManager,
+    HookExecutor,
     ExtensionCatalog,
     ExtensionError,
     ValidationError,
@@ -275,6 +278,147 @@ class TestExtensionRegistry:
         assert registry2.is_installed("test-ext")
         assert registry2.get("test-ext")["version"] == "1.0.0"
 
+    def test_failed_write_keeps_previous_snapshot(self, temp_dir, monkeypatch):
+        """Test a crash while saving leaves the previous registry intact."""
+        extensions_dir = temp_dir / "extensions"
+        registry = ExtensionRegistry(extensions_dir, mode="snapshot")
+        registry.add("first", {"version": "1.0.0"})
+
+        def crash(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("specify_cli.extensions.os.replace", crash)
+        with pytest.raises(OSError):
+            registry.add("second", {"version": "1.0.0"})
+        monkeypatch.undo()
+
+        reloaded = ExtensionRegistry(extensions_dir)
+        assert reloaded.is_installed("first")
+        assert not reloaded.is_installed("second")
+        assert sorted(p.name for p in extensions_dir.iterdir()) == [".registry", ".registry.lock"]
+
+    def test_update_keeps_install_time(self, temp_dir):
+        """Test update changes fields without touching installed_at."""
+        registry = ExtensionRegistry(temp_dir / "extensions")
+        registry.add("test-ext", {"version": "1.0.0", "enabled": True})
+        installed_at = registry.get("test-ext")["installed_at"]
+
+        registry.update("test-ext", {"enabled": False})
+
+        reloaded = ExtensionRegistry(temp_dir / "extensions")
+        assert reloaded.get("test-ext")["enabled"] is False
+        assert reloaded.get("test-ext")["installed_at"] == installed_at
+        with pytest.raises(ExtensionError):
+            registry.update("missing", {"enabled": True})
+
+    def test_log_mode_appends_instead_of_rewriting(self, temp_dir):
+        """Test log mode records mutations in the log and leaves the snapshot alone."""
+        extensions_dir = temp_dir / "extensions"
+        registry = ExtensionRegistry(extensions_dir, mode="log")
+        registry.add("a", {"version": "1.0.0"})
+        registry.add("b", {"version": "1.0.0"})
+        registry.remove("a")
+
+        assert not (extensions_dir / ".registry").exists()
+        lines = (extensions_dir / ".registry.log").read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["add", "add", "remove"]
+
+        reloaded = ExtensionRegistry(extensions_dir, mode="snapshot")
+        assert list(reloaded.list()) == ["b"]
+
+    def test_log_compaction(self, temp_dir):
+        """Test the log is folded into the snapshot once it outgrows the registry."""
+        extensions_dir = temp_dir / "extensions"
+        registry = ExtensionRegistry(extensions_dir, mode="log")
+        registry.COMPACT_MIN_ENTRIES = 3
+        registry.add("test-ext", {"version": "1.0.0", "enabled": True})
+        for enabled in (False, True):
+            registry.update("test-ext", {"enabled": enabled})
+        assert (extensions_dir / ".registry.log").exists()
+
+        registry.update("test-ext", {"enabled": False})
+
+        assert not (extensions_dir / ".registry.log").exists()
+        snapshot = json.loads((extensions_dir / ".registry").read_text())
+        assert snapshot["extensions"]["test-ext"]["enabled"] is False
+
+        registry.add("other", {"version": "1.0.0"})
+        registry.compact()
+        assert not (extensions_dir / ".registry.log").exists()
+        assert len(ExtensionRegistry(extensions_dir).list()) == 2
+
+    def test_torn_log_entry_ignored(self, temp_dir):
+        """Test a partially written final log line is not applied."""
+        extensions_dir = temp_dir / "extensions"
+        registry = ExtensionRegistry(extensions_dir, mode="log")
+        registry.add("kept", {"version": "1.0.0"})
+        with open(extensions_dir / ".registry.log", "a") as f:
+            f.write('{"op":"add","id":"torn","meta')
+
+        reloaded = ExtensionRegistry(extensions_dir)
+        assert reloaded.is_installed("kept")
+        assert not reloaded.is_installed("torn")
+
+    def test_mutations_see_other_writers(self, temp_dir):
+        """Test a mutation does not drop entries another instance committed."""
+        extensions_dir = temp_dir / "extensions"
+        for mode in ("snapshot", "log"):
+            first = ExtensionRegistry(extensions_dir, mode=mode)
+            second = ExtensionRegistry(extensions_dir, mode=mode)
+            first.add(f"{mode}-a", {"version": "1.0.0"})
+            second.add(f"{mode}-b", {"version": "1.0.0"})
+
+            reloaded = ExtensionRegistry(extensions_dir)
+            assert reloaded.is_installed(f"{mode}-a")
+            assert reloaded.is_installed(f"{mode}-b")
+
+    def test_concurrent_writers(self, temp_dir):
+        """Test concurrent registries serialize their writes through the lock."""
+        import threading
+
+        extensions_dir = temp_dir / "extensions"
+
+        def install(worker):
+            registry = ExtensionRegistry(extensions_dir, mode="snapshot")
+            for i in range(10):
+                registry.add(f"ext-{worker}-{i}", {"version": "1.0.0"})
+
+        threads = [threading.Thread(target=install, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(ExtensionRegistry(extensions_dir).list()) == 40
+
+    def test_transaction_writes_once(self, temp_dir):
+        """Test mutations inside a transaction are persisted together."""
+        extensions_dir = temp_dir / "extensions"
+        registry = ExtensionRegistry(extensions_dir, mode="snapshot")
+        with registry.transaction():
+            registry.add("a", {"version": "1.0.0"})
+            registry.add("b", {"version": "1.0.0"})
+            assert not (extensions_dir / ".registry").exists()
+
+        assert sorted(ExtensionRegistry(extensions_dir).list()) == ["a", "b"]
+
+    def test_auto_mode_switches_to_log(self, temp_dir):
+        """Test auto mode appends to the log once the registry is large."""
+        extensions_dir = temp_dir / "extensions"
+        registry = ExtensionRegistry(extensions_dir, mode="auto")
+        registry.LOG_MODE_THRESHOLD = 2
+        registry.add("a", {"version": "1.0.0"})
+        assert not (extensions_dir / ".registry.log").exists()
+        registry.add("b", {"version": "1.0.0"})
+        registry.add("c", {"version": "1.0.0"})
+        assert (extensions_dir / ".registry.log").exists()
+
+    def test_invalid_mode(self, temp_dir, monkeypatch):
+        """Test an unknown registry mode is rejected."""
+        monkeypatch.setenv("SPECIFY_REGISTRY_MODE", "sqlite")
+        with pytest.raises(ExtensionError, match="Unknown registry mode"):
+            ExtensionRegistry(temp_dir / "extensions")
+
 
 # ===== ExtensionManager Tests =====
 
@@ -372,6 +516,252 @@ class TestExtensionManager:
         assert installed[0]["command_count"] == 1
         assert installed[0]["hook_count"] == 1
 
+    @pytest.mark.parametrize("failing_step", ["register_hooks", "registry"])
+    def test_install_rolls_back_on_failure(self, extension_dir, project_dir, monkeypatch, failing_step):
+        """Test a failed install restores the extension dir, command files and hooks."""
+        from specify_cli.extensions import HookExecutor
+
+        claude_dir = project_dir / ".claude" / "commands"
+        claude_dir.mkdir(parents=True)
+        stale_cmd = claude_dir / "speckit.test.hello.md"
+        stale_cmd.write_text("user edited")
+        stale_dir = project_dir / ".specify" / "extensions" / "test-ext"
+        stale_dir.mkdir(parents=True)
+        (stale_dir / "leftover.txt").write_text("old")
+
+        manager = ExtensionManager(project_dir)
+        if failing_step == "register_hooks":
+            def fail(self, manifest):
+                raise OSError("disk full")
+            monkeypatch.setattr(HookExecutor, "register_hooks", fail)
+        else:
+            def fail(extension_id, metadata):
+                raise OSError("disk full")
+            monkeypatch.setattr(manager.registry, "add", fail)
+
+        with pytest.raises(OSError, match="disk full"):
+            manager.install_from_directory(extension_dir, "0.1.0")
+
+        assert not manager.registry.is_installed("test-ext")
+        assert stale_cmd.read_text() == "user edited"
+        assert (stale_dir / "leftover.txt").read_text() == "old"
+        assert not (stale_dir / "extension.yml").exists()
+        assert HookExecutor(project_dir).get_extension_hooks("test-ext") == {}
+        assert list((manager.extensions_dir / ".staging").iterdir()) == []
+
+    def test_failed_install_keeps_hook_order(self, extension_dir, project_dir, monkeypatch):
+        """Test rolling back a reinstall puts its hooks back at their original positions."""
+        from specify_cli.extensions import HookExecutor
+
+        executor = HookExecutor(project_dir)
+        with executor.transaction():
+            for ext_id in ("test-ext", "other-ext"):
+                manifest = ExtensionManifest(extension_dir / "extension.yml")
+                manifest.data["extension"]["id"] = ext_id
+                executor.register_hooks(manifest)
+        before = [h["extension"] for h in executor.get_hooks_for_event("after_tasks")]
+        assert before == ["test-ext", "other-ext"]
+
+        manager = ExtensionManager(project_dir)
+
+        def fail(extension_id, metadata):
+            raise OSError("disk full")
+        monkeypatch.setattr(manager.registry, "add", fail)
+
+        with pytest.raises(OSError, match="disk full"):
+            manager.install_from_directory(extension_dir, "0.1.0", register_commands=False)
+
+        after = [h["extension"] for h in HookExecutor(project_dir).get_hooks_for_event("after_tasks")]
+        assert after == before
+
+    def test_parallel_installs(self, temp_dir, project_dir, valid_manifest_data):
+        """Test installing several extensions concurrently keeps every hook and entry."""
+        import copy
+        import yaml
+        from concurrent.futures import ThreadPoolExecutor
+        from specify_cli.extensions import HookExecutor
+
+        (project_dir / ".claude").mkdir()
+        sources = []
+        for i in range(8):
+            data = copy.deepcopy(valid_manifest_data)
+            ext_id = f"ext-{i}"
+            data["extension"]["id"] = ext_id
+            data["provides"]["commands"][0]["name"] = f"speckit.{ext_id}.hello"
+            data["hooks"]["after_tasks"]["command"] = f"speckit.{ext_id}.hello"
+            source = temp_dir / ext_id
+            (source / "commands").mkdir(parents=True)
+            (source / "commands" / "hello.md").write_text("---\ndescription: Hi\n---\n\nHi")
+            (source / "extension.yml").write_text(yaml.dump(data))
+            sources.append(source)
+
+        def install(source):
+            return ExtensionManager(project_dir).install_from_directory(source, "0.1.0").id
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            installed = set(pool.map(install, sources))
+
+        assert installed == {f"ext-{i}" for i in range(8)}
+        assert set(ExtensionManager(project_dir).registry.list()) == installed
+        hooks = HookExecutor(project_dir).get_hooks_for_event("after_tasks")
+        assert {h["extension"] for h in hooks} == installed
+
+    @pytest.mark.parametrize("install_mode", ["auto", "copy", "reflink", "hardlink"])
+    def test_install_modes(self, extension_dir, project_dir, install_mode):
+        """Test every copying install mode produces the same tree."""
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(
+            extension_dir, "0.1.0", register_commands=False, install_mode=install_mode
+        )
+
+        ext_dir = project_dir / ".specify" / "extensions" / "test-ext"
+        assert not ext_dir.is_symlink()
+        installed = ext_dir / "commands" / "hello.md"
+        source = extension_dir / "commands" / "hello.md"
+        assert installed.read_text() == source.read_text()
+        if install_mode == "hardlink":
+            assert installed.stat().st_ino == source.stat().st_ino
+        elif install_mode == "copy":
+            assert installed.stat().st_ino != source.stat().st_ino
+        assert manager.registry.get("test-ext")["install_mode"] == install_mode
+
+    def test_hardlink_install_falls_back_to_copy(self, extension_dir, project_dir, monkeypatch):
+        """Test a failing hardlink and reflink fall back to a copy, tried once per tree."""
+        from specify_cli import extensions as ext_module
+
+        calls = []
+
+        def no_link(src, dst):
+            calls.append(src)
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(ext_module.os, "link", no_link)
+        monkeypatch.setattr(ext_module, "_reflink", no_link)
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(
+            extension_dir, "0.1.0", register_commands=False, install_mode="hardlink"
+        )
+
+        ext_dir = project_dir / ".specify" / "extensions" / "test-ext"
+        assert (ext_dir / "commands" / "hello.md").read_text().startswith("---")
+        assert len(calls) == 2
+
+    def test_symlink_install(self, extension_dir, project_dir):
+        """Test symlink installs follow the source and removal leaves the source alone."""
+        (extension_dir / "test-ext-config.yml").write_text("key: value")
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(
+            extension_dir, "0.1.0", register_commands=False, install_mode="symlink"
+        )
+
+        ext_dir = project_dir / ".specify" / "extensions" / "test-ext"
+        assert ext_dir.is_symlink()
+        (extension_dir / "commands" / "hello.md").write_text("edited")
+        assert (ext_dir / "commands" / "hello.md").read_text() == "edited"
+
+        manager.remove("test-ext", keep_config=True)
+        assert (extension_dir / "commands" / "hello.md").exists()
+        assert not ext_dir.is_symlink()
+        assert (ext_dir / "test-ext-config.yml").read_text() == "key: value"
+        assert not (ext_dir / "commands").exists()
+
+    def test_unknown_install_mode(self, extension_dir, project_dir):
+        """Test an unknown install mode is rejected before anything is written."""
+        manager = ExtensionManager(project_dir)
+        with pytest.raises(ExtensionError, match="Unknown install mode"):
+            manager.install_from_directory(extension_dir, "0.1.0", install_mode="teleport")
+        assert not (project_dir / ".specify" / "extensions" / "test-ext").exists()
+
+    @staticmethod
+    def make_zip(path, files: dict):
+        import zipfile
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, content in files.items():
+                zf.writestr(name, content)
+        return path
+
+    @pytest.mark.parametrize("root", ["", "test-ext-main/"])
+    def test_install_from_zip(self, extension_dir, temp_dir, project_dir, root):
+        """Test ZIP installs with the manifest at the top or in one wrapping directory."""
+        files = {
+            f"{root}{path.relative_to(extension_dir).as_posix()}": path.read_bytes()
+            for path in extension_dir.rglob("*") if path.is_file()
+        }
+        archive = self.make_zip(temp_dir / "ext.zip", files)
+
+        manager = ExtensionManager(project_dir)
+        manifest = manager.install_from_zip(archive, "0.1.0")
+
+        ext_dir = project_dir / ".specify" / "extensions" / "test-ext"
+        assert manifest.path == ext_dir / "extension.yml"
+        assert (ext_dir / "commands" / "hello.md").exists()
+        assert manager.registry.get("test-ext")["manifest_hash"] == manifest.get_hash()
+
+    def test_zip_traversal_rejected(self, temp_dir, project_dir, valid_manifest_data):
+        """Test a member escaping the archive is rejected before anything is written."""
+        import yaml
+        archive = self.make_zip(temp_dir / "evil.zip", {
+            "extension.yml": yaml.dump(valid_manifest_data),
+            "../../evil.txt": "boom",
+        })
+
+        with pytest.raises(ValidationError, match="Unsafe path"):
+            ExtensionManager(project_dir).install_from_zip(archive, "0.1.0")
+        assert not (project_dir / ".specify" / "extensions" / "test-ext").exists()
+
+    def test_zip_manifest_checked_before_extraction(self, temp_dir, project_dir, valid_manifest_data, monkeypatch):
+        """Test invalid or incompatible manifests fail without extracting members."""
+        import yaml
+
+        missing = self.make_zip(temp_dir / "missing.zip", {"README.md": "hi"})
+        invalid = self.make_zip(temp_dir / "invalid.zip", {"extension.yml": "schema_version: '1.0'\n"})
+        incompatible = self.make_zip(temp_dir / "old.zip", {
+            "extension.yml": yaml.dump(valid_manifest_data),
+            "commands/hello.md": "x" * 100000,
+        })
+
+        extracted = []
+        monkeypatch.setattr(shutil, "copyfileobj", lambda *args: extracted.append(args))
+        manager = ExtensionManager(project_dir)
+
+        with pytest.raises(ValidationError, match="No extension.yml"):
+            manager.install_from_zip(missing, "0.1.0")
+        with pytest.raises(ValidationError):
+            manager.install_from_zip(invalid, "0.1.0")
+        with pytest.raises(CompatibilityError):
+            manager.install_from_zip(incompatible, "0.0.1")
+
+        assert extracted == []
+
+    def test_remove_cleans_symlinked_aliases(self, temp_dir, project_dir, monkeypatch):
+        """Test removal deletes alias symlinks left dangling by their command file."""
+        import yaml
+
+        monkeypatch.setenv("SPECIFY_ALIAS_MODE", "symlink")
+        ext_dir = temp_dir / "ext-alias"
+        (ext_dir / "commands").mkdir(parents=True)
+        (ext_dir / "commands" / "cmd.md").write_text("---\ndescription: Test\n---\n\nTest")
+        with open(ext_dir / "extension.yml", 'w') as f:
+            yaml.dump({
+                "schema_version": "1.0",
+                "extension": {"id": "ext-alias", "name": "Alias", "version": "1.0.0", "description": "Test"},
+                "requires": {"speckit_version": ">=0.1.0"},
+                "provides": {"commands": [
+                    {"name": "speckit.alias.cmd", "file": "commands/cmd.md", "aliases": ["speckit.shortcut"]},
+                ]},
+            }, f)
+        (project_dir / ".claude").mkdir()
+
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(ext_dir, "0.1.0")
+        alias_file = project_dir / ".claude" / "commands" / "speckit.shortcut.md"
+        assert alias_file.is_symlink()
+        assert "claude" in manager.registration_timings
+
+        manager.remove("ext-alias")
+        assert not alias_file.is_symlink()
+        assert not alias_file.exists()
+
     def test_config_backup_on_remove(self, extension_dir, project_dir):
         """Test that config files are backed up on removal."""
         manager = ExtensionManager(project_dir)
@@ -394,6 +784,321 @@ class TestExtensionManager:
         assert backup_file.read_text() == "test: config"
 
 
+# ===== ManifestCache Tests =====
+
+class TestManifestCache:
+    """Test ManifestCache reuse and stat-based invalidation."""
+
+    def test_reuses_manifest_until_file_changes(self, extension_dir, valid_manifest_data):
+        """Test that an unchanged manifest is served from the cache."""
+        import yaml
+        manifest_path = extension_dir / "extension.yml"
+        cache = ManifestCache()
+
+        first = cache.get(manifest_path)
+        assert cache.get(manifest_path) is first
+
+        valid_manifest_data["extension"]["version"] = "1.0.10"
+        with open(manifest_path, 'w') as f:
+            yaml.dump(valid_manifest_data, f)
+
+        updated = cache.get(manifest_path)
+        assert updated is not first
+        assert updated.version == "1.0.10"
+
+    def test_disk_cache_skips_validation(self, extension_dir, temp_dir, monkeypatch):
+        """Test that a fresh process loads validated data from the disk cache."""
+        from specify_cli import extensions as ext_module
+        manifest_path = extension_dir / "extension.yml"
+        cache_dir = temp_dir / ".cache"
+
+        cache = ManifestCache(cache_dir)
+        cache.get(manifest_path)
+        cache.flush()
+        assert (cache_dir / ManifestCache.CACHE_FILE).exists()
+
+        ext_module._MANIFEST_MEMO.clear()
+
+        def fail_validate(self):
+            raise AssertionError("manifest was re-validated")
+
+        monkeypatch.setattr(ExtensionManifest, "_validate", fail_validate)
+        manifest = ManifestCache(cache_dir).get(manifest_path)
+        assert manifest.id == "test-ext"
+        assert len(manifest.commands) == 1
+
+    def test_invalid_manifest_not_cached(self, temp_dir):
+        """Test that invalid or missing manifests keep raising ValidationError."""
+        manifest_path = temp_dir / "extension.yml"
+        cache = ManifestCache(temp_dir / ".cache")
+
+        with pytest.raises(ValidationError, match="Manifest not found"):
+            cache.get(manifest_path)
+
+        manifest_path.write_text("schema_version: '1.0'\n")
+        with pytest.raises(ValidationError):
+            cache.get(manifest_path)
+        cache.flush()
+        assert not (temp_dir / ".cache" / ManifestCache.CACHE_FILE).exists()
+
+    def test_manager_forgets_removed_extension(self, extension_dir, project_dir):
+        """Test that removing an extension drops its cached manifest."""
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(extension_dir, "0.1.0", register_commands=False)
+        assert manager.get_extension("test-ext").id == "test-ext"
+
+        cache_file = manager.extensions_dir / ".cache" / ManifestCache.CACHE_FILE
+        assert "test-ext" in cache_file.read_text()
+
+        manager.remove("test-ext")
+        cached = json.loads(cache_file.read_text())["manifests"]
+        assert not any("test-ext" in key for key in cached)
+
+
+# ===== ConfigManager Tests =====
+
+class TestConfigManager:
+    """Test the cached, layered extension configuration."""
+
+    @pytest.fixture
+    def config_dir(self, project_dir):
+        """Create an installed extension directory with project config."""
+        ext_dir = project_dir / ".specify" / "extensions" / "test-ext"
+        ext_dir.mkdir(parents=True)
+        (ext_dir / "test-ext-config.yml").write_text(
+            "connection:\n  url: https://example.com\n  retries: 3\n"
+        )
+        return ext_dir
+
+    def test_layers_and_lookups(self, project_dir, config_dir, monkeypatch):
+        """Test that local config and env vars override project config."""
+        (config_dir / "local-config.yml").write_text("connection:\n  retries: 5\n")
+        monkeypatch.setenv("SPECKIT_TEST_EXT_CONNECTION_TIMEOUT", "30")
+        manager = ConfigManager(project_dir, "test-ext")
+
+        assert manager.get_value("connection.url") == "https://example.com"
+        assert manager.get_value("connection.retries") == 5
+        assert manager.get_value("connection.timeout") == "30"
+        assert manager.get_value("connection.missing", "dflt") == "dflt"
+        assert manager.has_value("connection.url")
+        assert not manager.has_value("connection.url.host")
+
+    def test_loads_once_until_inputs_change(self, project_dir, config_dir, monkeypatch):
+        """Test that lookups reuse one snapshot until a file or env var changes."""
+        loads = []
+        original = ConfigManager._load_config
+
+        def counting_load(self):
+            loads.append(self.extension_id)
+            return original(self)
+
+        monkeypatch.setattr(ConfigManager, "_load_config", counting_load)
+        monkeypatch.delenv("SPECKIT_TEST_EXT_CONNECTION_URL", raising=False)
+
+        for _ in range(20):
+            assert ConfigManager(project_dir, "test-ext").has_value("connection.url")
+        assert len(loads) == 1
+
+        (config_dir / "test-ext-config.yml").write_text("connection:\n  url: https://other.example\n")
+        assert ConfigManager(project_dir, "test-ext").get_value("connection.url") == "https://other.example"
+        assert len(loads) == 2
+
+        monkeypatch.setenv("SPECKIT_TEST_EXT_CONNECTION_URL", "https://env.example")
+        assert ConfigManager(project_dir, "test-ext").get_value("connection.url") == "https://env.example"
+        assert len(loads) == 3
+
+    def test_results_do_not_share_snapshot(self, project_dir, config_dir):
+        """Test that mutating returned config does not leak into later lookups."""
+        manager = ConfigManager(project_dir, "test-ext")
+
+        manager.get_config()["connection"]["url"] = "changed"
+        manager.get_value("connection")["retries"] = 0
+
+        assert manager.get_value("connection.url") == "https://example.com"
+        assert manager.get_value("connection.retries") == 3
+
+    def test_hook_conditions_reuse_config(self, project_dir, config_dir):
+        """Test that HookExecutor keeps one ConfigManager per extension."""
+        executor = HookExecutor(project_dir)
+
+        assert executor._evaluate_condition("config.connection.url is set", "test-ext")
+        assert executor._evaluate_condition("config.connection.retries == '3'", "test-ext")
+        assert not executor._evaluate_condition("config.connection.proxy is set", "test-ext")
+        assert list(executor._config_managers) == ["test-ext"]
+
+
+# ===== HookExecutor Tests =====
+
+class TestHookExecutor:
+    """Test the cached, indexed hook table and batched hook changes."""
+
+    def _manifest(self, ext_id, events=("after_tasks",)):
+        return ExtensionManifest.from_data({
+            "schema_version": "1.0",
+            "extension": {
+                "id": ext_id,
+                "name": ext_id,
+                "version": "1.0.0",
+                "description": "A test extension",
+            },
+            "requires": {"speckit_version": ">=0.1.0"},
+            "provides": {"commands": [{"name": f"speckit.{ext_id}.run", "file": "commands/run.md"}]},
+            "hooks": {event: {"command": f"speckit.{ext_id}.run"} for event in events},
+        })
+
+    def _register(self, project_dir, count):
+        executor = HookExecutor(project_dir)
+        with executor.transaction():
+            for i in range(count):
+                executor.register_hooks(self._manifest(f"ext-{i}", ("after_tasks", "after_plan")))
+        return executor
+
+    def test_parses_config_once_until_it_changes(self, project_dir, monkeypatch):
+        """Test that event lookups reuse the parsed extensions.yml across executors."""
+        from specify_cli import extensions as ext_module
+        self._register(project_dir, 3)
+
+        loads = []
+        original = ext_module.yaml_io.load_file
+        monkeypatch.setattr(
+            ext_module.yaml_io, "load_file", lambda path: loads.append(path) or original(path)
+        )
+
+        for _ in range(10):
+            hooks = HookExecutor(project_dir).get_hooks_for_event("after_tasks")
+            assert [h["extension"] for h in hooks] == ["ext-0", "ext-1", "ext-2"]
+        assert loads == []
+
+        # Edited by hand (or by another process): picked up on the next lookup
+        config_file = project_dir / ".specify" / "extensions.yml"
+        config_file.write_text("hooks:\n  after_tasks:\n  - extension: manual\n    command: x\n")
+        hooks = HookExecutor(project_dir).get_hooks_for_event("after_tasks")
+        assert [h["extension"] for h in hooks] == ["manual"]
+        assert len(loads) == 1
+
+    def test_disk_cache_skips_yaml(self, project_dir, monkeypatch):
+        """Test that a fresh process reads an unchanged extensions.yml from hooks.json."""
+        from specify_cli import extensions as ext_module
+        self._register(project_dir, 2)
+        executor = HookExecutor(project_dir)
+        assert executor.cache_file.exists()
+
+        monkeypatch.setattr(ext_module, "_HOOK_TABLES", {})
+        monkeypatch.setattr(ext_module.yaml_io, "load_file", None)
+        hooks = HookExecutor(project_dir).get_hooks_for_event("after_plan")
+        assert [h["extension"] for h in hooks] == ["ext-0", "ext-1"]
+
+    def test_batched_toggle_writes_once(self, project_dir, monkeypatch):
+        """Test that disabling many extensions rewrites extensions.yml once."""
+        from specify_cli import extensions as ext_module
+        executor = self._register(project_dir, 50)
+
+        writes = []
+        original = ext_module._atomic_write_text
+        monkeypatch.setattr(
+            ext_module, "_atomic_write_text",
+            lambda path, text: (path.name == "extensions.yml" and writes.append(path)) or original(path, text),
+        )
+
+        ids = [f"ext-{i}" for i in range(0, 50, 2)]
+        executor.set_hooks_enabled(ids, False)
+        assert len(writes) == 1
+
+        hooks = HookExecutor(project_dir).get_hooks_for_event("after_plan")
+        assert [h["extension"] for h in hooks] == [f"ext-{i}" for i in range(1, 50, 2)]
+
+        # Nothing to change: no write at all
+        executor.set_hooks_enabled(ids, False)
+        with executor.transaction():
+            executor.disable_hooks("ext-0")
+            executor.enable_hooks("ext-2")
+        assert len(writes) == 2
+        assert len(HookExecutor(project_dir).get_hooks_for_event("after_plan")) == 26
+
+    def test_failed_transaction_discards_changes(self, project_dir):
+        """Test that an exception inside transaction() writes nothing."""
+        executor = self._register(project_dir, 2)
+        config_file = project_dir / ".specify" / "extensions.yml"
+        before = config_file.read_bytes()
+
+        with pytest.raises(RuntimeError):
+            with executor.transaction():
+                executor.unregister_hooks("ext-0")
+                assert "ext-0" not in executor.get_extension_hooks("ext-0").get("after_tasks", [])
+                raise RuntimeError("boom")
+
+        assert config_file.read_bytes() == before
+        assert executor.get_extension_hooks("ext-0")
+
+    def test_returned_hooks_are_copies(self, project_dir):
+        """Test that callers cannot corrupt the shared hook table."""
+        executor = self._register(project_dir, 1)
+
+        executor.get_hooks_for_event("after_tasks")[0]["enabled"] = False
+        executor.get_project_config()["hooks"].clear()
+        executor.check_hooks_for_event("after_tasks")["hooks"][0]["command"] = "changed"
+
+        hooks = executor.get_hooks_for_event("after_tasks")
+        assert hooks[0]["command"] == "speckit.ext-0.run"
+
+    def test_cli_disable_many(self, project_dir, extension_dir, monkeypatch):
+        """Test that extension disable accepts several IDs."""
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(extension_dir, "0.1.0", register_commands=False)
+        executor = self._register(project_dir, 2)
+        for i in range(2):
+            manager.registry.add(f"ext-{i}", {"version": "1.0.0", "enabled": True})
+        monkeypatch.chdir(project_dir)
+
+        result = CliRunner().invoke(app, ["extension", "disable", "ext-0", "ext-1", "test-ext"])
+        assert result.exit_code == 0, result.output
+        registry = ExtensionManager(project_dir).registry
+        assert all(not registry.get(ext)["enabled"] for ext in ("ext-0", "ext-1", "test-ext"))
+        assert executor.get_hooks_for_event("after_plan") == []
+
+        result = CliRunner().invoke(app, ["extension", "enable", "ext-1", "missing"])
+        assert result.exit_code == 1
+        assert not ExtensionManager(project_dir).registry.get("ext-1")["enabled"]
+
+    def test_cli_hooks_check(self, project_dir, monkeypatch, capsys):
+        """Test hooks check --json through Typer and through the fast path in main()."""
+        from typer.testing import CliRunner
+        from specify_cli import app, main
+
+        executor = HookExecutor(project_dir)
+        executor.register_hooks(self._manifest("ext-0"))
+        manifest = self._manifest("ext-1")
+        manifest.data["hooks"]["after_tasks"]["condition"] = "env.SPECKIT_TEST_HOOK_FLAG is set"
+        executor.register_hooks(manifest)
+        monkeypatch.delenv("SPECKIT_TEST_HOOK_FLAG", raising=False)
+        monkeypatch.chdir(project_dir)
+
+        result = CliRunner().invoke(app, ["hooks", "check", "after_tasks", "--json"])
+        assert result.exit_code == 0, result.output
+        via_typer = json.loads(result.output)
+        assert via_typer["has_hooks"] is True
+        assert [h["extension"] for h in via_typer["hooks"]] == ["ext-0"]
+        assert via_typer["hooks"][0]["command"] == "speckit.ext-0.run"
+
+        monkeypatch.setattr("sys.argv", ["specify", "hooks", "check", "after_tasks", "--json"])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 0
+        assert json.loads(capsys.readouterr().out) == via_typer
+
+        result = CliRunner().invoke(app, ["hooks", "check", "after_plan", "--json"])
+        assert json.loads(result.output) == {
+            "event": "after_plan", "has_hooks": False, "hooks": [], "message": "",
+        }
+
+        monkeypatch.chdir(project_dir.parent)
+        result = CliRunner().invoke(app, ["hooks", "check", "after_tasks", "--json"])
+        assert result.exit_code == 1
+
+
 # ===== CommandRegistrar Tests =====
 
 class TestCommandRegistrar:
@@ -520,6 +1225,198 @@ $ARGUMENTS
         assert (claude_dir / "speckit.alias.cmd.md").exists()
         assert (claude_dir / "speckit.shortcut.md").exists()
 
+    def test_register_all_agents_parses_sources_once(self, extension_dir, project_dir, monkeypatch):
+        """Test multi-agent registration reads each source once and renders once per format."""
+        for agent in ("claude", "copilot", "gemini", "qwen"):
+            agent_dir = CommandRegistrar.AGENT_CONFIGS[agent]["dir"].split("/")[0]
+            (project_dir / agent_dir).mkdir(exist_ok=True)
+
+        registrar = CommandRegistrar()
+        calls = {"parse": 0, "render": 0}
+        parse = registrar.parse_frontmatter
+        render = registrar._render_command
+
+        def counting_parse(content):
+            calls["parse"] += 1
+            return parse(content)
+
+        def counting_render(*args):
+            calls["render"] += 1
+            return render(*args)
+
+        monkeypatch.setattr(registrar, "parse_frontmatter", counting_parse)
+        monkeypatch.setattr(registrar, "_render_command", counting_render)
+
+        manifest = ExtensionManifest(extension_dir / "extension.yml")
+        results = registrar.register_commands_for_all_agents(manifest, extension_dir, project_dir)
+
+        assert set(results) == {"claude", "copilot", "gemini", "qwen"}
+        assert calls == {"parse": 1, "render": 2}
+
+        gemini_file = project_dir / ".gemini" / "commands" / "speckit.test.hello.toml"
+        qwen_file = project_dir / ".qwen" / "commands" / "speckit.test.hello.toml"
+        assert "{{args}}" in gemini_file.read_text()
+        assert gemini_file.read_text() == qwen_file.read_text()
+        claude_file = project_dir / ".claude" / "commands" / "speckit.test.hello.md"
+        assert "$ARGUMENTS" in claude_file.read_text()
+
+    def test_register_all_agents_skips_broken_agent(self, extension_dir, project_dir):
+        """Test one unwritable agent directory does not stop the other agents or the install."""
+        (project_dir / ".claude").mkdir()
+        # A file where the commands directory should be
+        (project_dir / ".claude" / "commands").write_text("not a directory")
+        (project_dir / ".gemini").mkdir()
+
+        manager = ExtensionManager(project_dir)
+        manager.install_from_directory(extension_dir, "0.1.0")
+
+        assert manager.registry.is_installed("test-ext")
+        registered = manager.registry.get("test-ext")["registered_commands"]
+        assert set(registered) == {"gemini"}
+        assert (project_dir / ".gemini" / "commands" / "speckit.test.hello.toml").exists()
+
+    @pytest.fixture
+    def alias_extension(self, temp_dir):
+        """Extension with one command that has two aliases."""
+        import yaml
+
+        ext_dir = temp_dir / "ext-alias"
+        (ext_dir / "commands").mkdir(parents=True)
+        manifest_data = {
+            "schema_version": "1.0",
+            "extension": {
+                "id": "ext-alias",
+                "name": "Extension with Alias",
+                "version": "1.0.0",
+                "description": "Test",
+            },
+            "requires": {"speckit_version": ">=0.1.0"},
+            "provides": {
+                "commands": [
+                    {
+                        "name": "speckit.alias.cmd",
+                        "file": "commands/cmd.md",
+                        "aliases": ["speckit.shortcut", "speckit.other"],
+                    }
+                ]
+            },
+        }
+        with open(ext_dir / "extension.yml", 'w') as f:
+            yaml.dump(manifest_data, f)
+        (ext_dir / "commands" / "cmd.md").write_text("---\ndescription: Test\n---\n\nTest")
+        return ext_dir
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_aliases_hardlinked(self, alias_extension, project_dir, max_workers):
+        """Test aliases are hardlinks to the command file by default."""
+        registrar = CommandRegistrar(max_workers=max_workers)
+        manifest = ExtensionManifest(alias_extension / "extension.yml")
+        registered = registrar.register_commands_for_agents(
+            ["claude", "gemini"], manifest, alias_extension, project_dir
+        )
+
+        assert registered["claude"] == ["speckit.alias.cmd", "speckit.shortcut", "speckit.other"]
+        claude_dir = project_dir / ".claude" / "commands"
+        primary = (claude_dir / "speckit.alias.cmd.md").stat()
+        for alias in ("speckit.shortcut", "speckit.other"):
+            assert (claude_dir / f"{alias}.md").stat().st_ino == primary.st_ino
+        assert set(registrar.timings) == {"claude", "gemini"}
+        assert all(seconds >= 0 for seconds in registrar.timings.values())
+
+        # Re-registering replaces the existing links
+        registrar.register_commands_for_agent("claude", manifest, alias_extension, project_dir)
+        alias_text = (claude_dir / "speckit.shortcut.md").read_text()
+        assert alias_text == (claude_dir / "speckit.alias.cmd.md").read_text()
+
+    def test_symlink_aliases(self, alias_extension, project_dir):
+        """Test symlink mode links aliases except for agents that cannot follow them."""
+        registrar = CommandRegistrar(alias_mode="symlink")
+        manifest = ExtensionManifest(alias_extension / "extension.yml")
+        registrar.register_commands_for_agents(
+            ["claude", "copilot"], manifest, alias_extension, project_dir
+        )
+
+        claude_alias = project_dir / ".claude" / "commands" / "speckit.shortcut.md"
+        assert claude_alias.is_symlink()
+        assert claude_alias.read_text().startswith("---")
+        assert not (project_dir / ".github" / "agents" / "speckit.shortcut.md").is_symlink()
+
+    def test_copy_aliases(self, alias_extension, project_dir):
+        """Test copy mode writes aliases as independent files."""
+        registrar = CommandRegistrar(alias_mode="copy")
+        manifest = ExtensionManifest(alias_extension / "extension.yml")
+        registrar.register_commands_for_agent("claude", manifest, alias_extension, project_dir)
+
+        claude_dir = project_dir / ".claude" / "commands"
+        alias = claude_dir / "speckit.shortcut.md"
+        primary = claude_dir / "speckit.alias.cmd.md"
+        assert alias.read_text() == primary.read_text()
+        assert alias.stat().st_ino != primary.stat().st_ino
+
+    def test_reregister_skips_unchanged_files(self, alias_extension, project_dir):
+        """Test re-registration leaves byte-identical files and their mtimes alone."""
+        import os
+
+        registrar = CommandRegistrar()
+        manifest = ExtensionManifest(alias_extension / "extension.yml")
+        registrar.register_commands_for_agents(
+            ["claude", "gemini"], manifest, alias_extension, project_dir
+        )
+        assert (registrar.written, registrar.skipped) == (6, 0)
+
+        claude_dir = project_dir / ".claude" / "commands"
+        primary = claude_dir / "speckit.alias.cmd.md"
+        os.utime(primary, ns=(1_000_000_000, 1_000_000_000))
+
+        registrar.register_commands_for_agents(
+            ["claude", "gemini"], manifest, alias_extension, project_dir
+        )
+        assert (registrar.written, registrar.skipped) == (0, 6)
+        assert primary.stat().st_mtime_ns == 1_000_000_000
+
+        # Only the changed command is rewritten; its hardlinked aliases follow it
+        (alias_extension / "commands" / "cmd.md").write_text("---\ndescription: New\n---\n\nTest")
+        registrar.register_commands_for_agent("claude", manifest, alias_extension, project_dir)
+        assert (registrar.written, registrar.skipped) == (1, 2)
+        assert "New" in (claude_dir / "speckit.shortcut.md").read_text()
+
+    def test_reregister_replaces_stale_alias(self, alias_extension, project_dir):
+        """Test an alias edited by hand is rewritten on re-registration."""
+        registrar = CommandRegistrar(alias_mode="copy")
+        manifest = ExtensionManifest(alias_extension / "extension.yml")
+        registrar.register_commands_for_agent("claude", manifest, alias_extension, project_dir)
+
+        alias = project_dir / ".claude" / "commands" / "speckit.shortcut.md"
+        alias.write_text("edited")
+        registrar.register_commands_for_agent("claude", manifest, alias_extension, project_dir)
+
+        assert (registrar.written, registrar.skipped) == (1, 2)
+        assert alias.read_text().startswith("---")
+
+    def test_invalid_registrar_settings(self, monkeypatch):
+        """Test invalid worker counts and alias modes are rejected."""
+        with pytest.raises(ExtensionError, match="Unknown alias mode"):
+            CommandRegistrar(alias_mode="reflink")
+        with pytest.raises(ExtensionError, match="at least 1"):
+            CommandRegistrar(max_workers=0)
+
+        monkeypatch.setenv("SPECIFY_REGISTER_WORKERS", "3")
+        assert CommandRegistrar().max_workers == 3
+        monkeypatch.setenv("SPECIFY_REGISTER_WORKERS", "many")
+        with pytest.raises(ExtensionError, match="SPECIFY_REGISTER_WORKERS"):
+            CommandRegistrar()
+
+    def test_register_unsupported_agent(self, extension_dir, project_dir):
+        """Test registering for an unknown agent raises before writing anything."""
+        registrar = CommandRegistrar()
+        manifest = ExtensionManifest(extension_dir / "extension.yml")
+
+        with pytest.raises(ExtensionError, match="Unsupported agent"):
+            registrar.register_commands_for_agents(
+                ["claude", "nope"], manifest, extension_dir, project_dir
+            )
+        assert not (project_dir / ".claude").exists()
+
 
 # ===== Utility Function Tests =====
 
@@ -923,6 +1820,76 @@ class TestExtensionCatalog:
         assert len(results) == 1
         assert results[0]["id"] == "jira"
 
+    def test_search_index_persisted_and_rebuilt(self, temp_dir, monkeypatch):
+        """Test the search index is saved, reused by new processes and rebuilt on change."""
+        from specify_cli import extensions as ext_module
+        from specify_cli.catalog_index import CatalogIndex
+
+        project_dir = temp_dir / "project"
+        (project_dir / ".specify").mkdir(parents=True)
+        catalog = ExtensionCatalog(project_dir)
+
+        def write_catalog(extensions):
+            catalog.cache_dir.mkdir(parents=True, exist_ok=True)
+            catalog.cache_file.write_text(json.dumps({"schema_version": "1.0", "extensions": extensions}))
+            catalog.cache_metadata_file.write_text(json.dumps({
+                "cached_at": datetime.now(timezone.utc).isoformat(),
+                "catalog_url": "http://test.com",
+            }))
+
+        write_catalog({
+            "docs": {"name": "Docs", "version": "1.0.0", "description": "Mentions jira once"},
+            "jira": {"name": "Jira", "version": "1.0.0", "description": "Jira issues"},
+        })
+        assert [r["id"] for r in catalog.search(query="jira")] == ["jira", "docs"]
+        assert catalog.index_file.exists()
+
+        # A fresh process loads the saved index instead of rebuilding it
+        builds = []
+        original = CatalogIndex.build.__func__
+        monkeypatch.setattr(
+            CatalogIndex, "build",
+            classmethod(lambda cls, *args: builds.append(args) or original(cls, *args)),
+        )
+        monkeypatch.setattr(ext_module, "_CATALOGS", {})
+        assert [r["id"] for r in ExtensionCatalog(project_dir).search(query="jira")] == ["jira", "docs"]
+        assert builds == []
+
+        write_catalog({"linear": {"name": "Linear", "version": "1.0.0", "description": "Like jira"}})
+        assert [r["id"] for r in ExtensionCatalog(project_dir).search(query="jira")] == ["linear"]
+        assert len(builds) == 1
+
+    def test_search_query_without_words(self, temp_dir):
+        """Test a query with no letters or digits falls back to a substring match."""
+        project_dir = temp_dir / "project"
+        (project_dir / ".specify").mkdir(parents=True)
+        catalog = ExtensionCatalog(project_dir)
+        catalog.cache_dir.mkdir(parents=True, exist_ok=True)
+        catalog.cache_file.write_text(json.dumps({
+            "schema_version": "1.0",
+            "extensions": {
+                "jira-sync": {"name": "Jira Sync", "version": "1.0.0", "description": "Jira issues"},
+                "linear": {"name": "Linear", "version": "1.0.0", "description": "Linear issues",
+                           "verified": True},
+                "notes": {"name": "Notes", "version": "1.0.0", "description": "C++ notes",
+                          "verified": True},
+            },
+        }))
+        catalog.cache_metadata_file.write_text(json.dumps({
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+            "catalog_url": "http://test.com",
+        }))
+
+        assert [r["id"] for r in catalog.search(query="-")] == ["jira-sync"]
+        assert [r["id"] for r in catalog.search(query="++", verified_only=True)] == ["notes"]
+        assert catalog.search(query="++", tag="missing") == []
+        # Word queries match words or their starts, not arbitrary substrings
+        assert catalog.search(query="ira") == []
+        assert [r["id"] for r in catalog.search(query="jir")] == ["jira-sync"]
+
+        catalog.clear_cache()
+        assert not catalog.index_file.exists()
+
     def test_get_extension_info(self, temp_dir):
         """Test getting specific extension info."""
         project_dir = temp_dir / "project"
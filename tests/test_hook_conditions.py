@@ -0,0 +1,169 @@
+"""
+Unit tests for hook condition expressions.
+
+Tests cover:
+- Parsing into stored trees and rejecting malformed expressions
+- Evaluation of is set / == / != / in with and, or, not and parentheses
+- HookExecutor storing compiled conditions and evaluating them without re-parsing
+"""
+
+import pytest
+
+from specify_cli import hook_conditions
+from specify_cli.extensions import ExtensionManifest, HookExecutor
+
+
+# ===== Fixtures =====
+
+@pytest.fixture
+def project_dir(temp_dir):
+    """Create a project with one configured extension."""
+    ext_dir = temp_dir / ".specify" / "extensions" / "test-ext"
+    ext_dir.mkdir(parents=True)
+    (ext_dir / "test-ext-config.yml").write_text(
+        "project:\n  key: ABC\nenabled: true\nstage: prod\n"
+    )
+    return temp_dir
+
+
+def resolver(values):
+    """Resolve config references from a flat dict and env references as unset."""
+    def resolve(source, name):
+        if source == "env":
+            return False, ""
+        return (name in values, values.get(name))
+    return resolve
+
+
+# ===== Parser Tests =====
+
+class TestParse:
+    """Test compiling condition expressions."""
+
+    def test_legacy_forms(self):
+        """Test the original single-test conditions compile to leaf nodes."""
+        assert hook_conditions.parse("config.project.key is set") == ["set", "config", "project.key"]
+        assert hook_conditions.parse("env.jira_token IS SET") == ["set", "env", "JIRA_TOKEN"]
+        assert hook_conditions.parse("config.mode == 'fast'") == ["eq", "config", "mode", "fast"]
+        assert hook_conditions.parse('env.CI != "true"') == ["ne", "env", "CI", "true"]
+
+    def test_boolean_structure(self):
+        """Test precedence: not binds tighter than and, and tighter than or."""
+        tree = hook_conditions.parse(
+            "not config.a is set or config.b == 1 and (config.c in ['x', y] or env.D is not set)"
+        )
+        assert tree == [
+            "or",
+            ["not", ["set", "config", "a"]],
+            ["and",
+             ["eq", "config", "b", "1"],
+             ["or", ["in", "config", "c", ["x", "y"]], ["not", ["set", "env", "D"]]]],
+        ]
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "config.a",
+        "config.a is set and",
+        "config.a == ",
+        "(config.a is set",
+        "config.a is set extra",
+        "config.a-b is set",
+        "env.A.B is set",
+        "config.a in []",
+        "foo == 'bar'",
+    ])
+    def test_rejects_malformed(self, text):
+        """Test malformed expressions raise ConditionError."""
+        with pytest.raises(hook_conditions.ConditionError):
+            hook_conditions.parse(text)
+
+
+# ===== Evaluation Tests =====
+
+class TestEvaluate:
+    """Test evaluating compiled trees."""
+
+    def test_operators(self):
+        """Test each test node and the boolean combinators."""
+        resolve = resolver({"enabled": True, "stage": "prod", "count": 3})
+
+        def check(text):
+            return hook_conditions.evaluate(hook_conditions.parse(text), resolve)
+
+        assert check("config.enabled == true")
+        assert check("config.count == '3'")
+        assert check("config.stage in ['dev', 'prod']")
+        assert check("config.stage not in [dev]")
+        assert check("config.missing is not set")
+        assert not check("config.stage != prod")
+        assert check("config.enabled == false or config.stage == prod")
+        assert not check("config.enabled == true and not config.stage is set")
+
+    def test_unresolvable_reference_is_false(self):
+        """Test a test whose reference cannot be resolved evaluates to False."""
+        tree = hook_conditions.parse("config.a != 'x'")
+        assert hook_conditions.evaluate(tree, lambda source, name: None) is False
+
+    def test_unknown_node(self):
+        """Test a corrupt tree raises instead of silently passing."""
+        with pytest.raises(hook_conditions.ConditionError):
+            hook_conditions.evaluate(["xor", "config", "a"], resolver({}))
+
+
+# ===== HookExecutor Tests =====
+
+class TestHookExecutorConditions:
+    """Test HookExecutor compiles conditions once at registration."""
+
+    def _manifest(self, condition):
+        return ExtensionManifest.from_data({
+            "schema_version": "1.0",
+            "extension": {
+                "id": "test-ext",
+                "name": "Test Extension",
+                "version": "1.0.0",
+                "description": "A test extension",
+            },
+            "requires": {"speckit_version": ">=0.1.0"},
+            "provides": {"commands": [{"name": "speckit.test.hello", "file": "commands/hello.md"}]},
+            "hooks": {"after_tasks": {"command": "speckit.test.hello", "condition": condition}},
+        })
+
+    def test_register_stores_compiled_condition(self, project_dir):
+        """Test the compiled tree is stored next to the hook and used for evaluation."""
+        executor = HookExecutor(project_dir)
+        condition = "config.project.key is set and config.stage in ['prod', 'staging']"
+        executor.register_hooks(self._manifest(condition))
+
+        hook = HookExecutor(project_dir).get_hooks_for_event("after_tasks")[0]
+        assert hook["condition_ast"]["source"] == condition
+        assert hook["condition_ast"]["tree"] == hook_conditions.parse(condition)
+
+        # A stored tree is evaluated as-is, without parsing the source again
+        hook["condition_ast"]["tree"] = ["set", "config", "missing"]
+        assert executor.should_execute_hook(hook) is False
+
+        # An edited condition no longer matches the stored source and is recompiled
+        hook["condition"] = "config.enabled == true"
+        assert executor.should_execute_hook(hook) is True
+
+    def test_invalid_condition_never_runs(self, project_dir):
+        """Test an unparseable condition is stored without a tree and evaluates to False."""
+        executor = HookExecutor(project_dir)
+        executor.register_hooks(self._manifest("config.project.key exists"))
+
+        result = executor.check_hooks_for_event("after_tasks")
+        assert result["has_hooks"] is False
+        assert "condition_ast" not in executor.get_hooks_for_event("after_tasks")[0]
+
+    def test_env_conditions(self, project_dir, monkeypatch):
+        """Test env references keep their original semantics."""
+        executor = HookExecutor(project_dir)
+        monkeypatch.delenv("SPECKIT_TEST_FLAG", raising=False)
+
+        assert executor._evaluate_condition("env.speckit_test_flag is not set", None)
+        assert executor._evaluate_condition("env.SPECKIT_TEST_FLAG != 'on'", None)
+
+        monkeypatch.setenv("SPECKIT_TEST_FLAG", "on")
+        assert executor._evaluate_condition("env.SPECKIT_TEST_FLAG == on", None)
+        assert not executor._evaluate_condition("config.project.key is set", None)
@@ -0,0 +1,232 @@
+"""
+Unit tests for the shared HTTP transport.
+
+Tests cover:
+- Shared client reuse per TLS mode
+- Retry policy (backoff, Retry-After, non-retryable statuses)
+- Extension catalog fetches through the shared client
+- Streamed, size-capped and checksum-verified extension downloads (catalog and --from URL)
+"""
+
+import hashlib
+import pytest
+
+import httpx
+
+from specify_cli import network
+from specify_cli.extensions import ExtensionCatalog, ExtensionError
+
+
+# ===== Fixtures =====
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(network.time, "sleep", delays.append)
+    return delays
+
+
+def mock_client(responses: list) -> httpx.Client:
+    """Client answering requests with the given responses in order."""
+    return httpx.Client(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+
+# ===== Shared Client Tests =====
+
+class TestSharedClient:
+    """Test the process-wide pooled clients."""
+
+    def test_client_is_reused(self):
+        """Test that the same client is returned for the same TLS mode."""
+        assert network.get_client() is network.get_client()
+        assert network.get_client(verify=False) is not network.get_client()
+
+    def test_closed_client_is_replaced(self):
+        """Test that closing the shared clients yields fresh ones."""
+        client = network.get_client(verify=False)
+        network.close_clients()
+
+        assert client.is_closed
+        assert network.get_client(verify=False) is not client
+
+
+# ===== Retry Policy Tests =====
+
+class TestRetryPolicy:
+    """Test network.get retries."""
+
+    def test_retries_server_errors(self, sleeps):
+        """Test that 5xx answers are retried with exponential backoff."""
+        client = mock_client([
+            httpx.Response(502),
+            httpx.Response(503),
+            httpx.Response(200, text="ok"),
+        ])
+
+        response = network.get("https://example.com/", client=client)
+
+        assert response.text == "ok"
+        assert sleeps == [network.BACKOFF_BASE, network.BACKOFF_BASE * 2]
+
+    def test_honors_retry_after(self, sleeps):
+        """Test that Retry-After extends the backoff delay."""
+        client = mock_client([
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            httpx.Response(200),
+        ])
+
+        network.get("https://example.com/", client=client)
+
+        assert sleeps == [5]
+
+    def test_honors_retry_after_past_backoff_max(self, sleeps):
+        """Test that a Retry-After longer than the backoff cap is waited out in full."""
+        client = mock_client([
+            httpx.Response(429, headers={"Retry-After": "90"}),
+            httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            httpx.Response(200),
+        ])
+
+        network.get("https://example.com/", client=client)
+
+        assert sleeps == [90, network.BACKOFF_BASE * 2]
+
+    def test_retry_after_past_limit_is_returned(self, sleeps):
+        """Test that a 429 asking to wait past RETRY_AFTER_MAX is returned, not retried early."""
+        client = mock_client([
+            httpx.Response(429, headers={"Retry-After": str(int(network.RETRY_AFTER_MAX) + 1)}),
+        ])
+
+        response = network.get("https://example.com/", client=client)
+
+        assert response.status_code == 429
+        assert sleeps == []
+
+    def test_returns_client_errors(self, sleeps):
+        """Test that 4xx answers other than 429 are not retried."""
+        client = mock_client([httpx.Response(404)])
+
+        response = network.get("https://example.com/", client=client)
+
+        assert response.status_code == 404
+        assert sleeps == []
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        """Test that the last response is returned once retries are exhausted."""
+        client = mock_client([httpx.Response(500) for _ in range(3)])
+
+        response = network.get("https://example.com/", client=client, max_retries=2)
+
+        assert response.status_code == 500
+        assert len(sleeps) == 2
+
+
+# ===== Extension Catalog Tests =====
+
+class TestCatalogTransport:
+    """Test that the extension catalog uses the shared transport."""
+
+    def test_fetch_catalog(self, temp_dir, monkeypatch):
+        """Test fetching the catalog through the shared client."""
+        (temp_dir / ".specify").mkdir()
+        catalog = {"schema_version": "1.0", "extensions": {}}
+        client = mock_client([httpx.Response(200, json=catalog)])
+        monkeypatch.setattr(network, "get_client", lambda verify=True: client)
+
+        assert ExtensionCatalog(temp_dir).fetch_catalog(force_refresh=True) == catalog
+
+    def test_fetch_catalog_http_error(self, temp_dir, monkeypatch):
+        """Test that HTTP errors surface as ExtensionError."""
+        (temp_dir / ".specify").mkdir()
+        client = mock_client([httpx.Response(404)])
+        monkeypatch.setattr(network, "get_client", lambda verify=True: client)
+
+        with pytest.raises(ExtensionError, match="Failed to fetch catalog"):
+            ExtensionCatalog(temp_dir).fetch_catalog(force_refresh=True)
+
+    @staticmethod
+    def catalog_with(temp_dir, monkeypatch, entry: dict) -> ExtensionCatalog:
+        (temp_dir / ".specify").mkdir(exist_ok=True)
+        catalog = ExtensionCatalog(temp_dir)
+        info = {"id": "demo", "version": "1.0.0", "download_url": "https://example.com/demo.zip"}
+        info.update(entry)
+        monkeypatch.setattr(catalog, "get_extension_info", lambda extension_id: info)
+        return catalog
+
+    def test_download_extension_verifies_and_reuses(self, temp_dir, monkeypatch):
+        """Test a download matching the catalog sha256 is cached and reused by hash."""
+        body = b"PK\x05\x06" + b"\0" * 18
+        digest = hashlib.sha256(body).hexdigest()
+        catalog = self.catalog_with(temp_dir, monkeypatch, {"sha256": f"sha256:{digest.upper()}"})
+        client = mock_client([httpx.Response(200, content=body)])
+        monkeypatch.setattr(network, "get_client", lambda verify=True: client)
+
+        zip_path = catalog.download_extension("demo")
+        assert zip_path.read_bytes() == body
+        assert (catalog.cache_dir / "downloads" / f"{digest}.zip").exists()
+
+        # The caller deletes its copy; the cached archive is reused without a request
+        zip_path.unlink()
+        again = catalog.download_extension("demo", target_dir=temp_dir / "out")
+        assert again.read_bytes() == body
+        assert not list((catalog.cache_dir / "downloads").glob(".download-*"))
+
+    def test_download_extension_checksum_mismatch(self, temp_dir, monkeypatch):
+        """Test an archive not matching the catalog sha256 is rejected and not kept."""
+        catalog = self.catalog_with(temp_dir, monkeypatch, {"sha256": "0" * 64})
+        client = mock_client([httpx.Response(200, content=b"tampered")])
+        monkeypatch.setattr(network, "get_client", lambda verify=True: client)
+
+        with pytest.raises(ExtensionError, match="Checksum mismatch"):
+            catalog.download_extension("demo")
+        assert list((catalog.cache_dir / "downloads").iterdir()) == []
+
+    @pytest.mark.parametrize("with_length", [True, False])
+    def test_download_extension_size_cap(self, temp_dir, monkeypatch, with_length):
+        """Test downloads over the size limit are aborted, with or without Content-Length."""
+        monkeypatch.setenv("SPECIFY_EXTENSION_MAX_BYTES", "1000")
+        catalog = self.catalog_with(temp_dir, monkeypatch, {})
+        body = b"x" * 5000
+        if with_length:
+            response = httpx.Response(200, content=body)
+        else:
+            response = httpx.Response(200, stream=httpx.ByteStream(body))
+            response.headers.pop("content-length", None)
+        client = mock_client([response])
+        monkeypatch.setattr(network, "get_client", lambda verify=True: client)
+
+        with pytest.raises(ExtensionError, match="byte limit"):
+            catalog.download_extension("demo")
+        assert list((catalog.cache_dir / "downloads").iterdir()) == []
+
+    def test_download_retries(self, temp_dir, sleeps):
+        """Test streamed downloads retry 5xx answers and write the final body."""
+        client = mock_client([httpx.Response(503), httpx.Response(200, content=b"data")])
+        dest = temp_dir / "file.bin"
+
+        digest = network.download("https://example.com/file", dest, client=client)
+        assert dest.read_bytes() == b"data"
+        assert len(sleeps) == 1
+        assert not dest.with_name("file.bin.part").exists()
+        assert digest == hashlib.sha256(b"data").hexdigest()
+
+
+    def test_add_from_url_size_cap(self, temp_dir, monkeypatch):
+        """Test `extension add --from` streams the archive under the same size limit."""
+        from typer.testing import CliRunner
+        from specify_cli import app
+
+        (temp_dir / ".specify").mkdir()
+        monkeypatch.setenv("SPECIFY_EXTENSION_MAX_BYTES", "1000")
+        monkeypatch.chdir(temp_dir)
+        client = mock_client([httpx.Response(200, stream=httpx.ByteStream(b"x" * 5000))])
+        monkeypatch.setattr(network, "get_client", lambda verify=True: client)
+
+        result = CliRunner().invoke(
+            app, ["extension", "add", "demo", "--from", "https://example.com/demo.zip"]
+        )
+
+        assert result.exit_code == 1
+        assert "byte limit" in result.output
+        assert list((temp_dir / ".specify" / "extensions" / ".cache" / "downloads").iterdir()) == []
@@ -0,0 +1,163 @@
+"""
+Startup regression tests for the Specify CLI.
+
+Tests cover:
+- Offline commands never import the HTTP stack or build an SSL context
+- Import time of specify_cli relative to its unavoidable dependencies
+"""
+
+import hashlib
+import json
+import statistics
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+
+# Modules that must only be loaded by commands that need them
+LAZY_MODULES = [
+    "httpx",
+    "httpcore",
+    "truststore",
+    "ssl",
+    "readchar",
+    "rich.live",
+    "rich.progress",
+    "rich.table",
+    "concurrent.futures",
+]
+HTTP_MODULES = {"httpx", "httpcore", "truststore", "ssl"}
+
+
+# ===== Helpers =====
+
+def loaded_after(code: str, cwd: Path | None = None) -> list[str]:
+    """Run code in a fresh interpreter and return which LAZY_MODULES it loaded."""
+    script = (
+        "import sys, json\n"
+        f"{code}\n"
+        f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_cli(*args: str) -> str:
+    """Source snippet invoking the CLI in-process without exiting the interpreter."""
+    return (
+        "from typer.testing import CliRunner\n"
+        "from specify_cli import app\n"
+        f"CliRunner().invoke(app, {list(args)!r})\n"
+    )
+
+
+def median_import_seconds(statement: str, runs: int = 5) -> float:
+    """Median wall time of an import statement across fresh interpreters."""
+    script = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        samples.append(float(result.stdout.strip()))
+    return statistics.median(samples)
+
+
+# ===== Lazy Import Tests =====
+
+class TestLazyImports:
+    """Test that heavy modules stay unloaded on offline paths."""
+
+    def test_import(self):
+        """Test that importing the CLI module loads none of the lazy modules."""
+        assert loaded_after("import specify_cli.cli") == []
+
+    def test_help(self):
+        """Test that --help does not touch the HTTP stack."""
+        # typer renders help with rich tables, so only the HTTP stack is checked
+        assert HTTP_MODULES.isdisjoint(loaded_after(run_cli("--help")))
+
+    def test_extension_list(self, temp_dir):
+        """Test that an offline subcommand does not touch the HTTP stack."""
+        (temp_dir / ".specify").mkdir()
+        assert loaded_after(run_cli("extension", "list"), cwd=temp_dir) == []
+
+    def test_offline_init(self, temp_dir):
+        """Test that init --offline never imports the HTTP stack or builds an SSL context."""
+        bundle_dir = temp_dir / "bundle"
+        bundle_dir.mkdir()
+        name = "spec-kit-template-claude-sh-v1.0.0.zip"
+        with zipfile.ZipFile(bundle_dir / name, "w") as zf:
+            zf.writestr("spec-kit/.specify/memory/constitution.md", "# Constitution\n")
+        payload = (bundle_dir / name).read_bytes()
+        (bundle_dir / "manifest.json").write_text(json.dumps({
+            "release": "v1.0.0",
+            "assets": {name: {"sha256": hashlib.sha256(payload).hexdigest(), "size": len(payload)}},
+        }))
+
+        loaded = loaded_after(
+            run_cli(
+                "init", "demo", "--ai", "claude", "--script", "sh", "--offline",
+                "--bundle-dir", str(bundle_dir), "--no-git", "--ignore-agent-tools",
+            ),
+            cwd=temp_dir,
+        )
+
+        assert (temp_dir / "demo" / ".specify" / "memory" / "constitution.md").exists()
+        assert HTTP_MODULES.isdisjoint(loaded), loaded
+
+    def test_hooks_check_fast_path(self, temp_dir):
+        """Test that hooks check never loads typer, rich, the CLI module or the HTTP stack."""
+        (temp_dir / ".specify").mkdir()
+        code = (
+            "sys.argv = ['specify', 'hooks', 'check', 'after_tasks', '--json']\n"
+            "from specify_cli import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit as e:\n"
+            "    assert e.code == 0\n"
+            "heavy = {'typer', 'rich', 'click', 'specify_cli.cli'}\n"
+            "assert heavy.isdisjoint(sys.modules), sorted(heavy & set(sys.modules))\n"
+        )
+        assert loaded_after(code, cwd=temp_dir) == []
+
+    def test_module_client_attribute(self):
+        """Test that the legacy module-level client is still available on demand."""
+        loaded = loaded_after(
+            "import specify_cli\nassert specify_cli.client is specify_cli.network.get_client()"
+        )
+        assert "httpx" in loaded
+
+
+# ===== Import Time Benchmark =====
+
+class TestImportTime:
+    """Track cold import time against the CLI's unavoidable dependencies."""
+
+    def test_import_time(self):
+        """Test that the CLI module adds little on top of typer, rich and platformdirs."""
+        floor = median_import_seconds(
+            "import typer, rich.console, rich.panel, platformdirs"
+        )
+        total = median_import_seconds("import specify_cli.cli")
+
+        # Headroom for the module body and its stdlib imports; eager loading of
+        # the HTTP stack alone roughly doubles the floor
+        assert total < floor * 1.5 + 0.1, (
+            f"import specify_cli.cli took {total * 1000:.0f} ms "
+            f"(dependency floor {floor * 1000:.0f} ms)"
+        )
@@ -0,0 +1,582 @@
+"""
+Unit tests for release template handling in the Specify CLI.
+
+Tests cover:
+- Template archive cache (lookup, store, LRU eviction, concurrent downloads)
+- Offline template bundles
+- Single-pass extraction and merging of template archives
+- Conditional revalidation of release metadata
+- Extracting archives while they download (never into the current directory)
+- Resumable, retrying asset downloads
+"""
+
+import os
+import pytest
+import hashlib
+import io
+import threading
+import time
+from pathlib import Path
+
+import json
+import zipfile
+
+import httpx
+
+import specify_cli
+from specify_cli import (
+    HttpMetadataCache,
+    TemplateBundle,
+    _ArchiveTail,
+    _StreamingZipExtractor,
+    TemplateCache,
+    _asset_sha256,
+    _download_release_asset,
+    _fetch_latest_release,
+    _materialize_template_asset,
+    download_and_extract_template,
+    _prepare_streaming_extraction,
+    _extract_template_archives,
+)
+
+
+# ===== Helpers =====
+
+def make_archive(directory: Path, name: str, payload: bytes) -> tuple[Path, str]:
+    """Write a fake archive and return its path and SHA-256."""
+    path = directory / name
+    path.write_bytes(payload)
+    return path, hashlib.sha256(payload).hexdigest()
+
+
+# ===== TemplateCache Tests =====
+
+class TestTemplateCache:
+    """Test the content-addressed template archive cache."""
+
+    def test_asset_sha256(self):
+        """Test parsing the digest GitHub publishes for release assets."""
+        assert _asset_sha256({"digest": "sha256:ABC123"}) == "abc123"
+        assert _asset_sha256({"digest": "md5:abc"}) is None
+        assert _asset_sha256({}) is None
+
+    def test_miss_on_empty_cache(self, temp_dir):
+        """Test lookup in an empty cache."""
+        cache = TemplateCache(temp_dir / "cache")
+        assert cache.lookup("v1.0.0", "spec-kit-template-claude-sh-v1.0.0.zip") is None
+
+    def test_store_and_lookup(self, temp_dir):
+        """Test that a stored archive is served for the same release asset."""
+        cache = TemplateCache(temp_dir / "cache")
+        archive, digest = make_archive(temp_dir, "t.zip", b"template-bytes")
+
+        cached = cache.store("v1.0.0", "t.zip", archive, digest)
+
+        assert cached == cache.blob_path(digest)
+        assert cached.read_bytes() == b"template-bytes"
+        assert not archive.exists()  # moved, not copied
+        assert cache.lookup("v1.0.0", "t.zip") == cached
+        assert cache.lookup("v1.0.0", "t.zip", sha256=digest, size=14) == cached
+
+    def test_lookup_rejects_mismatch(self, temp_dir):
+        """Test that a re-published asset or size mismatch is a miss."""
+        cache = TemplateCache(temp_dir / "cache")
+        archive, digest = make_archive(temp_dir, "t.zip", b"template-bytes")
+        cache.store("v1.0.0", "t.zip", archive, digest)
+
+        assert cache.lookup("v1.0.0", "t.zip", sha256="0" * 64) is None
+        assert cache.lookup("v1.0.0", "t.zip", size=1) is None
+        assert cache.lookup("v2.0.0", "t.zip") is None
+
+    def test_content_addressed_dedup(self, temp_dir):
+        """Test that identical archives under different tags share one blob."""
+        cache = TemplateCache(temp_dir / "cache")
+        first, digest = make_archive(temp_dir, "a.zip", b"same")
+        second, _ = make_archive(temp_dir, "b.zip", b"same")
+
+        cache.store("v1.0.0", "a.zip", first, digest)
+        cache.store("v1.0.1", "b.zip", second, digest)
+
+        assert len(list(cache.blobs_dir.glob("*.zip"))) == 1
+        assert cache.lookup("v1.0.1", "b.zip") == cache.blob_path(digest)
+
+    def test_lru_eviction(self, temp_dir):
+        """Test that least recently used blobs are evicted past max_bytes."""
+        cache = TemplateCache(temp_dir / "cache", max_bytes=20)
+        old, old_digest = make_archive(temp_dir, "old.zip", b"x" * 10)
+        cache.store("v1", "old.zip", old, old_digest)
+        os.utime(cache.blob_path(old_digest), (1, 1))
+
+        new, new_digest = make_archive(temp_dir, "new.zip", b"y" * 15)
+        cache.store("v2", "new.zip", new, new_digest)
+
+        assert not cache.blob_path(old_digest).exists()
+        assert cache.blob_path(new_digest).exists()
+        assert cache.lookup("v1", "old.zip") is None
+        assert cache.lookup("v2", "new.zip") is not None
+
+    def test_concurrent_download_waits_for_lock(self, temp_dir):
+        """Test that a run waits for another run's download and serves its archive."""
+        from specify_cli.extensions import _file_lock
+
+        cache = TemplateCache(temp_dir / "cache")
+        payload = b"template-bytes"
+        digest = hashlib.sha256(payload).hexdigest()
+        asset = {
+            "name": "t.zip",
+            "size": len(payload),
+            "browser_download_url": "https://example.com/t.zip",
+            "digest": f"sha256:{digest}",
+        }
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=payload)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        result = {}
+        cache.partial_dir.mkdir(parents=True)
+        with _file_lock(cache.partial_dir / "t.zip.lock"):
+            worker = threading.Thread(
+                target=lambda: result.update(
+                    path=_materialize_template_asset(client, "v1", asset, temp_dir, cache=cache)[0]
+                )
+            )
+            worker.start()
+            time.sleep(0.2)
+            assert worker.is_alive()  # blocked while the other run holds the lock
+
+            # The other run finishes and stores the archive
+            archive, _ = make_archive(temp_dir, "other.zip", payload)
+            cache.store("v1", "t.zip", archive, digest)
+        worker.join(timeout=5)
+
+        assert result["path"] == cache.blob_path(digest)
+        assert requests == []
+        assert not (cache.partial_dir / "t.zip.part").exists()
+
+
+# ===== TemplateBundle Tests =====
+
+class TestTemplateBundle:
+    """Test resolving templates from a pre-seeded offline bundle."""
+
+    def write_bundle(self, root: Path, assets: dict) -> TemplateBundle:
+        bundle = TemplateBundle(root)
+        manifest_assets = {}
+        for name, payload in assets.items():
+            _, digest = make_archive(root, name, payload)
+            manifest_assets[name] = {"sha256": digest, "size": len(payload)}
+        bundle.save_manifest({"release": "v1.2.3", "assets": manifest_assets})
+        return bundle
+
+    def test_missing_bundle(self, temp_dir):
+        """Test that resolving from a missing bundle fails with guidance."""
+        with pytest.raises(RuntimeError, match="templates prefetch"):
+            TemplateBundle(temp_dir / "nope").resolve("claude", "sh")
+
+    def test_resolve(self, temp_dir):
+        """Test resolving the matching agent/script archive."""
+        bundle = self.write_bundle(temp_dir, {
+            "spec-kit-template-claude-sh-v1.2.3.zip": b"claude",
+            "spec-kit-template-qwen-sh-v1.2.3.zip": b"qwen",
+        })
+
+        zip_path, meta = bundle.resolve("claude", "sh")
+
+        assert zip_path == temp_dir / "spec-kit-template-claude-sh-v1.2.3.zip"
+        assert meta["release"] == "v1.2.3"
+        assert meta["cached"] is True  # bundle owns the archive
+        assert meta["offline"] is True
+
+    def test_missing_asset(self, temp_dir):
+        """Test resolving an agent that is not in the bundle."""
+        bundle = self.write_bundle(temp_dir, {
+            "spec-kit-template-qwen-sh-v1.2.3.zip": b"qwen",
+        })
+
+        with pytest.raises(RuntimeError, match="no asset for q/sh"):
+            bundle.resolve("q", "sh")
+
+    def test_size_mismatch(self, temp_dir):
+        """Test that a truncated archive is rejected."""
+        bundle = self.write_bundle(temp_dir, {
+            "spec-kit-template-claude-sh-v1.2.3.zip": b"claude",
+        })
+        (temp_dir / "spec-kit-template-claude-sh-v1.2.3.zip").write_bytes(b"cl")
+
+        with pytest.raises(RuntimeError, match="manifest expects"):
+            bundle.resolve("claude", "sh")
+
+    def test_checksum_mismatch(self, temp_dir):
+        """Test that a corrupted archive of the right size is rejected."""
+        bundle = self.write_bundle(temp_dir, {
+            "spec-kit-template-claude-sh-v1.2.3.zip": b"claude",
+        })
+        (temp_dir / "spec-kit-template-claude-sh-v1.2.3.zip").write_bytes(b"CLAUDE")
+
+        with pytest.raises(RuntimeError, match="does not match the manifest"):
+            bundle.resolve("claude", "sh")
+
+    def test_manifest_round_trip(self, temp_dir):
+        """Test that the manifest is written as plain JSON."""
+        bundle = self.write_bundle(temp_dir, {"a.zip": b"a"})
+
+        data = json.loads(bundle.manifest_path.read_text())
+        assert data["release"] == "v1.2.3"
+        assert bundle.load_manifest() == data
+
+
+# ===== Archive Merge Tests =====
+
+def make_template_zip(path: Path, files: dict) -> Path:
+    """Write a template zip with all members under a single top-level directory."""
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(f"spec-kit/{name}", content)
+    return path
+
+
+class TestMergeTemplateArchives:
+    """Test single-pass extraction of several agent templates."""
+
+    def test_merges_agents_and_shared_files(self, temp_dir):
+        """Test that agent folders are combined and shared files written once."""
+        claude = make_template_zip(temp_dir / "claude.zip", {
+            ".claude/commands/speckit.plan.md": "claude plan",
+            ".specify/scripts/bash/common.sh": "shared",
+        })
+        gemini = make_template_zip(temp_dir / "gemini.zip", {
+            ".gemini/commands/speckit.plan.toml": "gemini plan",
+            ".specify/scripts/bash/common.sh": "shared",
+        })
+        project = temp_dir / "project"
+
+        stats = _extract_template_archives(project, [claude, gemini], verbose=False)
+
+        assert stats == {"entries": 4, "written": 3, "flattened": True}
+        assert (project / ".claude/commands/speckit.plan.md").read_text() == "claude plan"
+        assert (project / ".gemini/commands/speckit.plan.toml").read_text() == "gemini plan"
+        assert (project / ".specify/scripts/bash/common.sh").read_text() == "shared"
+        assert not (project / "spec-kit").exists()
+
+    def test_merges_vscode_settings(self, temp_dir):
+        """Test that settings.json from every archive is merged with existing settings."""
+        project = temp_dir / "project"
+        (project / ".vscode").mkdir(parents=True)
+        (project / ".vscode/settings.json").write_text(json.dumps({"editor": {"a": 1}}))
+        first = make_template_zip(temp_dir / "a.zip", {
+            ".vscode/settings.json": json.dumps({"editor": {"b": 2}}),
+        })
+        second = make_template_zip(temp_dir / "b.zip", {
+            ".vscode/settings.json": json.dumps({"chat": True}),
+        })
+
+        _extract_template_archives(project, [first, second], verbose=False)
+
+        settings = json.loads((project / ".vscode/settings.json").read_text())
+        assert settings == {"editor": {"a": 1, "b": 2}, "chat": True}
+
+    def test_extracts_into_existing_directory(self, temp_dir):
+        """Test --here style extraction keeps unrelated files and keeps unwrapped layouts."""
+        project = temp_dir / "project"
+        project.mkdir()
+        (project / "app.py").write_text("print('hi')")
+        archive = temp_dir / "flat.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("README.md", "readme")
+            zf.writestr(".specify/memory/constitution.md", "constitution")
+
+        stats = _extract_template_archives(project, [archive], verbose=False)
+
+        assert stats["flattened"] is False
+        assert (project / "app.py").read_text() == "print('hi')"
+        assert (project / "README.md").read_text() == "readme"
+        assert (project / ".specify/memory/constitution.md").exists()
+
+    def test_rejects_path_traversal(self, temp_dir):
+        """Test that archive members escaping the project are refused."""
+        archive = temp_dir / "evil.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("../escape.txt", "nope")
+
+        with pytest.raises(RuntimeError, match="Unsafe path"):
+            _extract_template_archives(temp_dir / "project", [archive], verbose=False)
+        assert not (temp_dir / "escape.txt").exists()
+
+
+# ===== HttpMetadataCache Tests =====
+
+class TestHttpMetadataCache:
+    """Test ETag/Last-Modified revalidation of the releases/latest call."""
+
+    def make_client(self, requests: list) -> httpx.Client:
+        release = {"tag_name": "v1.0.0", "assets": []}
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json=release, headers={"ETag": '"v1"'})
+
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def test_not_modified_served_from_cache(self, temp_dir, monkeypatch):
+        """Test that a 304 response returns the cached release body."""
+        monkeypatch.setenv("SPECIFY_HTTP_CACHE_DIR", str(temp_dir))
+        requests = []
+        client = self.make_client(requests)
+
+        first = _fetch_latest_release(client)
+        second = _fetch_latest_release(client)
+
+        assert first == second == {"tag_name": "v1.0.0", "assets": []}
+        assert "If-None-Match" not in requests[0].headers
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    def test_use_cache_false_sends_no_validators(self, temp_dir, monkeypatch):
+        """Test that bypassing the cache issues an unconditional request."""
+        monkeypatch.setenv("SPECIFY_HTTP_CACHE_DIR", str(temp_dir))
+        requests = []
+        client = self.make_client(requests)
+
+        _fetch_latest_release(client)
+        _fetch_latest_release(client, use_cache=False)
+
+        assert "If-None-Match" not in requests[1].headers
+
+    def test_release_lookup_is_retried(self, temp_dir, monkeypatch):
+        """Test that a transient 502 from the releases API is retried."""
+        monkeypatch.setenv("SPECIFY_HTTP_CACHE_DIR", str(temp_dir))
+        monkeypatch.setattr(specify_cli.network.time, "sleep", lambda delay: None)
+        responses = [
+            httpx.Response(502),
+            httpx.Response(200, json={"tag_name": "v1.0.0", "assets": []}),
+        ]
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+        assert _fetch_latest_release(client) == {"tag_name": "v1.0.0", "assets": []}
+        assert responses == []
+
+    def test_version_makes_one_attempt(self, temp_dir, monkeypatch):
+        """Test that `specify version` does not retry the release lookup."""
+        from typer.testing import CliRunner
+
+        monkeypatch.setenv("SPECIFY_HTTP_CACHE_DIR", str(temp_dir))
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(502)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(specify_cli.network, "get_client", lambda verify=True: client)
+
+        result = CliRunner().invoke(specify_cli.app, ["version"])
+
+        assert result.exit_code == 0
+        assert len(requests) == 1
+
+    def test_put_requires_validators(self, temp_dir):
+        """Test that responses without ETag or Last-Modified are not cached."""
+        cache = HttpMetadataCache(temp_dir)
+        url = "https://example.com/api"
+
+        cache.put(url, httpx.Headers({}), {"a": 1})
+        assert cache.get(url) is None
+
+        cache.put(url, httpx.Headers({"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}), {"a": 1})
+        entry = cache.get(url)
+        assert entry["body"] == {"a": 1}
+        assert cache.validators(entry) == {"If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+
+# ===== Streaming Extraction Tests =====
+
+class TestStreamingExtraction:
+    """Test extracting a template archive from its download stream."""
+
+    def build_archive(self) -> tuple[bytes, dict]:
+        files = {
+            ".specify/scripts/bash/common.sh": b"#!/bin/bash\n" * 500,
+            ".claude/commands/speckit.plan.md": b"",
+            "README.md": os.urandom(4096),
+        }
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("spec-kit/", "")
+            for name, content in files.items():
+                compress_type = zipfile.ZIP_STORED if name == "README.md" else zipfile.ZIP_DEFLATED
+                zf.writestr(f"spec-kit/{name}", content, compress_type=compress_type)
+        return buffer.getvalue(), files
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000, 1 << 20])
+    def test_extracts_from_chunks(self, temp_dir, chunk_size):
+        """Test that members are written correctly regardless of chunk boundaries."""
+        archive, files = self.build_archive()
+        with zipfile.ZipFile(_ArchiveTail(archive[-2048:], len(archive))) as zip_ref:
+            extractor = _StreamingZipExtractor(temp_dir, zip_ref)
+        extractor.start()
+        for offset in range(0, len(archive), chunk_size):
+            extractor.feed(archive[offset:offset + chunk_size])
+        stats = extractor.finish()
+
+        assert stats["written"] == 3
+        assert stats["flattened"] is True
+        for name, content in files.items():
+            assert (temp_dir / name).read_bytes() == content
+
+    def test_truncated_stream_fails(self, temp_dir):
+        """Test that a stream ending early is reported."""
+        archive, _ = self.build_archive()
+        with zipfile.ZipFile(_ArchiveTail(archive, len(archive))) as zip_ref:
+            extractor = _StreamingZipExtractor(temp_dir, zip_ref)
+        extractor.start()
+        extractor.feed(archive[:200])
+
+        with pytest.raises(RuntimeError, match="ended before"):
+            extractor.finish()
+
+    def test_falls_back_without_range_support(self, temp_dir):
+        """Test that servers ignoring Range disable streaming extraction."""
+        archive, _ = self.build_archive()
+        client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=archive)
+        ))
+
+        extractor = _prepare_streaming_extraction(
+            client, "https://example.com/t.zip", len(archive), temp_dir
+        )
+
+        assert extractor is None
+        assert list(temp_dir.iterdir()) == []
+
+    def test_not_streamed_into_current_directory(self, temp_dir, monkeypatch):
+        """Test that --stream --here verifies the archive before touching existing files."""
+        archive, files = self.build_archive()
+        zip_path = temp_dir / "t.zip"
+        project = temp_dir / "project"
+        project.mkdir()
+        requested = []
+
+        def fake_download(ai_assistant, download_dir, **kwargs):
+            requested.append(kwargs["extract_into"])
+            zip_path.write_bytes(archive)
+            return zip_path, {
+                "filename": "t.zip", "size": len(archive), "release": "v1",
+                "cached": False, "cache_hit": False,
+            }
+
+        monkeypatch.setattr(specify_cli.cli, "download_template_from_github", fake_download)
+        monkeypatch.chdir(temp_dir)
+        download_and_extract_template(
+            project, "claude", "sh", is_current_dir=True, verbose=False, stream=True
+        )
+        download_and_extract_template(
+            temp_dir / "new", "claude", "sh", verbose=False, stream=True
+        )
+
+        assert requested == [None, temp_dir / "new"]
+        assert (project / "README.md").read_bytes() == files["README.md"]
+
+
+# ===== Resumable Download Tests =====
+
+class DroppingStream(httpx.SyncByteStream):
+    """Response body that fails after yielding part of the payload."""
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+
+    def __iter__(self):
+        yield self.payload
+        raise httpx.ReadError("connection reset")
+
+
+class TestResumableDownload:
+    """Test retrying and resuming release asset downloads."""
+
+    PAYLOAD = bytes(range(256)) * 64
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        delays = []
+        monkeypatch.setattr(specify_cli.time, "sleep", delays.append)
+        return delays
+
+    def download(self, temp_dir, handler, **kwargs):
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        return _download_release_asset(
+            client, "https://example.com/asset.zip", temp_dir / "asset.zip", **kwargs
+        )
+
+    def test_resumes_after_dropped_connection(self, temp_dir):
+        """Test that a dropped connection resumes with a Range request."""
+        ranges = []
+
+        def handler(request):
+            ranges.append(request.headers.get("Range"))
+            if len(ranges) == 1:
+                return httpx.Response(200, stream=DroppingStream(self.PAYLOAD[:5000]))
+            start = int(request.headers["Range"][6:-1])
+            return httpx.Response(
+                206,
+                content=self.PAYLOAD[start:],
+                headers={"Content-Range": f"bytes {start}-{len(self.PAYLOAD) - 1}/{len(self.PAYLOAD)}"},
+            )
+
+        digest = self.download(temp_dir, handler, expected_size=len(self.PAYLOAD))
+
+        assert ranges == [None, "bytes=5000-"]
+        assert digest == hashlib.sha256(self.PAYLOAD).hexdigest()
+        assert (temp_dir / "asset.zip").read_bytes() == self.PAYLOAD
+        assert not (temp_dir / "asset.zip.part").exists()
+
+    def test_resumes_existing_part_when_range_ignored(self, temp_dir):
+        """Test that a leftover .part is kept even if the server ignores Range."""
+        (temp_dir / "asset.zip.part").write_bytes(self.PAYLOAD[:1000])
+        chunks = []
+
+        digest = self.download(
+            temp_dir,
+            lambda request: httpx.Response(200, content=self.PAYLOAD),
+            expected_size=len(self.PAYLOAD),
+            on_chunk=chunks.append,
+        )
+
+        assert digest == hashlib.sha256(self.PAYLOAD).hexdigest()
+        assert b"".join(chunks) == self.PAYLOAD
+
+    def test_honors_retry_after(self, temp_dir, no_sleep):
+        """Test that 503 responses are retried after the Retry-After delay."""
+        responses = [
+            httpx.Response(503, headers={"Retry-After": "7"}),
+            httpx.Response(200, content=self.PAYLOAD),
+        ]
+
+        self.download(temp_dir, lambda request: responses.pop(0))
+
+        assert no_sleep == [7]
+
+    def test_non_retryable_status(self, temp_dir):
+        """Test that a 404 fails without retrying."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        with pytest.raises(RuntimeError, match="404"):
+            self.download(temp_dir, handler)
+        assert len(requests) == 1
+
+    def test_size_mismatch(self, temp_dir):
+        """Test that a short download is rejected and not kept for resume."""
+        with pytest.raises(RuntimeError, match="expected"):
+            self.download(
+                temp_dir,
+                lambda request: httpx.Response(200, content=self.PAYLOAD[:100]),
+                expected_size=len(self.PAYLOAD),
+            )
+        assert not (temp_dir / "asset.zip.part").exists()
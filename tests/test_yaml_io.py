@@ -0,0 +1,77 @@
+"""
+Unit tests for the shared YAML layer.
+
+Tests cover:
+- Backend selection and the SPECIFY_YAML_PURE override
+- Parsing and emitting round-trips with mapping order preserved
+- Safe loading of untrusted documents
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+
+from specify_cli import yaml_io
+from specify_cli.extensions import CommandRegistrar
+
+
+# ===== Backend Tests =====
+
+class TestBackend:
+    """Test which YAML backend is selected."""
+
+    def test_prefers_libyaml(self):
+        """Test the C loader and dumper are used when PyYAML has them."""
+        if not yaml_io.HAS_LIBYAML:
+            pytest.skip("PyYAML built without libyaml")
+        if os.environ.get("SPECIFY_YAML_PURE"):
+            pytest.skip("SPECIFY_YAML_PURE is set")
+        assert yaml_io.Loader is yaml.CSafeLoader
+        assert yaml_io.Dumper is yaml.CSafeDumper
+        assert yaml_io.backend() == "libyaml"
+
+    def test_pure_override(self):
+        """Test SPECIFY_YAML_PURE forces the pure-Python backend."""
+        env = dict(os.environ, SPECIFY_YAML_PURE="1")
+        result = subprocess.run(
+            [sys.executable, "-c", "from specify_cli import yaml_io; print(yaml_io.backend())"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "python"
+
+
+# ===== Load / Dump Tests =====
+
+class TestLoadDump:
+    """Test parsing and emitting through yaml_io."""
+
+    def test_round_trip_keeps_order(self, temp_dir):
+        """Test dump keeps insertion order in block style and load_file reads it back."""
+        data = {"zeta": 1, "alpha": {"list": ["a", "b"], "text": "héllo"}, "mid": None}
+        path = temp_dir / "data.yml"
+        path.write_text(yaml_io.dump(data), encoding="utf-8")
+
+        text = path.read_text(encoding="utf-8")
+        assert text.index("zeta") < text.index("alpha") < text.index("mid")
+        assert "{" not in text
+        assert yaml_io.load_file(path) == data
+
+    def test_rejects_python_tags(self):
+        """Test documents cannot construct arbitrary Python objects."""
+        with pytest.raises(yaml_io.YAMLError):
+            yaml_io.load("!!python/object/apply:os.system ['true']")
+
+    def test_frontmatter_round_trip(self):
+        """Test command frontmatter renders and parses back unchanged."""
+        fm = {"description": "Run: things", "scripts": {"sh": "scripts/run.sh"}}
+        content = CommandRegistrar.render_frontmatter(fm) + "\n# Body\n"
+
+        parsed, body = CommandRegistrar.parse_frontmatter(content)
+        assert parsed == fm
+        assert body == "# Body"